@@ -0,0 +1,58 @@
+# Mede a precisão e o tempo da gravidade de Barnes–Hut em função do ângulo de abertura θ, em
+# relação à soma direta, em um cinturão de asteroides com gravidade mútua.
+#
+#   python scripts/medir_barnes_hut.py --corpos 20000 --thetas 0.2 0.3 0.5 0.7 1.0
+#
+# Requer o pacote instalado (pip install -e .) ou PYTHONPATH apontando para a raiz do repositório.
+
+import argparse
+import time
+from typing import List, Optional, Tuple
+import numpy as np
+from simulacao.fisica.barnes_hut import aceleracoes_barnes_hut
+from simulacao.fisica.gravidade import aceleracoes_diretas
+
+
+def cinturao(num_corpos: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorteia um cinturão entre 2 e 3 UA (espessura de 1e10 m) com massas de 1e14 a 1e18 kg.
+
+    :param num_corpos: Número de corpos.
+    :param rng: Gerador aleatório.
+    :return: Tupla (posições, shape (N, 3); massas, shape (N,)).
+    """
+    raios = rng.uniform(3.0e11, 4.5e11, num_corpos)
+    angulos = rng.uniform(0.0, 2 * np.pi, num_corpos)
+    alturas = rng.normal(0.0, 1e10, num_corpos)
+    posicoes = np.stack((raios * np.cos(angulos), raios * np.sin(angulos), alturas), axis=-1)
+    return posicoes, rng.uniform(1e14, 1e18, num_corpos)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Precisão e tempo de Barnes–Hut em função de θ.")
+    parser.add_argument("--corpos", type=int, default=20000, help="Número de corpos do cinturão.")
+    parser.add_argument("--thetas", type=float, nargs="+", default=[0.2, 0.3, 0.5, 0.7, 1.0])
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    posicoes, massas = cinturao(args.corpos, np.random.default_rng(args.semente))
+    inicio = time.perf_counter()
+    referencia = aceleracoes_diretas(posicoes, posicoes, massas)
+    print(f"Soma direta, {args.corpos} corpos: {time.perf_counter() - inicio:.2f} s")
+    normas = np.linalg.norm(referencia, axis=1)
+
+    # Erro relativo da aceleração de cada corpo: |a_bh - a_direta| / |a_direta|
+    print(f"{'θ':>5} {'mediana':>9} {'p99':>9} {'máximo':>9} {'tempo (s)':>10}")
+    for theta in args.thetas:
+        inicio = time.perf_counter()
+        aceleracoes = aceleracoes_barnes_hut(posicoes, posicoes, massas, theta=theta)
+        tempo = time.perf_counter() - inicio
+        erros = np.linalg.norm(aceleracoes - referencia, axis=1) / normas
+        print(
+            f"{theta:>5.2f} {np.median(erros):>9.1e} {np.percentile(erros, 99):>9.1e} "
+            f"{erros.max():>9.1e} {tempo:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
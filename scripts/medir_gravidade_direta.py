@@ -0,0 +1,86 @@
+# Mede o ganho da soma direta vetorizada (gravidade.aceleracoes_diretas) sobre o laço par a par
+# em Python que o MotorFisico usava antes, com corpos aleatórios.
+#
+#   python scripts/medir_gravidade_direta.py --tamanhos 10 100 1000
+#
+# Requer o pacote instalado (pip install -e .) ou PYTHONPATH apontando para a raiz do repositório.
+
+import argparse
+import time
+from typing import Callable, List, Optional
+import numpy as np
+from simulacao.fisica.gravidade import G, aceleracoes_diretas
+
+
+def forcas_laco(posicoes: np.ndarray, massas: np.ndarray) -> np.ndarray:
+    """
+    Forças gravitacionais pelo laço duplo original (um par de corpos por iteração, com ação e
+    reação), com a mesma aritmética de MotorFisico.calcular_forcas_gravitacionais antes da
+    vetorização, mas lendo arrays em vez de objetos.
+
+    :param posicoes: Posições dos corpos, shape (N, 3).
+    :param massas: Massas dos corpos, shape (N,).
+    :return: Forças em N, shape (N, 3).
+    """
+    n = len(posicoes)
+    forcas = [np.zeros(3) for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            direcao = posicoes[j] - posicoes[i]
+            distancia = np.linalg.norm(direcao)
+            if distancia == 0:
+                continue
+            direcao_unitaria = direcao / distancia
+            forca_magnitude = G * massas[i] * massas[j] / distancia**2
+            forca_vetor = forca_magnitude * direcao_unitaria
+            forcas[i] += forca_vetor
+            forcas[j] -= forca_vetor
+    return np.array(forcas)
+
+
+def forcas_vetorizadas(posicoes: np.ndarray, massas: np.ndarray) -> np.ndarray:
+    """
+    Mesmas forças de forcas_laco, pela soma direta vetorizada.
+    """
+    return aceleracoes_diretas(posicoes, posicoes, massas) * massas[:, np.newaxis]
+
+
+def medir(funcao: Callable[[], np.ndarray], orcamento: float) -> float:
+    """
+    Menor tempo (s) de `funcao`, repetida até somar `orcamento` segundos (ao menos uma vez).
+    """
+    tempos: List[float] = []
+    while not tempos or sum(tempos) < orcamento:
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Compara a soma direta vetorizada com o laço par a par original.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10, 100, 1000], help="Valores de N.")
+    parser.add_argument("--orcamento", type=float, default=1.0, help="Tempo de medida por método e N, em segundos.")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.semente)
+    print(f"{'N':>6} {'laço (ms)':>11} {'vetorizado (ms)':>16} {'speedup':>8} {'erro relativo':>14}")
+    for n in args.tamanhos:
+        posicoes = rng.normal(scale=1e11, size=(n, 3))
+        massas = rng.uniform(1e20, 1e25, size=n)
+
+        referencia = forcas_laco(posicoes, massas)
+        resultado = forcas_vetorizadas(posicoes, massas)
+        erro = np.max(np.linalg.norm(resultado - referencia, axis=1) / np.linalg.norm(referencia, axis=1))
+
+        tempo_laco = medir(lambda: forcas_laco(posicoes, massas), args.orcamento)
+        tempo_vetorizado = medir(lambda: forcas_vetorizadas(posicoes, massas), args.orcamento)
+        print(
+            f"{n:>6} {tempo_laco * 1e3:>11.3f} {tempo_vetorizado * 1e3:>16.3f} "
+            f"{tempo_laco / tempo_vetorizado:>8.1f} {erro:>14.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Mede a escalabilidade dos lançamentos de Monte Carlo (simulacao.monte_carlo) com o número de
+# processos: o mesmo lote de lançamentos perturbados é propagado com cada número de processos,
+# e o tempo inclui a criação do pool.
+#
+#   python scripts/medir_monte_carlo.py solar --lancamentos 2000 --processos 1 2 4 8
+#
+# Requer o pacote instalado (pip install -e .) ou PYTHONPATH apontando para a raiz do repositório.
+
+import argparse
+import os
+import time
+from typing import List, Optional
+import numpy as np
+from simulacao.headless import resolver_caminho_cena
+from simulacao.monte_carlo import DIA, amostrar_lancamentos, corrigir_queima, executar_monte_carlo, preparar_missao
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Mede a escalabilidade dos lançamentos de Monte Carlo com o número de processos.")
+    parser.add_argument("cena", nargs="?", default="solar", help="Arquivo JSON da cena ou nome de uma cena embutida.")
+    parser.add_argument("--lancamentos", type=int, default=2000, help="Número de lançamentos do lote.")
+    parser.add_argument("--processos", type=int, nargs="+", default=[1, 2, 4, 8], help="Números de processos.")
+    parser.add_argument("--delta-t", type=float, default=3600.0, help="Passo de integração, em segundos.")
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"CPUs disponíveis: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}")
+    inicio = time.perf_counter()
+    missao = preparar_missao(resolver_caminho_cena(args.cena))
+    erro_nominal = corrigir_queima(missao, delta_t=args.delta_t)
+    parametros = amostrar_lancamentos(missao, args.lancamentos, None, args.semente)
+    print(
+        f"Missão nominal: partida em {missao.tempo_partida / DIA:.1f} d, voo de {missao.tempo_voo / DIA:.1f} d, "
+        f"erro de chegada {erro_nominal / 1e3:.0f} km (preparo em {time.perf_counter() - inicio:.2f} s)"
+    )
+
+    # Speedup e eficiência em relação à primeira medida da lista
+    print(f"{'proc.':>5} {'tempo (s)':>10} {'lançamentos/s':>14} {'speedup':>8} {'eficiência':>10}")
+    referencia = None
+    for processos in args.processos:
+        inicio = time.perf_counter()
+        resultados = executar_monte_carlo(missao, parametros, delta_t=args.delta_t, processos=processos)
+        tempo = time.perf_counter() - inicio
+        if referencia is None:
+            referencia, tempo_referencia, processos_referencia = resultados, tempo, processos
+        else:
+            # A divisão em processos não pode mudar o resultado de nenhum lançamento
+            assert all(np.array_equal(resultados[metrica], referencia[metrica]) for metrica in referencia)
+        speedup = tempo_referencia / tempo
+        print(
+            f"{processos:>5} {tempo:>10.2f} {args.lancamentos / tempo:>14.0f} "
+            f"{speedup:>8.2f} {speedup * processos_referencia / processos:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Mede quantos nodos a busca A* do Navegador expande por orçamento de tempo de planejamento.
+#
+# Dois casos em espaço livre (a busca termina antes do orçamento) e um caso limitado pelo
+# orçamento: um corpo massivo no meio do caminho, com células menores, obriga a busca a
+# contornar a esfera de exclusão. Cada medida usa um navegador novo (sem cache de buscas).
+# Cada expansão avalia os 26 vizinhos da célula; a coluna de vizinhos por 100 ms permite
+# comparar com grades de outra vizinhança.
+#
+#   python scripts/medir_navegador.py --orcamentos 0.01 0.05 0.1
+#
+# Requer o pacote instalado (pip install -e .) ou PYTHONPATH apontando para a raiz do repositório.
+
+import argparse
+import time
+from typing import List, Optional, Tuple
+import numpy as np
+from simulacao.controle.navegador import Navegador
+from simulacao.objetos.corpo_celeste import CorpoCeleste
+from simulacao.objetos.foguete import Foguete
+
+
+def criar_navegador(destino: np.ndarray, massa_obstaculo: float = 0.0, resolucao: float = 1e9) -> Navegador:
+    """
+    Monta um navegador para um foguete parado na origem e um destino parado.
+
+    :param destino: Posição do destino (m).
+    :param massa_obstaculo: Massa (kg) de um corpo parado a 5e9 m da origem, na direção do
+        destino. Zero dispensa o obstáculo.
+    :param resolucao: Tamanho das células da grade (m).
+    :return: Navegador que planeja na própria chamada.
+    """
+    foguete = Foguete("Foguete", 1e3, 1.0, (0, 255, 0), posicao=np.zeros(3), velocidade=np.zeros(3))
+    alvo = CorpoCeleste("Destino", 0.0, 1.0, (255, 0, 0), posicao=destino, velocidade=np.zeros(3))
+    corpos = [foguete, alvo]
+    if massa_obstaculo > 0.0:
+        direcao = destino / np.linalg.norm(destino)
+        corpos.append(CorpoCeleste("Obstáculo", massa_obstaculo, 1.0, (255, 255, 0), posicao=5e9 * direcao, velocidade=np.zeros(3)))
+    navegador = Navegador(foguete, alvo, corpos, planejar_em_thread=False)
+    navegador.resolucao = resolucao
+    return navegador
+
+
+def medir(navegador: Navegador, orcamento: float) -> Tuple[int, float, int]:
+    """
+    Planeja uma vez com o orçamento informado.
+
+    :return: Tupla (nodos expandidos, tempo gasto em s, nodos no caminho).
+    """
+    navegador.tempo_maximo_planejamento = orcamento
+    inicio = time.perf_counter()
+    navegador.calcular_caminho_incremental()
+    return navegador.nodos_expandidos, time.perf_counter() - inicio, len(navegador.caminho)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Nodos expandidos pelo A* do Navegador por orçamento de tempo.")
+    parser.add_argument("--orcamentos", type=float, nargs="+", default=[0.01, 0.05, 0.1], help="Orçamentos de planejamento, em segundos.")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Medidas por caso (vale a mediana).")
+    args = parser.parse_args(argv)
+
+    diagonal = np.array([5e10, 5e10, 5e10])
+    casos = [
+        ("diagonal livre", lambda: criar_navegador(diagonal)),
+        ("oblíquo livre", lambda: criar_navegador(np.array([3e10, -1e10, 7e9]))),
+        ("obstáculo", lambda: criar_navegador(diagonal, massa_obstaculo=1e28, resolucao=1.5e8)),
+    ]
+    vizinhos = len(criar_navegador(diagonal).movimentos_grade())
+    print(
+        f"{'caso':<16} {'orçamento (ms)':>14} {'expansões':>10} {'tempo (ms)':>11} "
+        f"{'expansões/100 ms':>17} {'vizinhos/100 ms':>16} {'caminho':>8}"
+    )
+    for nome, criar in casos:
+        for orcamento in args.orcamentos:
+            medidas = np.array([medir(criar(), orcamento) for _ in range(args.repeticoes)])
+            expansoes, tempo, caminho = np.median(medidas, axis=0)
+            taxa = expansoes / tempo * 0.1
+            print(
+                f"{nome:<16} {orcamento * 1e3:>14.0f} {expansoes:>10.0f} {tempo * 1e3:>11.1f} "
+                f"{taxa:>17.0f} {taxa * vizinhos:>16.0f} {caminho:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
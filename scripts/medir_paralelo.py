@@ -0,0 +1,28 @@
+# Mede a escalabilidade da gravidade por soma direta em vários processos (AvaliadorParalelo):
+# tempo, speedup e eficiência em relação à soma direta em um único processo, para cada N e
+# número de processos.
+#
+#   python scripts/medir_paralelo.py --tamanhos 2000 5000 10000 20000 --trabalhadores 1 2 4 8 16
+#
+# Requer o pacote instalado (pip install -e .) ou PYTHONPATH apontando para a raiz do repositório.
+
+import argparse
+import os
+from typing import List, Optional
+from simulacao.fisica.paralelo import medir_escalabilidade
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Mede a escalabilidade da gravidade por soma direta em paralelo.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[2000, 5000, 10000, 20000], help="Valores de N.")
+    parser.add_argument("--trabalhadores", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Números de processos.")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Avaliações por medida (vale o menor tempo).")
+    args = parser.parse_args(argv)
+
+    # Sem núcleos livres, mais processos só medem o custo de despachar as tarefas
+    print(f"CPUs disponíveis: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}")
+    medir_escalabilidade(args.tamanhos, args.trabalhadores, args.repeticoes)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,10 @@ setup(
     entry_points={
         'console_scripts': [
             'simulacao=simulacao.main:main',
+            'simulacao-headless=simulacao.headless:main',
+            'simulacao-video=simulacao.gravacao:main',
+            'simulacao-monte-carlo=simulacao.monte_carlo:main',
+            'simulacao-converter-cena=simulacao.util.gerenciador_dados:main',
         ],
     },
     python_requires='>=3.6',
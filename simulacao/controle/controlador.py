@@ -1,23 +1,54 @@
 import numpy as np
+from typing import List
 from simulacao.objetos.foguete import Foguete
 from simulacao.objetos.corpo_celeste import CorpoCeleste
+from simulacao.fisica.frota import eixos_z, quaternioes_de_euler
+from simulacao.fisica.trabalhador_fisico import InstantaneoFisico, TrabalhadorFisico
 
 class Controlador:
-    def __init__(self, foguete: Foguete):
+    """
+    Piloto automático proporcional que leva o foguete até o destino.
+
+    Roda no laço principal: lê posições, velocidades e orientação de um instantâneo publicado
+    pelo TrabalhadorFisico (nunca o estado físico em integração) e envia os comandos de
+    orientação e propulsão para o trabalhador aplicar entre passos.
+    """
+    def __init__(self, foguete: Foguete, corpos: List[CorpoCeleste]):
+        """
+        :param foguete: Foguete controlado (precisa ter destino).
+        :param corpos: Lista de corpos da simulação, na ordem dos instantâneos.
+        """
         self.foguete = foguete
         self.destino = self.foguete.destino
+        self.indice_foguete = next(i for i, corpo in enumerate(corpos) if corpo is foguete)
+        # Destino pode ser um corpo (lido do instantâneo) ou uma posição fixa
+        self.indice_destino = next((i for i, corpo in enumerate(corpos) if corpo is self.destino), None)
         self.kp_posicao = 1e-4  # Ganho proporcional para posição
         self.kp_velocidade = 1e-2  # Ganho proporcional para velocidade
 
-    def atualizar(self, delta_t: float):
+    def atualizar(self, delta_t: float, instantaneo: InstantaneoFisico, trabalhador: TrabalhadorFisico):
+        """
+        Calcula e envia os comandos do quadro.
+
+        :param delta_t: Tempo real desde o último quadro (s).
+        :param instantaneo: Último instantâneo lido com TrabalhadorFisico.ler_instantaneo.
+        :param trabalhador: Trabalhador que aplica os comandos.
+        """
+        posicao = instantaneo.posicoes[self.indice_foguete]
+        velocidade = instantaneo.velocidades[self.indice_foguete]
+        if self.indice_destino is not None:
+            posicao_destino = instantaneo.posicoes[self.indice_destino]
+        else:
+            posicao_destino = np.asarray(self.destino, dtype=float)
+
         # Calcula o erro de posição
-        erro_posicao = self.destino.posicao - self.foguete.posicao
+        erro_posicao = posicao_destino - posicao
 
         # Calcula a velocidade desejada
         velocidade_desejada = erro_posicao * self.kp_posicao
 
         # Calcula o erro de velocidade
-        erro_velocidade = velocidade_desejada - self.foguete.velocidade
+        erro_velocidade = velocidade_desejada - velocidade
 
         # Calcula a aceleração desejada
         aceleracao_desejada = erro_velocidade * self.kp_velocidade
@@ -27,34 +58,34 @@ class Controlador:
         if np.linalg.norm(aceleracao_desejada) > aceleracao_maxima:
             aceleracao_desejada = aceleracao_desejada / np.linalg.norm(aceleracao_desejada) * aceleracao_maxima
 
+        # Direção atual do foguete, a partir da orientação publicada
+        vetor_direcao_atual = eixos_z(quaternioes_de_euler(instantaneo.orientacoes[self.indice_foguete]))
+
         # Calcula a orientação desejada
         if np.linalg.norm(aceleracao_desejada) > 0:
             direcao_desejada = aceleracao_desejada / np.linalg.norm(aceleracao_desejada)
         else:
-            direcao_desejada = self.foguete.calcular_vetor_direcao()
+            direcao_desejada = vetor_direcao_atual
 
         # Ajusta a orientação do foguete
-        self.ajustar_orientacao_foguete(direcao_desejada, delta_t)
+        self.ajustar_orientacao_foguete(vetor_direcao_atual, direcao_desejada, delta_t, trabalhador)
 
         # Ativa a propulsão com intensidade proporcional à aceleração desejada
         intensidade_propulsao = np.linalg.norm(aceleracao_desejada) / aceleracao_maxima
-        self.foguete.ativar_propulsao(intensidade=intensidade_propulsao)
+        trabalhador.enviar_comando(self.foguete.ativar_propulsao, intensidade_propulsao)
 
-    def ajustar_orientacao_foguete(self, direcao_desejada: np.ndarray, delta_t: float):
+    def ajustar_orientacao_foguete(
+        self, vetor_direcao_atual: np.ndarray, direcao_desejada: np.ndarray, delta_t: float, trabalhador: TrabalhadorFisico
+    ):
         # Calcula a diferença entre a orientação atual e a desejada
-        vetor_direcao_atual = self.foguete.calcular_vetor_direcao()
         angulo_diferenca = np.arccos(np.clip(np.dot(vetor_direcao_atual, direcao_desejada), -1.0, 1.0))
 
         # Calcula o eixo de rotação
         eixo_rotacao = np.cross(vetor_direcao_atual, direcao_desejada)
-        if np.linalg.norm(eixo_rotacao) > 0:
-            eixo_rotacao_normalizado = eixo_rotacao / np.linalg.norm(eixo_rotacao)
-        else:
-            eixo_rotacao_normalizado = np.zeros(3)
 
         # Define a velocidade de rotação
         velocidade_rotacao = 1.0  # graus por segundo
-        delta_orientacao = eixo_rotacao_normalizado * velocidade_rotacao * delta_t
+        angulo = min(np.radians(velocidade_rotacao * delta_t), angulo_diferenca)
 
-        # Atualiza a orientação do foguete
-        self.foguete.atualizar_orientacao(delta_orientacao)
+        # Envia a rotação ao trabalhador (eixo nulo não gira)
+        trabalhador.enviar_comando(self.foguete.girar, eixo_rotacao, angulo)
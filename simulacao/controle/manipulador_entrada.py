@@ -5,11 +5,15 @@ from simulacao.objetos.foguete import Foguete
 from simulacao.grafico.camera import Camera
 from simulacao.objetos.corpo_celeste import CorpoCeleste
 from simulacao.controle.controlador import Controlador
+from simulacao.fisica.trabalhador_fisico import InstantaneoFisico, TrabalhadorFisico
 
 class ManipuladorEntrada:
     """
     Classe responsável por gerenciar os inputs do usuário e atualizar os controles
     do foguete e da câmera na simulação.
+
+    Os comandos do foguete não alteram o estado físico diretamente: são enviados ao
+    TrabalhadorFisico, que os aplica entre passos.
     """
     def __init__(self):
         """
@@ -19,6 +23,11 @@ class ManipuladorEntrada:
         self.simulacao_pausada: bool = False
         self.navegacao_automatica: bool = False
         self.controlador: Controlador = None
+        self.propulsao_manual: bool = False  # Estado do motor pedido pelo último quadro manual
+        # Multiplicador da escala de tempo (aumenta o número de passos físicos por quadro, não o passo)
+        self.fator_tempo: float = 1.0
+        self.fator_tempo_minimo: float = 1.0 / 64.0
+        self.fator_tempo_maximo: float = 256.0
 
     def processar_eventos(self) -> bool:
         """
@@ -50,6 +59,10 @@ class ManipuladorEntrada:
             pygame.event.post(pygame.event.Event(pygame.QUIT))
         elif tecla == pygame.K_m:
             self.simulacao_pausada = not self.simulacao_pausada
+        elif tecla == pygame.K_PERIOD:
+            self.fator_tempo = min(self.fator_tempo * 2.0, self.fator_tempo_maximo)
+        elif tecla == pygame.K_COMMA:
+            self.fator_tempo = max(self.fator_tempo / 2.0, self.fator_tempo_minimo)
         # Futuras teclas de controle podem ser adicionadas aqui
 
     def _processar_tecla_solta(self, tecla: int) -> None:
@@ -60,39 +73,52 @@ class ManipuladorEntrada:
         """
         self.teclas_pressionadas.discard(tecla)
 
-    def _alternar_navegacao_automatica(self, foguete: Foguete) -> None:
+    def _alternar_navegacao_automatica(self, foguete: Foguete, trabalhador: TrabalhadorFisico) -> None:
         """
-        Ativa ou desativa a navegação automática do foguete.
+        Ativa ou desativa a navegação automática do foguete (só ativa se o foguete tiver destino).
 
         :param foguete: O objeto foguete controlado.
+        :param trabalhador: Trabalhador da física, que recebe os comandos do foguete.
         """
+        if not self.navegacao_automatica and foguete.destino is None:
+            return
         self.navegacao_automatica = not self.navegacao_automatica
         if self.navegacao_automatica:
             # Inicializa o controlador para navegação automática
-            self.controlador = Controlador(foguete)
+            self.controlador = Controlador(foguete, trabalhador.corpos)
         else:
             self.controlador = None
-            foguete.desativar_propulsao()
+            trabalhador.enviar_comando(foguete.desativar_propulsao)
 
-    def atualizar_controles(self, foguete: Foguete, camera: Camera, delta_t: float) -> None:
+    def atualizar_controles(
+        self,
+        foguete: Foguete,
+        camera: Camera,
+        delta_t: float,
+        instantaneo: InstantaneoFisico,
+        trabalhador: TrabalhadorFisico,
+    ) -> None:
         """
         Atualiza os controles contínuos, como a orientação do foguete e o movimento da câmera.
 
         :param foguete: O objeto foguete a ser controlado.
         :param camera: A câmera da simulação.
         :param delta_t: O tempo delta entre frames.
+        :param instantaneo: Último instantâneo lido da física (estado visto pelo piloto automático).
+        :param trabalhador: Trabalhador da física, que recebe os comandos do foguete.
         """
         if self.navegacao_automatica and self.controlador:
-            self.controlador.atualizar(delta_t)
+            self.controlador.atualizar(delta_t, instantaneo, trabalhador)
         else:
-            self._atualizar_controles_foguete(foguete)
+            self._atualizar_controles_foguete(foguete, trabalhador)
         self._atualizar_controles_camera(camera)
 
-    def _atualizar_controles_foguete(self, foguete: Foguete) -> None:
+    def _atualizar_controles_foguete(self, foguete: Foguete, trabalhador: TrabalhadorFisico) -> None:
         """
         Atualiza a orientação e propulsão do foguete com base nas teclas pressionadas.
 
         :param foguete: O objeto foguete a ser controlado.
+        :param trabalhador: Trabalhador da física, que recebe os comandos do foguete.
         """
         delta_orientacao = np.array([0.0, 0.0, 0.0])
         velocidade_rotacao_foguete = 1.0  # Velocidade de rotação em graus por frame
@@ -112,15 +138,17 @@ class ManipuladorEntrada:
             delta_orientacao += np.array([0.0, 0.0, -velocidade_rotacao_foguete])  # Roll counter-clockwise
 
         if np.linalg.norm(delta_orientacao) > 0:
-            foguete.atualizar_orientacao(delta_orientacao)
-
-        # Propulsão
-        if pygame.K_SPACE in self.teclas_pressionadas:
-            foguete.ativar_propulsao(intensidade=1.0)
-        else:
-            foguete.desativar_propulsao()
+            trabalhador.enviar_comando(foguete.atualizar_orientacao, delta_orientacao)
+
+        # Propulsão (o desligamento só é enviado quando a tecla é solta, não a cada quadro)
+        acionar = pygame.K_SPACE in self.teclas_pressionadas
+        if acionar:
+            trabalhador.enviar_comando(foguete.ativar_propulsao, 1.0)
+        elif self.propulsao_manual:
+            trabalhador.enviar_comando(foguete.desativar_propulsao)
+        self.propulsao_manual = acionar
         if pygame.K_n in self.teclas_pressionadas:
-            self._alternar_navegacao_automatica(foguete)
+            self._alternar_navegacao_automatica(foguete, trabalhador)
 
     def _atualizar_controles_camera(self, camera: Camera) -> None:
         """
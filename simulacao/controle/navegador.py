@@ -1,133 +1,749 @@
+from typing import Dict, List, Optional, Set, Tuple
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import OrderedDict
 import numpy as np
 from simulacao.objetos.foguete import Foguete
 from simulacao.objetos.corpo_celeste import CorpoCeleste
-from typing import List, Tuple
-import time
+from simulacao.fisica.gravidade import G
+from simulacao.fisica.tabela_efemerides import TabelaEfemerides
+from simulacao.fisica.lambert import PlanoTransferencia, planejar_transferencia, propagar_conica
+
+RAIZ_2 = math.sqrt(2.0)
+RAIZ_3 = math.sqrt(3.0)
+DIA = 86400.0
+
+# "grade": A* em grade até a interceptação; "lambert": transferência de dois impulsos
+# escolhida em uma grade porkchop (ver simulacao.fisica.lambert)
+PLANEJAMENTOS = ("grade", "lambert")
 
 class Nodo:
-    def __init__(self, posicao: np.ndarray, g: float, h: float, f: float, pai=None):
+    def __init__(self, posicao: np.ndarray, g: float, h: float, f: float, pai=None, tempo: float = 0.0):
         self.posicao = posicao
         self.g = g  # Custo do caminho desde o início até este nodo
         self.h = h  # Heurística (estimativa do custo até o objetivo)
         self.f = f  # f = g + h
         self.pai = pai
+        self.tempo = tempo  # Instante previsto de chegada, relativo ao início do planejamento (s)
+
+class BuscaReversa:
+    """
+    Busca A* feita do objetivo para o foguete, guardada para ser retomada.
+
+    Os custos g são distâncias até o objetivo, e não desde o início, e continuam válidos quando o
+    foguete sai do caminho: um novo ponto de partida só exige reordenar a lista aberta pela
+    heurística até ele e continuar a busca de onde ela parou, como no D* Lite (início móvel,
+    objetivo fixo), ou nada, se a célula do foguete já estiver fechada. O instante em que o foguete
+    passa por uma célula é o de chegada ao objetivo menos o custo restante dividido pela
+    velocidade de cruzeiro; as esferas de exclusão são testadas nas posições desse instante.
+
+    Os instantes de passagem são arredondados para faixas de largura igual ao tempo de cruzar uma
+    célula (no máximo um intervalo da tabela), e as posições dos obstáculos em cada faixa são
+    interpoladas uma única vez. Uma célula mais distante que raio + √3·resolução de todos os
+    obstáculos não tem vizinho bloqueado, o que dispensa o teste dos 26 vizinhos no espaço livre.
+    """
+
+    def __init__(
+        self,
+        origem: np.ndarray,
+        objetivo: np.ndarray,
+        tempo_objetivo: float,
+        final: bool,
+        resolucao: float,
+        velocidade: float,
+        movimentos: List[Tuple[int, int, int]],
+        tabela: TabelaEfemerides,
+        obstaculos: np.ndarray,
+        raios_exclusao: np.ndarray,
+    ):
+        """
+        :param origem: Posição da célula (0, 0, 0) da grade.
+        :param objetivo: Ponto a alcançar.
+        :param tempo_objetivo: Instante previsto de chegada ao objetivo (s, relativo à tabela).
+        :param final: Se o objetivo é a interceptação do destino (último trecho).
+        :param resolucao: Tamanho das células (m).
+        :param velocidade: Velocidade de cruzeiro (m/s).
+        :param movimentos: Deslocamentos, em células, para os vizinhos.
+        :param tabela: Posições previstas dos obstáculos.
+        :param obstaculos: Índices dos obstáculos na tabela.
+        :param raios_exclusao: Raios das esferas de exclusão dos obstáculos (m).
+        """
+        self.origem = origem
+        self.tempo_objetivo = tempo_objetivo
+        self.final = final
+        self.resolucao = resolucao
+        self.velocidade = velocidade
+        self.tabela = tabela
+        self.obstaculos = obstaculos
+        self.movimentos = movimentos
+        self.custos = [resolucao * math.sqrt(dx * dx + dy * dy + dz * dz) for dx, dy, dz in movimentos]
+        self.custo_medio = sum(self.custos) / len(self.custos)
+
+        # Teste das esferas de exclusão em floats do Python: origem, deslocamentos até os vizinhos,
+        # raios² e (raio + maior deslocamento)², abaixo do qual algum vizinho pode estar bloqueado
+        self._origem = tuple(float(c) for c in origem)
+        self.deslocamentos = [(resolucao * dx, resolucao * dy, resolucao * dz) for dx, dy, dz in movimentos]
+        self.raios2 = [float(raio) ** 2 for raio in raios_exclusao]
+        self.limites2 = [(float(raio) + RAIZ_3 * resolucao) ** 2 for raio in raios_exclusao]
+        self.largura_faixa = min(tabela.passo, resolucao / velocidade)
+        self._centros: Dict[int, List[Tuple[float, float, float]]] = {}
+
+        self.celula_objetivo = self.celula(objetivo)
+        self.celula_inicio: Optional[Tuple[int, int, int]] = None
+        self.custos_g: Dict[Tuple[int, int, int], float] = {self.celula_objetivo: 0.0}
+        self.sucessores: Dict[Tuple[int, int, int], Optional[Tuple[int, int, int]]] = {self.celula_objetivo: None}
+        self.fechados: Set[Tuple[int, int, int]] = set()
+        # Entradas (f, ordem de inserção, célula); a ordem desempata f iguais sem comparar células
+        self.lista_aberta: List[Tuple[float, int, Tuple[int, int, int]]] = [(0.0, 0, self.celula_objetivo)]
+        self.contador = 1
+
+    def celula(self, posicao: np.ndarray) -> Tuple[int, int, int]:
+        """
+        Célula da grade que contém uma posição.
+        """
+        return tuple(int(c) for c in np.rint((posicao - self.origem) / self.resolucao))
+
+    def posicao(self, celula: Tuple[int, int, int]) -> np.ndarray:
+        """
+        Centro de uma célula da grade.
+        """
+        return self.origem + self.resolucao * np.array(celula, dtype=float)
+
+    def _centros_em(self, instante: float) -> List[Tuple[float, float, float]]:
+        """
+        Posições dos obstáculos na faixa de instantes que contém `instante`, interpoladas uma vez por faixa.
+        """
+        faixa = int(round(instante / self.largura_faixa))
+        centros = self._centros.get(faixa)
+        if centros is None:
+            posicoes = self.tabela.posicoes_em(faixa * self.largura_faixa, self.obstaculos)
+            centros = self._centros[faixa] = [tuple(centro) for centro in posicoes.tolist()]
+        return centros
+
+    def _bloqueados(self, celula: Tuple[int, int, int], instante: float) -> Optional[List[bool]]:
+        """
+        Vizinhos de uma célula que caem em alguma esfera de exclusão no instante de passagem.
+
+        :return: Uma marca por movimento, ou None se nenhum vizinho estiver bloqueado.
+        """
+        ox, oy, oz = self._origem
+        px = ox + self.resolucao * celula[0]
+        py = oy + self.resolucao * celula[1]
+        pz = oz + self.resolucao * celula[2]
+        bloqueados = None
+        for (x, y, z), raio2, limite2 in zip(self._centros_em(instante), self.raios2, self.limites2):
+            rx, ry, rz = px - x, py - y, pz - z
+            if rx * rx + ry * ry + rz * rz >= limite2:
+                continue
+            if bloqueados is None:
+                bloqueados = [False] * len(self.deslocamentos)
+            for indice, (dx, dy, dz) in enumerate(self.deslocamentos):
+                ax, ay, az = rx + dx, ry + dy, rz + dz
+                if ax * ax + ay * ay + az * az < raio2:
+                    bloqueados[indice] = True
+        return bloqueados
+
+    def heuristica(self, celula: Tuple[int, int, int]) -> float:
+        """
+        Distância "octil" 3D até a célula de início: custo exato na grade de 26 vizinhos sem
+        obstáculos (movimentos em 3, 2 e 1 eixos custam √3, √2 e 1 célula).
+        """
+        c, b, a = sorted((
+            abs(self.celula_inicio[0] - celula[0]),
+            abs(self.celula_inicio[1] - celula[1]),
+            abs(self.celula_inicio[2] - celula[2]),
+        ))
+        return self.resolucao * ((a - b) + RAIZ_2 * (b - c) + RAIZ_3 * c)
+
+    def esgotada(self, posicao: np.ndarray) -> bool:
+        """
+        Se o foguete já está no objetivo intermediário e a busca não o leva mais adiante.
+        """
+        return not self.final and self.celula(posicao) == self.celula_objetivo
+
+    def _mudar_inicio(self, celula_inicio: Tuple[int, int, int]) -> None:
+        if celula_inicio == self.celula_inicio:
+            return
+        self.celula_inicio = celula_inicio
+        # Reordena a fronteira pela nova heurística (cada célula aberta uma vez, com seu melhor g)
+        abertas = {celula for _, _, celula in self.lista_aberta if celula not in self.fechados}
+        self.lista_aberta = []
+        for celula in abertas:
+            self.lista_aberta.append((self.custos_g[celula] + self.heuristica(celula), self.contador, celula))
+            self.contador += 1
+        heapq.heapify(self.lista_aberta)
+
+    def continuar(self, inicio: np.ndarray, limite: float) -> Tuple[List[Nodo], int]:
+        """
+        Continua a busca até fechar a célula do foguete ou até o instante `limite`.
+
+        :param inicio: Posição atual do foguete.
+        :param limite: Instante (time.perf_counter) em que a busca é interrompida.
+        :return: Tupla (caminho até o objetivo, nodos expandidos). Se a busca for interrompida,
+            o caminho parte da célula fechada mais próxima do foguete.
+        """
+        self._mudar_inicio(self.celula(inicio))
+        celula_inicio = self.celula_inicio
+        custos_g, sucessores, fechados, lista_aberta = self.custos_g, self.sucessores, self.fechados, self.lista_aberta
+        velocidade = self.velocidade
+        com_obstaculos = len(self.obstaculos) > 0
+        livres = [False] * len(self.movimentos)
+        expandidos = 0
+        # Célula de início e resolução locais para a heurística, calculada no laço como em `heuristica`
+        ix, iy, iz = celula_inicio
+        resolucao = self.resolucao
+
+        while celula_inicio not in fechados and lista_aberta:
+            if time.perf_counter() > limite:
+                break
+
+            # Seleciona o nodo com o menor f
+            _, _, celula = heapq.heappop(lista_aberta)
+            if celula in fechados:
+                continue
+            fechados.add(celula)
+            expandidos += 1
+            g_atual = custos_g[celula]
+
+            # Vizinhos dentro de alguma esfera de exclusão no instante de passagem (estimado pelo
+            # custo médio de um movimento) são descartados
+            bloqueados = None
+            if com_obstaculos:
+                bloqueados = self._bloqueados(celula, max(self.tempo_objetivo - (g_atual + self.custo_medio) / velocidade, 0.0))
+            if bloqueados is None:
+                bloqueados = livres
+
+            # Gera os nodos vizinhos
+            cx, cy, cz = celula
+            for (dx, dy, dz), custo, bloqueado in zip(self.movimentos, self.custos, bloqueados):
+                if bloqueado:
+                    continue
+                vizinho = (cx + dx, cy + dy, cz + dz)
+                if vizinho in fechados:
+                    continue
+
+                # Mantém só o menor custo até o objetivo conhecido para cada célula
+                g = g_atual + custo
+                if g >= custos_g.get(vizinho, math.inf):
+                    continue
+                custos_g[vizinho] = g
+                sucessores[vizinho] = celula
+                a, b, c = abs(ix - vizinho[0]), abs(iy - vizinho[1]), abs(iz - vizinho[2])
+                if a < b:
+                    a, b = b, a
+                if b < c:
+                    b, c = c, b
+                    if a < b:
+                        a, b = b, a
+                h = resolucao * ((a - b) + RAIZ_2 * (b - c) + RAIZ_3 * c)
+                heapq.heappush(lista_aberta, (g + h, self.contador, vizinho))
+                self.contador += 1
+
+        return self._caminho(), expandidos
+
+    def _caminho(self) -> List[Nodo]:
+        """
+        Caminho da célula do foguete (ou, se ainda não alcançada, da célula fechada mais próxima
+        dela) até o objetivo, seguindo os sucessores.
+        """
+        atual: Optional[Tuple[int, int, int]] = self.celula_inicio
+        if atual not in self.fechados:
+            atual = min(self.fechados, key=self.heuristica) if self.fechados else self.celula_objetivo
+        g_total = self.custos_g[atual]
+        caminho: List[Nodo] = []
+        while atual is not None:
+            restante = self.custos_g[atual]
+            g = g_total - restante
+            caminho.append(Nodo(
+                posicao=self.posicao(atual), g=g, h=restante, f=g + restante,
+                pai=caminho[-1] if caminho else None,
+                tempo=max(self.tempo_objetivo - restante / self.velocidade, 0.0),
+            ))
+            atual = self.sucessores[atual]
+        return caminho
+
 
 class Navegador:
-    def __init__(self, foguete: Foguete, destino: CorpoCeleste):
+    def __init__(
+        self,
+        foguete: Foguete,
+        destino: CorpoCeleste,
+        corpos: Optional[List[CorpoCeleste]] = None,
+        velocidade_cruzeiro: float = 3e4,
+        planejamento: str = "grade",
+        planejar_em_thread: bool = True,
+    ):
+        """
+        Inicializa o navegador.
+
+        :param foguete: Foguete guiado.
+        :param destino: Corpo de destino.
+        :param corpos: Corpos da cena. Se informados, suas posições futuras são previstas para
+            interceptar o destino e desviar dos poços gravitacionais; sem eles, o destino é
+            extrapolado em movimento retilíneo.
+        :param velocidade_cruzeiro: Velocidade média suposta do foguete (m/s), que converte
+            distância percorrida em tempo de chegada.
+        :param planejamento: "grade" (A* no espaço-tempo com pontos de passagem) ou "lambert"
+            (queimas de uma transferência de mínimo Δv; requer os corpos da cena).
+        :param planejar_em_thread: Se True, o planejamento (em grade ou de Lambert) roda em uma thread
+            própria e executar_proxima_acao nunca espera por ele; se False, roda na própria chamada.
+        """
+        if planejamento not in PLANEJAMENTOS:
+            raise ValueError(f"Planejamento desconhecido: '{planejamento}'. Opções: {', '.join(PLANEJAMENTOS)}.")
+        if planejamento == "lambert" and not corpos:
+            raise ValueError("O planejamento 'lambert' requer os corpos da cena.")
+        self.planejamento = planejamento
         self.foguete = foguete
         self.destino = destino
+        self.corpos: List[CorpoCeleste] = list(corpos) if corpos is not None else []
+        self.velocidade_cruzeiro = velocidade_cruzeiro
         self.caminho: List[Nodo] = []
         self.indice_acao_atual = 0
         self.resolucao = 1e9  # Tamanho das células da grade
         self.raio_planejamento = 1e10  # Raio para o planejamento incremental
         self.tempo_maximo_planejamento = 0.1  # Tempo máximo (em segundos) para o planejamento em cada iteração
+        self.nodos_expandidos = 0  # Nodos expandidos na última busca
+        self.limite_desvio = 3.0 * self.resolucao  # Distância ao próximo nodo que dispara o reparo do caminho
+        self.tempo = 0.0  # Tempo simulado acumulado pelas chamadas de executar_proxima_acao (s)
 
-    def calcular_caminho_incremental(self):
+        # Buscas anteriores, reaproveitadas e reparadas (ver BuscaReversa), em um cache LRU indexado
+        # por (célula do início, célula do destino, época); as células do cache têm `resolucao_cache`
+        self.cache_buscas: "OrderedDict[Tuple, BuscaReversa]" = OrderedDict()
+        self.max_buscas_cache = 16
+        self.resolucao_cache = 1e10
+        self.intervalo_epoca = 86400.0  # Duração de uma época (s)
+        self.acertos_cache = 0
+
+        # Planejamento em segundo plano: a thread entrega o caminho em `_caminho_pronto` (grade) ou
+        # (resultado, tempo da cópia do estado) em `_transferencia_pronta` (Lambert)
+        self.planejar_em_thread = planejar_em_thread
+        self._thread_planejamento: Optional[threading.Thread] = None
+        self._caminho_pronto: Optional[List[Nodo]] = None
+        self._transferencia_pronta: Optional[Tuple[Optional[Tuple], float]] = None
+
+        # Previsão das posições futuras (ver TabelaEfemerides)
+        self.passo_efemerides = 86400.0  # Intervalo entre amostras da tabela (s)
+        self.subpassos_efemerides = 6  # Passos de integração por amostra (4 h)
+        self.fracao_tempo_efemerides = 0.5  # Fração máxima do tempo de planejamento gasta na tabela
+        self.horizonte_efemerides = 2 * 365.25 * 86400.0  # Tempo máximo previsto (s)
+        self.tabela: Optional[TabelaEfemerides] = None  # Tabela da última busca; o destino é o corpo 0
+        self.tempo_interceptacao: Optional[float] = None  # Tempo previsto até a interceptação (s)
+
+        # Esferas de exclusão em torno dos corpos massivos: o maior entre `fator_exclusao` raios e
+        # a distância em que a gravidade do corpo supera `aceleracao_limite`
+        self.fator_exclusao = 5.0
+        self.aceleracao_limite = 0.1  # m/s²
+
+        # Transferência de Lambert: grade porkchop de instantes de partida × tempos de voo
+        self.janela_partida = 2 * 365.25 * DIA  # Partidas entre agora e este prazo (s)
+        self.passos_partida = 240
+        self.tempos_voo = np.linspace(30.0, 600.0, 240) * DIA  # Tempos de voo candidatos (s)
+        self.igualar_velocidade = True  # Soma a queima de chegada (encontro) ao custo
+        self.pontos_arco = 64  # Pontos de passagem amostrados no arco de transferência
+        self.tolerancia_delta_v = 1.0  # Δv restante (m/s) em que uma queima é dada por concluída
+        self.plano: Optional[PlanoTransferencia] = None
+        self.queimas: List[Tuple[float, np.ndarray]] = []  # (instante, velocidade final desejada)
+        self.indice_queima = 0
+        self.tempo_plano = 0.0  # Tempo decorrido desde o planejamento (s)
+        self._tempo_captura_plano = 0.0  # Valor de `tempo` no instante zero do plano
+
+    def _outros_corpos(self) -> List[CorpoCeleste]:
         """
-        Executa o algoritmo A* para encontrar o caminho até um ponto intermediário.
+        Corpos da cena, exceto o destino e os foguetes.
         """
-        inicio = self.foguete.posicao
-        objetivo = self.destino.posicao
+        return [
+            corpo for corpo in self.corpos
+            if corpo is not self.destino and corpo is not self.foguete and not isinstance(corpo, Foguete)
+        ]
 
-        # Verifica se já está próximo o suficiente do destino
-        if np.linalg.norm(objetivo - inicio) < self.resolucao:
+    def _capturar_estado(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Copia o estado dos corpos usado pelo planejamento em grade (o destino é o corpo 0), para
+        que a busca possa rodar fora da thread que os atualiza.
+
+        :return: Tupla (massas, máscara dos corpos massivos, posições, velocidades, raios de exclusão).
+        """
+        corpos = [self.destino] + self._outros_corpos()
+        massas = np.array([corpo.massa for corpo in corpos], dtype=float)
+        massivos = np.array([corpo.massa > 0 and not corpo.particula_teste for corpo in corpos], dtype=bool)
+        posicoes = np.array([corpo.posicao for corpo in corpos], dtype=float)
+        velocidades = np.array([corpo.velocidade for corpo in corpos], dtype=float)
+        raios = np.array(
+            [
+                max(self.fator_exclusao * corpo.raio, math.sqrt(G * corpo.massa / self.aceleracao_limite))
+                for corpo in corpos
+            ]
+        )
+        return massas, massivos, posicoes, velocidades, raios
+
+    def _construir_tabela(
+        self, inicio: np.ndarray, estado: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    ) -> Tuple[TabelaEfemerides, np.ndarray, np.ndarray]:
+        """
+        Prevê as posições futuras do destino e dos corpos massivos, uma vez por planejamento.
+
+        A integração termina com folga depois do primeiro instante em que o destino fica ao
+        alcance do foguete na velocidade de cruzeiro (interceptação), ou antes, se consumir mais
+        que `fracao_tempo_efemerides` do tempo de planejamento; depois do fim da tabela as
+        posições são extrapoladas.
+
+        :param inicio: Posição do foguete.
+        :param estado: Estado dos corpos (ver _capturar_estado).
+        :return: Tupla (tabela, índices dos obstáculos na tabela, raios de exclusão).
+        """
+        massas, massivos, posicoes, velocidades, raios = estado
+
+        self.tempo_interceptacao = None
+        limite = time.perf_counter() + self.fracao_tempo_efemerides * self.tempo_maximo_planejamento
+
+        def parar(t: float, posicoes_t: np.ndarray) -> bool:
+            if time.perf_counter() > limite:
+                return True
+            if self.tempo_interceptacao is None:
+                if np.linalg.norm(posicoes_t[0] - inicio) <= self.velocidade_cruzeiro * t:
+                    self.tempo_interceptacao = t
+                return False
+            # Folga para desvios do caminho em relação à reta
+            return t >= 1.5 * self.tempo_interceptacao + self.passo_efemerides
+
+        tabela = TabelaEfemerides.integrar(
+            posicoes, velocidades, massas, np.flatnonzero(massivos),
+            self.passo_efemerides, self.horizonte_efemerides, parar, self.subpassos_efemerides,
+        )
+
+        # Obstáculos: corpos massivos, exceto o destino e os que já contêm o foguete
+        obstaculos = np.flatnonzero(massivos)
+        obstaculos = obstaculos[obstaculos != 0]
+        obstaculos = obstaculos[np.linalg.norm(posicoes[obstaculos] - inicio, axis=1) > raios[obstaculos]]
+        return tabela, obstaculos, raios[obstaculos]
+
+    def _ponto_interceptacao(self, inicio: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Refina por bisseção, na tabela, o instante de interceptação do destino.
+
+        :return: Tupla (posição prevista do destino na interceptação, instante).
+        """
+        tabela = self.tabela
+        if self.tempo_interceptacao is None:
+            # Fora de alcance no horizonte previsto: mira a última posição prevista
+            t = tabela.duracao
+            return tabela.posicoes_em(t, np.array([0]))[0], t
+        a, b = max(self.tempo_interceptacao - tabela.passo, 0.0), self.tempo_interceptacao
+        for _ in range(30):
+            meio = 0.5 * (a + b)
+            alcancado = np.linalg.norm(tabela.posicoes_em(meio, np.array([0]))[0] - inicio) <= self.velocidade_cruzeiro * meio
+            a, b = (a, meio) if alcancado else (meio, b)
+        return tabela.posicoes_em(b, np.array([0]))[0], b
+
+    def planejar_transferencia(self) -> Optional[PlanoTransferencia]:
+        """
+        Planeja, na própria chamada, a transferência de menor Δv até o destino com o solver de Lambert.
+
+        O corpo mais massivo da cena é o corpo central. As órbitas do destino, do corpo central e
+        do corpo de onde o foguete parte (o que o tem dentro de sua esfera de influência) vêm de
+        uma tabela de efemérides com todos os corpos massivos; um foguete fora de qualquer esfera
+        de influência segue a cônica em torno do corpo central até a partida. Toda a grade porkchop
+        (instantes de partida × tempos de voo) é resolvida em uma única chamada vetorizada.
+
+        O caminho vira uma sequência de pontos de passagem ao longo do arco de transferência, e as
+        queimas (velocidade desejada na partida e, se `igualar_velocidade`, na chegada) são
+        executadas por executar_proxima_acao, que com `planejar_em_thread` faz este mesmo
+        planejamento em segundo plano.
+
+        :return: Plano escolhido (também guardado em `self.plano`), ou None se não houver solução.
+        """
+        self._adotar_transferencia(self._calcular_transferencia(self._capturar_transferencia()), self.tempo)
+        return self.plano
+
+    def _capturar_transferencia(self) -> Tuple[Tuple[np.ndarray, ...], np.ndarray, np.ndarray]:
+        """
+        Copia o estado usado pelo planejamento de Lambert, na thread que atualiza os corpos.
+
+        :return: Tupla (estado dos corpos, ver _capturar_estado; posição do foguete; velocidade do foguete).
+        """
+        return (
+            self._capturar_estado(),
+            np.asarray(self.foguete.posicao, dtype=float).copy(),
+            np.asarray(self.foguete.velocidade, dtype=float).copy(),
+        )
+
+    def _adotar_transferencia(self, resultado: Optional[Tuple], tempo_captura: float) -> None:
+        """
+        Adota o resultado de _calcular_transferencia (ou a falta de solução, se None).
+
+        :param resultado: Tupla (plano, tabela, queimas, caminho), ou None.
+        :param tempo_captura: Valor de `self.tempo` quando o estado foi copiado (o instante zero do plano).
+        """
+        self.indice_queima = 0
+        self.indice_acao_atual = 0
+        self._tempo_captura_plano = tempo_captura
+        self.tempo_plano = self.tempo - tempo_captura
+        if resultado is None:
+            self.plano = None
+            self.queimas = []
             self.caminho = []
             return
+        self.plano, self.tabela, self.queimas, self.caminho = resultado
 
-        # Define o ponto intermediário como sendo dentro do raio de planejamento
-        direcao_ao_destino = objetivo - inicio
-        distancia_ao_destino = np.linalg.norm(direcao_ao_destino)
-        direcao_ao_destino_normalizada = direcao_ao_destino / distancia_ao_destino
+    def _calcular_transferencia(
+        self, captura: Tuple[Tuple[np.ndarray, ...], np.ndarray, np.ndarray]
+    ) -> Optional[Tuple[PlanoTransferencia, TabelaEfemerides, List[Tuple[float, np.ndarray]], List[Nodo]]]:
+        """
+        Calcula a transferência a partir de um estado copiado, sem tocar nos corpos nem no plano atual.
+
+        :param captura: Estado copiado por _capturar_transferencia.
+        :return: Tupla (plano, tabela, queimas, caminho), ou None se não houver solução.
+        """
+        (massas, massivos, posicoes, velocidades, _), posicao_foguete, velocidade_foguete = captura
+        indice_central = 1 + int(np.argmax(massas[1:])) if len(massas) > 1 else 0
+        if indice_central == 0 or massas[indice_central] < massas[0]:
+            return None
+        mu = G * massas[indice_central]
+
+        # Corpo de partida: o de menor esfera de influência (r·(m/M)^(2/5)) que contém o foguete
+        relativas = posicoes - posicoes[indice_central]
+        raios_influencia = np.linalg.norm(relativas, axis=1) * (massas / massas[indice_central]) ** 0.4
+        distancias = np.linalg.norm(posicoes - posicao_foguete, axis=1)
+        dentro = np.flatnonzero(massivos & (distancias < raios_influencia))
+        dentro = dentro[dentro != indice_central]
+        indice_origem = int(dentro[np.argmin(raios_influencia[dentro])]) if len(dentro) else None
+
+        tabela = TabelaEfemerides.integrar(
+            posicoes, velocidades, massas, np.flatnonzero(massivos),
+            self.passo_efemerides, self.janela_partida + float(np.max(self.tempos_voo)),
+            subpassos=self.subpassos_efemerides,
+        )
 
-        if distancia_ao_destino > self.raio_planejamento:
-            objetivo_intermediario = inicio + direcao_ao_destino_normalizada * self.raio_planejamento
+        def relativos(indice: int):
+            def estados(tempos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+                p, v = tabela.estados_em(tempos, indice)
+                pc, vc = tabela.estados_em(tempos, indice_central)
+                return p - pc, v - vc
+            return estados
+
+        if indice_origem is not None:
+            estados_origem = relativos(indice_origem)
         else:
-            objetivo_intermediario = objetivo
+            r0 = posicao_foguete - posicoes[indice_central]
+            v0 = velocidade_foguete - velocidades[indice_central]
 
-        # Cria o nodo inicial e o objetivo intermediário
-        nodo_inicial = Nodo(posicao=inicio, g=0, h=0, f=0)
-        nodo_objetivo = Nodo(posicao=objetivo_intermediario, g=0, h=0, f=0)
+            def estados_origem(tempos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+                return propagar_conica(r0, v0, tempos, mu)
 
-        # Listas de nodos abertos e fechados
-        lista_aberta: List[Nodo] = []
-        lista_fechada: List[Nodo] = []
+        # A propagação cônica levanta RuntimeError se não convergir: sem plano, em vez de
+        # queimas ou pontos de passagem errados
+        tempos_arco = np.linspace(0.0, 1.0, self.pontos_arco)
+        try:
+            plano = planejar_transferencia(
+                estados_origem, relativos(0),
+                np.linspace(0.0, self.janela_partida, self.passos_partida), self.tempos_voo,
+                mu, self.igualar_velocidade,
+            )
+            if plano is None:
+                return None
+            tempos_arco = tempos_arco * plano.tempo_voo
+            pontos, _ = plano.estados_arco(tempos_arco)
+        except RuntimeError:
+            return None
 
-        lista_aberta.append(nodo_inicial)
+        # Queimas em velocidades absolutas: o foguete compara com a própria velocidade
+        _, vc_partida = tabela.estados_em(np.array([plano.tempo_partida]), indice_central)
+        queimas = [(plano.tempo_partida, plano.velocidade_partida + vc_partida[0])]
+        if self.igualar_velocidade:
+            _, v_destino = tabela.estados_em(np.array([plano.tempo_chegada]), 0)
+            queimas.append((plano.tempo_chegada, v_destino[0]))
 
-        inicio_tempo = time.time()
+        # Pontos de passagem ao longo do arco, com g = distância percorrida e h = distância restante
+        centrais, _ = tabela.estados_em(plano.tempo_partida + tempos_arco, indice_central)
+        pontos = pontos + centrais
+        percorrido = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(pontos, axis=0), axis=1))))
+        caminho: List[Nodo] = []
+        for ponto, g, t in zip(pontos, percorrido.tolist(), tempos_arco.tolist()):
+            h = percorrido[-1] - g
+            caminho.append(Nodo(
+                posicao=ponto, g=g, h=h, f=g + h,
+                pai=caminho[-1] if caminho else None, tempo=plano.tempo_partida + t,
+            ))
+        return plano, tabela, queimas, caminho
 
-        while lista_aberta:
-            # Verifica se o tempo máximo de planejamento foi excedido
-            if time.time() - inicio_tempo > self.tempo_maximo_planejamento:
-                break
+    def calcular_caminho_incremental(self):
+        """
+        Planeja, na própria chamada, o caminho até o próximo ponto intermediário (ver _planejar).
+        """
+        self.caminho = self._planejar(np.asarray(self.foguete.posicao, dtype=float).copy(), self.tempo, self._capturar_estado())
+        self.indice_acao_atual = 0
 
-            # Seleciona o nodo com o menor f
-            nodo_atual = min(lista_aberta, key=lambda n: n.f)
-            lista_aberta.remove(nodo_atual)
-            lista_fechada.append(nodo_atual)
-
-            # Verifica se chegou ao objetivo intermediário (com uma tolerância)
-            if np.linalg.norm(nodo_atual.posicao - nodo_objetivo.posicao) < self.resolucao:
-                # Reconstrói o caminho
-                caminho = []
-                atual = nodo_atual
-                while atual is not None:
-                    caminho.append(atual)
-                    atual = atual.pai
-                self.caminho = caminho[::-1]  # Inverte o caminho
-                return
+    def _planejar(
+        self,
+        inicio: np.ndarray,
+        tempo: float,
+        estado: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    ) -> List[Nodo]:
+        """
+        Executa o algoritmo A* no espaço-tempo para encontrar o caminho até um ponto intermediário.
 
-            # Gera os nodos vizinhos
-            vizinhos = self.get_vizinhos(nodo_atual)
+        As posições futuras do destino e dos corpos massivos vêm de uma tabela de efemérides
+        construída uma vez por busca e interpolada. A busca mira o ponto de interceptação do
+        destino (onde ele estará quando o foguete puder alcançá-lo), ou um ponto intermediário a
+        `raio_planejamento` na direção dele, e evita as esferas de exclusão dos corpos massivos nas
+        posições que eles terão no instante previsto de passagem por cada célula.
 
-            for vizinho_pos in vizinhos:
-                # Verifica se o vizinho já está na lista fechada
-                if any(np.array_equal(vizinho_pos, n.posicao) for n in lista_fechada):
-                    continue
+        A busca é feita do objetivo para o foguete (ver BuscaReversa) e guardada em um cache LRU
+        indexado por (célula do início, célula do destino, época). Uma busca do cache com o mesmo
+        destino e a mesma época é reparada a partir da posição atual em vez de refeita: se o
+        foguete se desviou, a busca só continua até alcançá-lo; se o tempo de planejamento acabar
+        antes, a próxima chamada continua de onde esta parou.
 
-                # Calcula g, h e f
-                g = nodo_atual.g + self.custo_movimento(nodo_atual.posicao, vizinho_pos)
-                h = self.heuristica(vizinho_pos, nodo_objetivo.posicao)
-                f = g + h
+        :param inicio: Posição do foguete.
+        :param tempo: Tempo simulado atual (s), que define a época.
+        :param estado: Estado dos corpos (ver _capturar_estado).
+        :return: Caminho até o objetivo (vazio se o foguete já está no destino).
+        """
+        inicio_tempo = time.perf_counter()
+        posicao_destino = estado[2][0]
 
-                # Verifica se o vizinho já está na lista aberta com um custo menor
-                nodo_vizinho = next((n for n in lista_aberta if np.array_equal(vizinho_pos, n.posicao)), None)
-                if nodo_vizinho and g >= nodo_vizinho.g:
-                    continue
+        # Verifica se já está próximo o suficiente do destino
+        if np.linalg.norm(posicao_destino - inicio) < self.resolucao:
+            return []
 
-                if nodo_vizinho is None:
-                    nodo_vizinho = Nodo(posicao=vizinho_pos, g=g, h=h, f=f, pai=nodo_atual)
-                    lista_aberta.append(nodo_vizinho)
-                else:
-                    nodo_vizinho.g = g
-                    nodo_vizinho.h = h
-                    nodo_vizinho.f = f
-                    nodo_vizinho.pai = nodo_atual
-
-        # Se não encontrou um caminho dentro do tempo limite, utiliza o melhor nodo encontrado
-        if lista_fechada:
-            nodo_atual = min(lista_fechada, key=lambda n: n.h)
-            caminho = []
-            atual = nodo_atual
-            while atual is not None:
-                caminho.append(atual)
-                atual = atual.pai
-            self.caminho = caminho[::-1]
+        chave = (
+            tuple(np.floor(inicio / self.resolucao_cache).astype(int).tolist()),
+            tuple(np.floor(posicao_destino / self.resolucao_cache).astype(int).tolist()),
+            int(tempo // self.intervalo_epoca),
+        )
+        busca = self._busca_em_cache(chave)
+        if busca is not None and busca.esgotada(inicio):
+            busca = None
+        if busca is not None:
+            self.acertos_cache += 1
         else:
-            self.caminho = []
+            busca = self._nova_busca(inicio, estado)
+
+        self.cache_buscas[chave] = busca
+        self.cache_buscas.move_to_end(chave)
+        while len(self.cache_buscas) > self.max_buscas_cache:
+            self.cache_buscas.popitem(last=False)
+
+        caminho, self.nodos_expandidos = busca.continuar(inicio, inicio_tempo + self.tempo_maximo_planejamento)
+        return caminho
+
+    def _busca_em_cache(self, chave: Tuple) -> Optional[BuscaReversa]:
+        """
+        Busca do cache para a chave ou, se não houver, a mais recente com o mesmo destino e a
+        mesma época (que é reparada a partir do novo início).
+        """
+        busca = self.cache_buscas.get(chave)
+        if busca is not None:
+            return busca
+        for (_, celula_destino, epoca), candidata in reversed(self.cache_buscas.items()):
+            if (celula_destino, epoca) == chave[1:]:
+                return candidata
+        return None
+
+    def _nova_busca(
+        self, inicio: np.ndarray, estado: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    ) -> BuscaReversa:
+        """
+        Prevê as posições dos corpos e cria a busca até a interceptação ou o ponto intermediário.
+        """
+        self.tabela, obstaculos, raios_exclusao = self._construir_tabela(inicio, estado)
+        objetivo, tempo_interceptacao = self._ponto_interceptacao(inicio)
+
+        # Define o ponto intermediário como sendo dentro do raio de planejamento
+        direcao_ao_destino = objetivo - inicio
+        distancia_ao_destino = np.linalg.norm(direcao_ao_destino)
+        final = distancia_ao_destino <= self.raio_planejamento
+        if not final:
+            objetivo = inicio + direcao_ao_destino / distancia_ao_destino * self.raio_planejamento
+            tempo_interceptacao = self.raio_planejamento / self.velocidade_cruzeiro
+
+        return BuscaReversa(
+            origem=inicio,
+            objetivo=objetivo,
+            tempo_objetivo=tempo_interceptacao,
+            final=final,
+            resolucao=self.resolucao,
+            velocidade=self.velocidade_cruzeiro,
+            movimentos=self.movimentos_grade(),
+            tabela=self.tabela,
+            obstaculos=obstaculos,
+            raios_exclusao=raios_exclusao,
+        )
+
+    def _solicitar_planejamento(self) -> None:
+        """
+        Inicia o planejamento em grade: em uma thread, se nenhuma estiver em andamento, ou na
+        própria chamada. O estado dos corpos é copiado aqui, na thread que os atualiza.
+        """
+        if self.planejar_em_thread and self._thread_planejamento is not None and self._thread_planejamento.is_alive():
+            return
+        inicio = np.asarray(self.foguete.posicao, dtype=float).copy()
+        estado = self._capturar_estado()
+        tempo = self.tempo
+        if not self.planejar_em_thread:
+            self.caminho = self._planejar(inicio, tempo, estado)
+            self.indice_acao_atual = 0
+            return
+
+        def planejar():
+            self._caminho_pronto = self._planejar(inicio, tempo, estado)
+
+        self._thread_planejamento = threading.Thread(target=planejar, name="Navegador", daemon=True)
+        self._thread_planejamento.start()
+
+    def _solicitar_transferencia(self) -> None:
+        """
+        Inicia o planejamento de Lambert em uma thread, se nenhum planejamento estiver em andamento.
+        O estado dos corpos é copiado aqui, na thread que os atualiza.
+        """
+        if self._thread_planejamento is not None and self._thread_planejamento.is_alive():
+            return
+        captura = self._capturar_transferencia()
+        tempo = self.tempo
+
+        def planejar():
+            self._transferencia_pronta = (self._calcular_transferencia(captura), tempo)
+
+        self._thread_planejamento = threading.Thread(target=planejar, name="Navegador", daemon=True)
+        self._thread_planejamento.start()
+
+    def _adotar_planejamento(self) -> bool:
+        """
+        Adota o caminho entregue pela thread de planejamento, se houver um novo.
+
+        :return: True se um caminho foi adotado.
+        """
+        caminho = self._caminho_pronto
+        if caminho is None:
+            return False
+        self._caminho_pronto = None
+        self.caminho = caminho
+        self.indice_acao_atual = 0
+        return True
+
+    def encerrar(self) -> None:
+        """
+        Aguarda o término de um planejamento em segundo plano.
+        """
+        if self._thread_planejamento is not None:
+            self._thread_planejamento.join()
+            self._thread_planejamento = None
+
+    def movimentos_grade(self) -> List[Tuple[int, int, int]]:
+        """
+        Deslocamentos, em células, para os vizinhos de uma célula da grade (26 vizinhos: faces,
+        arestas e vértices), para que o caminho siga de perto a reta até a interceptação.
+        """
+        return [movimento for movimento in itertools.product((-1, 0, 1), repeat=3) if movimento != (0, 0, 0)]
 
     def get_vizinhos(self, nodo: Nodo) -> List[np.ndarray]:
         """
         Retorna os vizinhos de um nodo na grade.
         """
-        movimentos = [
-            np.array([self.resolucao, 0, 0]),
-            np.array([-self.resolucao, 0, 0]),
-            np.array([0, self.resolucao, 0]),
-            np.array([0, -self.resolucao, 0]),
-            np.array([0, 0, self.resolucao]),
-            np.array([0, 0, -self.resolucao]),
-        ]
+        movimentos = [self.resolucao * np.array(movimento, dtype=float) for movimento in self.movimentos_grade()]
         vizinhos = [nodo.posicao + movimento for movimento in movimentos]
         return vizinhos
 
@@ -143,19 +759,35 @@ class Navegador:
         """
         return np.linalg.norm(objetivo - posicao)
 
-    def executar_proxima_acao(self):
+    def executar_proxima_acao(self, delta_t: float = 0.0):
         """
         Executa a próxima ação planejada pelo caminho.
+
+        :param delta_t: Tempo simulado desde a última chamada (s). O planejamento "lambert" o usa
+            para cronometrar as queimas e dosar o empuxo da última fração de cada uma; o "grade",
+            para definir a época das buscas em cache.
         """
-        if not self.caminho or self.indice_acao_atual >= len(self.caminho):
-            # Recalcula o caminho incremental
-            self.calcular_caminho_incremental()
-            self.indice_acao_atual = 0
+        self.tempo += delta_t
+        if self.planejamento == "lambert":
+            self._executar_queimas(delta_t)
+            return
 
-            if not self.caminho:
-                # Não encontrou caminho, desativa a propulsão
-                self.foguete.desativar_propulsao()
-                return
+        if self.planejar_em_thread:
+            self._adotar_planejamento()
+
+        # Sem nodos restantes, ou longe do próximo (desvio), pede um novo caminho; a busca em cache
+        # é reparada em vez de refeita. Com a thread, segue o caminho antigo enquanto isso.
+        if self.caminho and self.indice_acao_atual < len(self.caminho):
+            distancia = np.linalg.norm(self.caminho[self.indice_acao_atual].posicao - self.foguete.posicao)
+            if distancia > self.limite_desvio:
+                self._solicitar_planejamento()
+        else:
+            self._solicitar_planejamento()
+
+        if not self.caminho or self.indice_acao_atual >= len(self.caminho):
+            # Não há caminho (ainda), desativa a propulsão
+            self.foguete.desativar_propulsao()
+            return
 
         nodo_destino = self.caminho[self.indice_acao_atual]
         direcao_desejada = nodo_destino.posicao - self.foguete.posicao
@@ -165,26 +797,69 @@ class Navegador:
             self.indice_acao_atual += 1
             return
 
-        direcao_desejada_normalizada = direcao_desejada / distancia
+        # Se a diferença de ângulo for pequena, ativa a propulsão
+        if self._apontar(direcao_desejada / distancia):
+            self.foguete.ativar_propulsao(intensidade=1.0)
+
+    def _executar_queimas(self, delta_t: float) -> None:
+        """
+        Segue o plano de Lambert: espera o instante de cada queima e empuxa na direção do Δv que
+        falta até a velocidade desejada, até ele cair abaixo de `tolerancia_delta_v`.
+        """
+        if self.plano is None:
+            if not self.planejar_em_thread:
+                self.planejar_transferencia()
+            elif self._transferencia_pronta is not None:
+                resultado, tempo_captura = self._transferencia_pronta
+                self._transferencia_pronta = None
+                self._adotar_transferencia(resultado, tempo_captura)
+            else:
+                self._solicitar_transferencia()
+            if self.plano is None:
+                self.foguete.desativar_propulsao()
+                return
+        self.tempo_plano = self.tempo - self._tempo_captura_plano
+
+        # Avança o ponto de passagem corrente, só para acompanhamento
+        while self.indice_acao_atual < len(self.caminho) - 1 and self.caminho[self.indice_acao_atual].tempo < self.tempo_plano:
+            self.indice_acao_atual += 1
+
+        if self.indice_queima >= len(self.queimas) or self.tempo_plano < self.queimas[self.indice_queima][0]:
+            self.foguete.desativar_propulsao()
+            return
+
+        _, velocidade_desejada = self.queimas[self.indice_queima]
+        faltando = velocidade_desejada - self.foguete.velocidade
+        delta_v = np.linalg.norm(faltando)
+        if delta_v < self.tolerancia_delta_v:
+            self.foguete.desativar_propulsao()
+            self.indice_queima += 1
+            return
+
+        if self._apontar(faltando / delta_v):
+            # Na última fração da queima, reduz o empuxo para não passar do Δv desejado
+            intensidade = 1.0
+            aceleracao_maxima = self.foguete.empuxo_maximo / self.foguete.massa
+            if delta_t > 0 and aceleracao_maxima > 0:
+                intensidade = min(1.0, delta_v / (aceleracao_maxima * delta_t))
+            self.foguete.ativar_propulsao(intensidade=intensidade)
+        else:
+            self.foguete.desativar_propulsao()
 
+    def _apontar(self, direcao_desejada_normalizada: np.ndarray) -> bool:
+        """
+        Gira o foguete em direção a uma direção desejada.
+
+        :return: True se o foguete já aponta para ela (diferença menor que 5°).
+        """
         # Calcula a diferença entre a orientação atual e a desejada
         vetor_direcao_atual = self.foguete.calcular_vetor_direcao()
         angulo_diferenca = np.arccos(np.clip(np.dot(vetor_direcao_atual, direcao_desejada_normalizada), -1.0, 1.0))
-
-        # Se a diferença de ângulo for pequena, ativa a propulsão
         if angulo_diferenca < np.radians(5):
-            self.foguete.ativar_propulsao(intensidade=1.0)
-        else:
-            # Rotaciona o foguete na direção correta
-            eixo_rotacao = np.cross(vetor_direcao_atual, direcao_desejada_normalizada)
-            if np.linalg.norm(eixo_rotacao) > 0:
-                eixo_rotacao_normalizado = eixo_rotacao / np.linalg.norm(eixo_rotacao)
-                delta_orientacao = eixo_rotacao_normalizado * np.degrees(0.1)  # Ajuste o fator conforme necessário
-                self.foguete.atualizar_orientacao(delta_orientacao)
-            else:
-                # Orientação já alinhada, não faz nada
-                pass
+            return True
 
-        # Verifica se chegou ao nodo destino
-        if distancia < self.resolucao:
-            self.indice_acao_atual += 1  # Avança para o próximo nodo
+        # Rotaciona o foguete na direção correta, no máximo 0,1 rad por chamada
+        eixo_rotacao = np.cross(vetor_direcao_atual, direcao_desejada_normalizada)
+        if np.linalg.norm(eixo_rotacao) > 0:
+            self.foguete.girar(eixo_rotacao, min(0.1, angulo_diferenca))
+        return False
@@ -0,0 +1,267 @@
+import numpy as np
+from simulacao.fisica.gravidade import G
+
+# Bits por eixo nas chaves de Morton (3 * 21 = 63 bits cabem em um uint64)
+_BITS_MORTON = 21
+
+# Número de alvos percorridos simultaneamente na árvore, para limitar a memória
+_ALVOS_POR_LOTE = 4096
+
+
+def _espalhar_bits(valores: np.ndarray) -> np.ndarray:
+    """
+    Intercala dois bits nulos entre cada bit dos 21 bits menos significativos.
+
+    :param valores: Inteiros não negativos (np.uint64).
+    :return: Inteiros com os bits espalhados (np.uint64).
+    """
+    v = valores & np.uint64(0x1FFFFF)
+    v = (v | (v << np.uint64(32))) & np.uint64(0x1F00000000FFFF)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x1F0000FF0000FF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x100F00F00F00F00F)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x10C30C30C30C30C3)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return v
+
+
+def _somar_intervalos(valores: np.ndarray, inicios: np.ndarray, fins: np.ndarray) -> np.ndarray:
+    """
+    Soma `valores` em cada intervalo [inicio, fim) sem usar somas acumuladas,
+    preservando a precisão de nós pequenos em cenas com massas muito díspares.
+
+    :param valores: Array com os valores na ordem das partículas, shape (N, ...).
+    :param inicios: Início de cada intervalo.
+    :param fins: Fim (exclusivo) de cada intervalo; deve ser maior que o início.
+    :return: Somas por intervalo, shape (K, ...).
+    """
+    # Um elemento extra permite usar `fim == N` como índice do reduceat
+    estendido = np.concatenate([valores, np.zeros((1,) + valores.shape[1:])])
+    indices = np.empty(2 * len(inicios), dtype=np.int64)
+    indices[0::2] = inicios
+    indices[1::2] = fins
+    return np.add.reduceat(estendido, indices, axis=0)[0::2]
+
+
+class ArvoreOctal:
+    """
+    Octree de Barnes–Hut armazenada inteiramente em arrays.
+
+    As fontes são ordenadas pela chave de Morton, de modo que cada nó corresponde a um
+    intervalo contíguo [inicio, inicio + contagem) das partículas ordenadas. Os filhos de
+    um nó ocupam posições consecutivas nos arrays de nós.
+    """
+
+    def __init__(self, posicoes: np.ndarray, massas: np.ndarray, max_folha: int = 8):
+        """
+        Constrói a árvore a partir das fontes do campo gravitacional.
+
+        :param posicoes: Posições das fontes, shape (M, 3).
+        :param massas: Massas das fontes em kg, shape (M,).
+        :param max_folha: Número máximo de partículas em um nó folha.
+        """
+        n = len(posicoes)
+        self.max_folha = max_folha
+
+        # Cubo envolvente de todas as fontes
+        minimo = posicoes.min(axis=0)
+        lado = float(np.max(posicoes.max(axis=0) - minimo))
+        lado = lado * (1.0 + 1e-9) if lado > 0 else 1.0
+        self.origem: np.ndarray = minimo
+        self.lado: float = lado
+
+        # Coordenadas inteiras e chaves de Morton
+        escala = (1 << _BITS_MORTON) / lado
+        inteiras = np.clip(((posicoes - minimo) * escala).astype(np.int64), 0, (1 << _BITS_MORTON) - 1)
+        inteiras = inteiras.astype(np.uint64)
+        chaves = (
+            (_espalhar_bits(inteiras[:, 0]) << np.uint64(2))
+            | (_espalhar_bits(inteiras[:, 1]) << np.uint64(1))
+            | _espalhar_bits(inteiras[:, 2])
+        )
+        ordem = np.argsort(chaves, kind="stable")
+        chaves = chaves[ordem]
+        self.posicoes: np.ndarray = np.ascontiguousarray(posicoes[ordem])
+        self.massas: np.ndarray = np.ascontiguousarray(massas[ordem])
+        inteiras = inteiras[ordem]
+
+        # Construção nível a nível; cada nível é descrito por arrays de nós
+        inicios = [np.array([0], dtype=np.int64)]
+        contagens = [np.array([n], dtype=np.int64)]
+        niveis = [np.array([0], dtype=np.int64)]
+        primeiros_filhos = []
+        numeros_filhos = []
+        total_nos = 1
+
+        nivel = 0
+        while True:
+            inicio_atual, contagem_atual = inicios[-1], contagens[-1]
+            primeiro_filho = np.full(len(inicio_atual), -1, dtype=np.int64)
+            numero_filhos = np.zeros(len(inicio_atual), dtype=np.int64)
+
+            internos = contagem_atual > max_folha
+            if nivel >= _BITS_MORTON or not np.any(internos):
+                primeiros_filhos.append(primeiro_filho)
+                numeros_filhos.append(numero_filhos)
+                break
+
+            # Intervalos de partículas com o mesmo prefixo de Morton no próximo nível
+            prefixos = chaves >> np.uint64(3 * (_BITS_MORTON - nivel - 1))
+            inicios_filhos = np.concatenate(([0], np.flatnonzero(prefixos[1:] != prefixos[:-1]) + 1))
+
+            # Mantém apenas os intervalos contidos em nós internos do nível atual
+            pais = np.searchsorted(inicio_atual, inicios_filhos, side="right") - 1
+            pais = np.maximum(pais, 0)
+            dentro = (inicios_filhos >= inicio_atual[pais]) & (inicios_filhos < inicio_atual[pais] + contagem_atual[pais])
+            selecionados = dentro & internos[pais]
+            fins_filhos = np.append(inicios_filhos[1:], n)[selecionados]
+            inicios_filhos = inicios_filhos[selecionados]
+            pais = pais[selecionados]
+
+            numero_filhos[:] = np.bincount(pais, minlength=len(inicio_atual))
+            primeiro_filho[internos] = total_nos + np.cumsum(numero_filhos)[internos] - numero_filhos[internos]
+            primeiros_filhos.append(primeiro_filho)
+            numeros_filhos.append(numero_filhos)
+
+            inicios.append(inicios_filhos)
+            contagens.append(fins_filhos - inicios_filhos)
+            niveis.append(np.full(len(inicios_filhos), nivel + 1, dtype=np.int64))
+            total_nos += len(inicios_filhos)
+            nivel += 1
+
+        self.inicio: np.ndarray = np.concatenate(inicios)
+        self.contagem: np.ndarray = np.concatenate(contagens)
+        self.nivel: np.ndarray = np.concatenate(niveis)
+        self.primeiro_filho: np.ndarray = np.concatenate(primeiros_filhos)
+        self.numero_filhos: np.ndarray = np.concatenate(numeros_filhos)
+
+        # Massa e centro de massa de cada nó
+        fins = self.inicio + self.contagem
+        self.massa: np.ndarray = _somar_intervalos(self.massas, self.inicio, fins)
+        momentos = _somar_intervalos(self.massas[:, np.newaxis] * self.posicoes, self.inicio, fins)
+        contagem_segura = self.contagem[:, np.newaxis].astype(float)
+        media_geometrica = _somar_intervalos(self.posicoes, self.inicio, fins) / contagem_segura
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centro_massa = momentos / self.massa[:, np.newaxis]
+        self.centro_massa: np.ndarray = np.where(self.massa[:, np.newaxis] > 0, centro_massa, media_geometrica)
+
+        # Tamanho de cada nó e distância entre o centro de massa e o centro geométrico,
+        # usada no critério de abertura para evitar erros quando o alvo está dentro do nó
+        self.tamanho: np.ndarray = lado / (2.0 ** self.nivel)
+        deslocamento = (_BITS_MORTON - self.nivel).astype(np.uint64)
+        celula = (inteiras[self.inicio] >> deslocamento[:, np.newaxis]).astype(float)
+        centro_geometrico = minimo + (celula + 0.5) * self.tamanho[:, np.newaxis]
+        self.delta: np.ndarray = np.linalg.norm(self.centro_massa - centro_geometrico, axis=1)
+
+    def aceleracoes(self, posicoes_alvo: np.ndarray, theta: float = 0.5) -> np.ndarray:
+        """
+        Calcula a aceleração gravitacional da árvore sobre cada alvo.
+
+        Um nó é aceito como massa pontual quando d > tamanho / theta + delta, onde d é a
+        distância do alvo ao centro de massa do nó. Caso contrário, o nó é aberto: seus
+        filhos são visitados ou, se for uma folha, suas partículas são somadas diretamente.
+
+        :param posicoes_alvo: Posições dos alvos, shape (N, 3).
+        :param theta: Ângulo de abertura; 0 reproduz a soma direta.
+        :return: Acelerações em m/s², shape (N, 3).
+        """
+        n = len(posicoes_alvo)
+        aceleracoes = np.zeros((n, 3))
+        for inicio in range(0, n, _ALVOS_POR_LOTE):
+            fim = min(inicio + _ALVOS_POR_LOTE, n)
+            aceleracoes[inicio:fim] = self._percorrer(posicoes_alvo[inicio:fim], theta)
+        return aceleracoes
+
+    def _percorrer(self, posicoes_alvo: np.ndarray, theta: float) -> np.ndarray:
+        """
+        Percorre a árvore em largura para um lote de alvos, mantendo uma fronteira de pares (alvo, nó).
+
+        :param posicoes_alvo: Posições dos alvos do lote, shape (N, 3).
+        :param theta: Ângulo de abertura.
+        :return: Acelerações do lote, shape (N, 3).
+        """
+        n = len(posicoes_alvo)
+        aceleracoes = np.zeros((n, 3))
+        limiar = np.full(len(self.tamanho), np.inf) if theta <= 0 else self.tamanho / theta + self.delta
+
+        alvos = np.arange(n)
+        nos = np.zeros(n, dtype=np.int64)
+        while len(alvos):
+            direcoes = self.centro_massa[nos] - posicoes_alvo[alvos]
+            distancias = np.sqrt(np.einsum("ij,ij->i", direcoes, direcoes))
+
+            # Nós distantes o bastante contribuem como massa pontual
+            aceitos = distancias > limiar[nos]
+            self._acumular(
+                aceleracoes, alvos[aceitos], direcoes[aceitos], self.massa[nos[aceitos]], distancias[aceitos]
+            )
+
+            abertos = ~aceitos
+            alvos, nos = alvos[abertos], nos[abertos]
+            folhas = self.numero_filhos[nos] == 0
+
+            # Folhas abertas: soma direta sobre as partículas da folha
+            alvos_folha, nos_folha = alvos[folhas], nos[folhas]
+            if len(alvos_folha):
+                contagens = self.contagem[nos_folha]
+                pares_alvo = np.repeat(alvos_folha, contagens)
+                deslocamentos = np.arange(contagens.sum()) - np.repeat(np.cumsum(contagens) - contagens, contagens)
+                particulas = np.repeat(self.inicio[nos_folha], contagens) + deslocamentos
+                direcoes = self.posicoes[particulas] - posicoes_alvo[pares_alvo]
+                distancias = np.sqrt(np.einsum("ij,ij->i", direcoes, direcoes))
+                validos = distancias > 0  # Ignora o próprio corpo
+                self._acumular(
+                    aceleracoes,
+                    pares_alvo[validos],
+                    direcoes[validos],
+                    self.massas[particulas[validos]],
+                    distancias[validos],
+                )
+
+            # Nós internos abertos: a fronteira passa a conter os filhos
+            alvos_internos, nos_internos = alvos[~folhas], nos[~folhas]
+            numeros = self.numero_filhos[nos_internos]
+            alvos = np.repeat(alvos_internos, numeros)
+            deslocamentos = np.arange(numeros.sum()) - np.repeat(np.cumsum(numeros) - numeros, numeros)
+            nos = np.repeat(self.primeiro_filho[nos_internos], numeros) + deslocamentos
+
+        return aceleracoes
+
+    @staticmethod
+    def _acumular(
+        aceleracoes: np.ndarray,
+        alvos: np.ndarray,
+        direcoes: np.ndarray,
+        massas: np.ndarray,
+        distancias: np.ndarray,
+    ) -> None:
+        """
+        Soma G * m * r / |r|^3 de cada par na aceleração do respectivo alvo.
+        """
+        if len(alvos) == 0:
+            return
+        fatores = G * massas / distancias**3
+        for eixo in range(3):
+            aceleracoes[:, eixo] += np.bincount(alvos, weights=fatores * direcoes[:, eixo], minlength=len(aceleracoes))
+
+
+def aceleracoes_barnes_hut(
+    posicoes_alvo: np.ndarray,
+    posicoes_fonte: np.ndarray,
+    massas_fonte: np.ndarray,
+    theta: float = 0.5,
+    max_folha: int = 8,
+) -> np.ndarray:
+    """
+    Calcula a aceleração gravitacional das fontes sobre cada alvo pelo método de Barnes–Hut.
+
+    :param posicoes_alvo: Posições dos corpos que sofrem a força, shape (N, 3).
+    :param posicoes_fonte: Posições dos corpos que geram o campo, shape (M, 3).
+    :param massas_fonte: Massas das fontes em kg, shape (M,).
+    :param theta: Ângulo de abertura; valores menores são mais precisos e mais lentos.
+    :param max_folha: Número máximo de partículas em um nó folha.
+    :return: Acelerações em m/s², shape (N, 3).
+    """
+    if len(posicoes_alvo) == 0 or len(posicoes_fonte) == 0:
+        return np.zeros((len(posicoes_alvo), 3))
+    arvore = ArvoreOctal(posicoes_fonte, massas_fonte, max_folha=max_folha)
+    return arvore.aceleracoes(posicoes_alvo, theta)
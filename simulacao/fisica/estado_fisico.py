@@ -0,0 +1,101 @@
+from __future__ import annotations
+from typing import List, Optional
+import numpy as np
+from simulacao.objetos.corpo_celeste import CorpoCeleste
+from simulacao.objetos.foguete import Foguete
+from simulacao.fisica.kepler import Efemerides
+from simulacao.fisica.frota import Frota
+
+class EstadoFisico:
+    """
+    Estado físico da simulação armazenado como estrutura de arrays contíguos.
+
+    Posições e velocidades ficam em arrays (N, 3) e as massas em um array (N,).
+    Os objetos CorpoCeleste vinculados ao estado passam a ser visões dessas linhas,
+    de modo que alterações feitas pelo motor físico aparecem diretamente nos corpos.
+    """
+
+    def __init__(self, posicoes: np.ndarray, velocidades: np.ndarray, massas: np.ndarray):
+        """
+        Inicializa o estado a partir de arrays já montados.
+
+        :param posicoes: Posições dos corpos, shape (N, 3).
+        :param velocidades: Velocidades dos corpos, shape (N, 3).
+        :param massas: Massas dos corpos, shape (N,).
+        """
+        self.posicoes: np.ndarray = np.ascontiguousarray(posicoes, dtype=float).reshape(-1, 3)
+        self.velocidades: np.ndarray = np.ascontiguousarray(velocidades, dtype=float).reshape(-1, 3)
+        self.massas: np.ndarray = np.ascontiguousarray(massas, dtype=float).reshape(-1)
+        self.corpos: List[CorpoCeleste] = []
+        self.indices_foguetes: List[int] = []
+        # Índices dos corpos que geram campo gravitacional (todos com massa, por padrão)
+        self.indices_fontes: np.ndarray = np.flatnonzero(self.massas > 0)
+        # Corpos que podem ser propagados analiticamente e seus elementos orbitais
+        self.indices_efemeride: np.ndarray = np.zeros(0, dtype=np.int64)
+        self.efemerides: Optional[Efemerides] = None
+        # Estado de propulsão dos foguetes, uma linha por índice de `indices_foguetes`
+        self.frota: Optional[Frota] = None
+        # Nomes de todas as linhas, quando o estado é montado de uma cena binária
+        self.nomes: Optional[np.ndarray] = None
+
+    @classmethod
+    def de_corpos(cls, corpos: List[CorpoCeleste]) -> EstadoFisico:
+        """
+        Monta o estado a partir de uma lista de corpos e vincula cada corpo à sua linha.
+
+        :param corpos: Lista de corpos celestes na simulação.
+        :return: Estado físico com os corpos vinculados.
+        """
+        estado = cls(
+            posicoes=np.array([corpo.posicao for corpo in corpos], dtype=float),
+            velocidades=np.array([corpo.velocidade for corpo in corpos], dtype=float),
+            massas=np.array([corpo.massa for corpo in corpos], dtype=float),
+        )
+        estado.indices_fontes = np.array(
+            [idx for idx, corpo in enumerate(corpos) if corpo.massa > 0 and not corpo.particula_teste],
+            dtype=np.int64,
+        )
+        estado.indices_efemeride = np.array([idx for idx, corpo in enumerate(corpos) if corpo.efemeride], dtype=np.int64)
+        if len(estado.indices_efemeride):
+            elementos = np.array([corpos[idx].elementos_orbitais for idx in estado.indices_efemeride], dtype=float)
+            estado.efemerides = Efemerides(*elementos.T)
+
+        estado.vincular_corpos(corpos)
+        return estado
+
+    def vincular_corpos(self, corpos: List[CorpoCeleste]) -> None:
+        """
+        Vincula os corpos às primeiras linhas do estado e reúne os foguetes na frota.
+
+        Linhas além de len(corpos) (por exemplo, as partículas de teste de uma cena binária)
+        existem só nos arrays, sem objeto correspondente.
+
+        :param corpos: Lista de corpos celestes; o corpo i passa a ocupar a linha i.
+        """
+        self.corpos = list(corpos)
+        self.indices_foguetes = [idx for idx, corpo in enumerate(corpos) if isinstance(corpo, Foguete)]
+        for idx, corpo in enumerate(corpos):
+            corpo.vincular_estado(self, idx)
+
+        if self.indices_foguetes:
+            foguetes = [corpos[idx] for idx in self.indices_foguetes]
+            self.frota = Frota.reunir(
+                [foguete.frota for foguete in foguetes],
+                [foguete.linha_frota for foguete in foguetes],
+                self.massas,
+                np.array(self.indices_foguetes, dtype=np.int64),
+            )
+            for linha, foguete in enumerate(foguetes):
+                foguete.vincular_frota(self.frota, linha)
+
+    def corresponde(self, corpos: List[CorpoCeleste]) -> bool:
+        """
+        Verifica se o estado foi montado exatamente para a lista de corpos informada.
+
+        :param corpos: Lista de corpos celestes na simulação.
+        :return: True se os corpos (e sua ordem) forem os mesmos.
+        """
+        return self.corpos == corpos
+
+    def __len__(self) -> int:
+        return len(self.massas)
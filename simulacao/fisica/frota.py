@@ -0,0 +1,247 @@
+from __future__ import annotations
+from typing import List, Optional
+import numpy as np
+
+
+def quaternioes_de_euler(angulos: np.ndarray) -> np.ndarray:
+    """
+    Converte ângulos de Euler (graus) em quaternions unitários, de forma vetorizada.
+
+    Segue a convenção dos foguetes: os ângulos são rotações em torno de X (pitch), Y (yaw) e
+    Z (roll), compostas como Rz · Ry · Rx (a mesma ordem das chamadas glRotatef do desenho).
+
+    :param angulos: Ângulos (pitch, yaw, roll) em graus, shape (..., 3).
+    :return: Quaternions (w, x, y, z), shape (..., 4).
+    """
+    meios = np.radians(np.asarray(angulos, dtype=float)) / 2.0
+    c, s = np.cos(meios), np.sin(meios)
+    cx, cy, cz = c[..., 0], c[..., 1], c[..., 2]
+    sx, sy, sz = s[..., 0], s[..., 1], s[..., 2]
+    return np.stack(
+        (
+            cz * cy * cx + sz * sy * sx,
+            cz * cy * sx - sz * sy * cx,
+            cz * sy * cx + sz * cy * sx,
+            sz * cy * cx - cz * sy * sx,
+        ),
+        axis=-1,
+    )
+
+
+def euler_de_quaternioes(quaternioes: np.ndarray) -> np.ndarray:
+    """
+    Converte quaternions unitários em ângulos de Euler (inversa de quaternioes_de_euler).
+
+    :param quaternioes: Quaternions (w, x, y, z), shape (..., 4).
+    :return: Ângulos (pitch, yaw, roll) em graus no intervalo [0, 360), shape (..., 3).
+    """
+    w, x, y, z = np.moveaxis(np.asarray(quaternioes, dtype=float), -1, 0)
+    pitch = np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    yaw = np.arcsin(np.clip(2.0 * (w * y - z * x), -1.0, 1.0))
+    roll = np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return np.mod(np.degrees(np.stack((pitch, yaw, roll), axis=-1)), 360.0)
+
+
+def multiplicar_quaternioes(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Produto de Hamilton a ⊗ b (aplicar b e depois a), de forma vetorizada.
+
+    :param a: Quaternions (w, x, y, z), shape (..., 4).
+    :param b: Quaternions (w, x, y, z), shape compatível com a.
+    :return: Produtos, shape (..., 4).
+    """
+    aw, ax, ay, az = np.moveaxis(np.asarray(a, dtype=float), -1, 0)
+    bw, bx, by, bz = np.moveaxis(np.asarray(b, dtype=float), -1, 0)
+    return np.stack(
+        (
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+        ),
+        axis=-1,
+    )
+
+
+def quaternioes_eixo_angulo(eixos: np.ndarray, angulos: np.ndarray) -> np.ndarray:
+    """
+    Quaternions de rotação em torno de eixos, de forma vetorizada.
+
+    :param eixos: Eixos de rotação (não precisam ser unitários; eixos nulos dão a identidade), shape (..., 3).
+    :param angulos: Ângulos em radianos, shape (...).
+    :return: Quaternions (w, x, y, z), shape (..., 4).
+    """
+    eixos = np.asarray(eixos, dtype=float)
+    normas = np.linalg.norm(eixos, axis=-1)
+    meios = 0.5 * np.where(normas > 0, np.asarray(angulos, dtype=float), 0.0)
+    escala = np.divide(np.sin(meios), normas, out=np.zeros_like(normas), where=normas > 0)
+    return np.concatenate((np.cos(meios)[..., np.newaxis], eixos * escala[..., np.newaxis]), axis=-1)
+
+
+def eixos_z(quaternioes: np.ndarray) -> np.ndarray:
+    """
+    Direção do eixo +Z próprio (para onde o foguete aponta) de cada quaternion: a terceira coluna
+    da matriz de rotação, sem montar a matriz.
+
+    :param quaternioes: Quaternions unitários (w, x, y, z), shape (..., 4).
+    :return: Direções unitárias, shape (..., 3).
+    """
+    w, x, y, z = np.moveaxis(np.asarray(quaternioes, dtype=float), -1, 0)
+    return np.stack((2.0 * (x * z + w * y), 2.0 * (y * z - w * x), 1.0 - 2.0 * (x * x + y * y)), axis=-1)
+
+
+class Frota:
+    """
+    Estado de propulsão de vários foguetes armazenado como estrutura de arrays.
+
+    Orientações (quaternions), empuxo, consumo, combustível, intensidade e indicadores de
+    propulsão ficam em arrays de M linhas; as massas ficam no array de massas dos corpos (por
+    exemplo, o do EstadoFisico), indexado por `indices_corpos`. Assim como os corpos em relação
+    ao EstadoFisico, cada Foguete vinculado a uma frota lê e escreve a sua linha, e o motor
+    físico calcula a propulsão de todos os foguetes em uma única operação vetorizada.
+    """
+
+    def __init__(self, num_foguetes: int, massas: np.ndarray, indices_corpos: np.ndarray):
+        """
+        Aloca uma frota com orientação identidade e propulsão desligada.
+
+        :param num_foguetes: Número de foguetes M.
+        :param massas: Array de massas dos corpos (kg), atualizado no lugar pelo consumo.
+        :param indices_corpos: Índice de cada foguete no array de massas, shape (M,).
+        """
+        self.massas: np.ndarray = massas
+        self.indices_corpos: np.ndarray = np.asarray(indices_corpos, dtype=np.int64).reshape(-1)
+        self.quaternioes: np.ndarray = np.zeros((num_foguetes, 4))
+        self.quaternioes[:, 0] = 1.0
+        self.empuxo_maximo: np.ndarray = np.zeros(num_foguetes)  # N
+        self.consumo: np.ndarray = np.zeros(num_foguetes)  # kg/s a empuxo máximo
+        self.combustivel: np.ndarray = np.zeros(num_foguetes)  # kg
+        self.intensidade: np.ndarray = np.ones(num_foguetes)  # Fração do empuxo máximo
+        self.propulsao_ativa: np.ndarray = np.zeros(num_foguetes, dtype=bool)
+
+    @classmethod
+    def reunir(cls, frotas: List[Frota], linhas: List[int], massas: np.ndarray, indices_corpos: np.ndarray) -> Frota:
+        """
+        Monta uma frota única copiando uma linha de cada frota de origem.
+
+        :param frotas: Frotas de origem (por exemplo, a frota própria de cada foguete).
+        :param linhas: Linha copiada de cada frota de origem.
+        :param massas: Array de massas da nova frota.
+        :param indices_corpos: Índice de cada foguete em `massas`.
+        :return: Nova frota com len(frotas) linhas.
+        """
+        frota = cls(len(frotas), massas, indices_corpos)
+        for destino, (origem, linha) in enumerate(zip(frotas, linhas)):
+            frota.quaternioes[destino] = origem.quaternioes[linha]
+            frota.empuxo_maximo[destino] = origem.empuxo_maximo[linha]
+            frota.consumo[destino] = origem.consumo[linha]
+            frota.combustivel[destino] = origem.combustivel[linha]
+            frota.intensidade[destino] = origem.intensidade[linha]
+            frota.propulsao_ativa[destino] = origem.propulsao_ativa[linha]
+        return frota
+
+    def __len__(self) -> int:
+        return len(self.quaternioes)
+
+    def _selecionar(self, linhas: Optional[np.ndarray]):
+        return slice(None) if linhas is None else linhas
+
+    def direcoes(self, linhas: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Direções de empuxo (eixo +Z próprio) dos foguetes, shape (M, 3) (ou (len(linhas), 3)).
+        """
+        return eixos_z(self.quaternioes[self._selecionar(linhas)])
+
+    def angulos_euler(self, linhas: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Orientações em ângulos de Euler (graus), para o desenho e a interface.
+        """
+        return euler_de_quaternioes(self.quaternioes[self._selecionar(linhas)])
+
+    def definir_angulos(self, angulos: np.ndarray, linhas: Optional[np.ndarray] = None) -> None:
+        """
+        Define as orientações a partir de ângulos de Euler (graus).
+        """
+        self.quaternioes[self._selecionar(linhas)] = quaternioes_de_euler(angulos)
+
+    def girar(self, eixos: np.ndarray, angulos: np.ndarray, linhas: Optional[np.ndarray] = None) -> None:
+        """
+        Gira os foguetes em torno de eixos do referencial do mundo.
+
+        :param eixos: Eixos de rotação, shape (M, 3) ou (3,).
+        :param angulos: Ângulos em radianos, shape (M,) ou escalar.
+        :param linhas: Foguetes girados (padrão: todos).
+        """
+        selecao = self._selecionar(linhas)
+        girados = multiplicar_quaternioes(quaternioes_eixo_angulo(eixos, angulos), self.quaternioes[selecao])
+        self.quaternioes[selecao] = girados / np.linalg.norm(girados, axis=-1, keepdims=True)
+
+    def girar_proprio(self, delta_angulos: np.ndarray, linhas: Optional[np.ndarray] = None) -> None:
+        """
+        Gira os foguetes por ângulos de Euler (graus) em torno dos seus próprios eixos.
+        """
+        selecao = self._selecionar(linhas)
+        girados = multiplicar_quaternioes(self.quaternioes[selecao], quaternioes_de_euler(delta_angulos))
+        self.quaternioes[selecao] = girados / np.linalg.norm(girados, axis=-1, keepdims=True)
+
+    def ativar_propulsao(self, intensidade, linhas: Optional[np.ndarray] = None) -> None:
+        """
+        Liga a propulsão dos foguetes que ainda têm combustível.
+
+        :param intensidade: Fração do empuxo máximo (entre 0 e 1), escalar ou por foguete.
+        :param linhas: Foguetes afetados (padrão: todos).
+        """
+        selecao = self._selecionar(linhas)
+        self.intensidade[selecao] = np.clip(intensidade, 0.0, 1.0)
+        self.propulsao_ativa[selecao] = self.combustivel[selecao] > 0
+
+    def desativar_propulsao(self, linhas: Optional[np.ndarray] = None) -> None:
+        """
+        Desliga a propulsão dos foguetes.
+        """
+        self.propulsao_ativa[self._selecionar(linhas)] = False
+
+    def aceleracoes(self, linhas: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Acelerações de propulsão atuais, sem consumir combustível.
+
+        :return: Acelerações (m/s²), shape (M, 3) (ou (len(linhas), 3)); zero com a propulsão desligada.
+        """
+        selecao = self._selecionar(linhas)
+        ativos = self.propulsao_ativa[selecao] & (self.combustivel[selecao] > 0)
+        modulos = np.where(
+            ativos,
+            self.empuxo_maximo[selecao] * self.intensidade[selecao] / self.massas[self.indices_corpos[selecao]],
+            0.0,
+        )
+        return modulos[:, np.newaxis] * self.direcoes(linhas)
+
+    def atualizar(self, delta_t: float, linhas: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Avança o consumo de combustível por delta_t e retorna a aceleração de propulsão do passo.
+
+        O consumo é proporcional à intensidade e reduz a massa dos foguetes. Um foguete que esgota
+        o combustível no meio do passo empuxa só pela fração do passo em que ainda tinha
+        combustível e tem a propulsão desligada.
+
+        :param delta_t: Intervalo de tempo em segundos.
+        :param linhas: Foguetes atualizados (padrão: todos).
+        :return: Acelerações médias de propulsão no passo (m/s²), shape (M, 3) (ou (len(linhas), 3)).
+        """
+        selecao = self._selecionar(linhas)
+        combustivel = self.combustivel[selecao]
+        ativos = self.propulsao_ativa[selecao] & (combustivel > 0)
+        intensidade = np.where(ativos, self.intensidade[selecao], 0.0)
+        indices = self.indices_corpos[selecao]
+        massas = self.massas[indices]
+        empuxo = self.empuxo_maximo[selecao] * intensidade / massas
+
+        consumo = self.consumo[selecao] * intensidade * delta_t
+        esgotados = consumo >= combustivel
+        fracao = np.divide(combustivel, consumo, out=np.ones_like(consumo), where=esgotados & (consumo > 0))
+        consumido = np.minimum(consumo, combustivel)
+
+        self.combustivel[selecao] = combustivel - consumido
+        self.massas[indices] = massas - consumido
+        self.propulsao_ativa[selecao] = ativos & ~esgotados
+        return (empuxo * fracao)[:, np.newaxis] * self.direcoes(linhas)
@@ -0,0 +1,95 @@
+import numpy as np
+
+# Constante gravitacional universal (m^3 kg^-1 s^-2)
+G = 6.67430e-11
+
+# Número máximo de pares (alvo, fonte) processados de uma vez, para limitar a memória
+_PARES_POR_BLOCO = 1 << 20
+
+
+def aceleracoes_diretas(
+    posicoes_alvo: np.ndarray,
+    posicoes_fonte: np.ndarray,
+    massas_fonte: np.ndarray,
+) -> np.ndarray:
+    """
+    Calcula, por soma direta, a aceleração gravitacional exercida pelas fontes sobre cada alvo.
+
+    Todas as interações de um bloco de alvos são avaliadas em uma única operação
+    vetorizada do NumPy. Pares com distância nula (um corpo consigo mesmo) são ignorados.
+
+    :param posicoes_alvo: Posições dos corpos que sofrem a força, shape (N, 3).
+    :param posicoes_fonte: Posições dos corpos que geram o campo, shape (M, 3).
+    :param massas_fonte: Massas das fontes em kg, shape (M,).
+    :return: Acelerações em m/s², shape (N, 3).
+    """
+    n = len(posicoes_alvo)
+    m = len(posicoes_fonte)
+    aceleracoes = np.zeros((n, 3))
+    if n == 0 or m == 0:
+        return aceleracoes
+
+    linhas_por_bloco = max(1, _PARES_POR_BLOCO // m)
+    for inicio in range(0, n, linhas_por_bloco):
+        fim = min(inicio + linhas_por_bloco, n)
+
+        # Componentes dos vetores alvo -> fonte de todos os pares do bloco, shape (b, M) cada
+        dx = posicoes_fonte[:, 0] - posicoes_alvo[inicio:fim, 0, np.newaxis]
+        dy = posicoes_fonte[:, 1] - posicoes_alvo[inicio:fim, 1, np.newaxis]
+        dz = posicoes_fonte[:, 2] - posicoes_alvo[inicio:fim, 2, np.newaxis]
+        distancias2 = dx * dx + dy * dy + dz * dz
+
+        # m_j / |r_ij|^3, com zero nos pares coincidentes (evita divisão por zero)
+        fatores = np.zeros_like(distancias2)
+        np.divide(massas_fonte, distancias2 * np.sqrt(distancias2), out=fatores, where=distancias2 > 0)
+
+        aceleracoes[inicio:fim, 0] = G * np.einsum("ij,ij->i", dx, fatores)
+        aceleracoes[inicio:fim, 1] = G * np.einsum("ij,ij->i", dy, fatores)
+        aceleracoes[inicio:fim, 2] = G * np.einsum("ij,ij->i", dz, fatores)
+
+    return aceleracoes
+
+
+def jerks_diretos(
+    posicoes_alvo: np.ndarray,
+    velocidades_alvo: np.ndarray,
+    posicoes_fonte: np.ndarray,
+    velocidades_fonte: np.ndarray,
+    massas_fonte: np.ndarray,
+) -> np.ndarray:
+    """
+    Calcula, por soma direta, o jerk (derivada temporal da aceleração) gravitacional de cada alvo:
+    j_i = G Σ m_j [v_ij / r³ - 3 (r_ij · v_ij) r_ij / r⁵].
+
+    :param posicoes_alvo: Posições dos alvos, shape (N, 3).
+    :param velocidades_alvo: Velocidades dos alvos, shape (N, 3).
+    :param posicoes_fonte: Posições das fontes, shape (M, 3).
+    :param velocidades_fonte: Velocidades das fontes, shape (M, 3).
+    :param massas_fonte: Massas das fontes em kg, shape (M,).
+    :return: Jerks em m/s³, shape (N, 3).
+    """
+    n = len(posicoes_alvo)
+    m = len(posicoes_fonte)
+    jerks = np.zeros((n, 3))
+    if n == 0 or m == 0:
+        return jerks
+
+    linhas_por_bloco = max(1, _PARES_POR_BLOCO // m)
+    for inicio in range(0, n, linhas_por_bloco):
+        fim = min(inicio + linhas_por_bloco, n)
+
+        r = [posicoes_fonte[:, k] - posicoes_alvo[inicio:fim, k, np.newaxis] for k in range(3)]
+        v = [velocidades_fonte[:, k] - velocidades_alvo[inicio:fim, k, np.newaxis] for k in range(3)]
+        distancias2 = r[0] * r[0] + r[1] * r[1] + r[2] * r[2]
+        r_dot_v = r[0] * v[0] + r[1] * v[1] + r[2] * v[2]
+
+        # m_j / |r_ij|^3 e 3 (r_ij · v_ij) / |r_ij|^2, com zero nos pares coincidentes
+        fatores = np.zeros_like(distancias2)
+        np.divide(massas_fonte, distancias2 * np.sqrt(distancias2), out=fatores, where=distancias2 > 0)
+        radial = np.zeros_like(distancias2)
+        np.divide(3.0 * r_dot_v, distancias2, out=radial, where=distancias2 > 0)
+
+        for k in range(3):
+            jerks[inicio:fim, k] = G * np.einsum("ij,ij->i", v[k] - radial * r[k], fatores)
+
+    return jerks
@@ -0,0 +1,370 @@
+import warnings
+from typing import Callable, Dict, Optional
+import numpy as np
+
+# Assinatura da função de aceleração gravitacional: aceleracao(posicoes, t) -> (N, 3)
+FuncaoAceleracao = Callable[[np.ndarray, float], np.ndarray]
+
+# Coeficientes de Yoshida para a composição de quarta ordem do leapfrog
+_W1 = 1.0 / (2.0 - 2.0 ** (1.0 / 3.0))
+_W0 = -(2.0 ** (1.0 / 3.0)) * _W1
+
+
+def passo_euler_semi_implicito(
+    posicoes: np.ndarray,
+    velocidades: np.ndarray,
+    t: float,
+    delta_t: float,
+    aceleracao: FuncaoAceleracao,
+    aceleracao_externa: Optional[np.ndarray] = None,
+    aceleracao_inicial: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """
+    Avança um passo com Euler semi-implícito (atualiza a velocidade e depois a posição).
+
+    Os arrays de posições e velocidades são modificados no próprio lugar.
+
+    :param posicoes: Posições dos corpos, shape (N, 3).
+    :param velocidades: Velocidades dos corpos, shape (N, 3).
+    :param t: Tempo de simulação no início do passo (s).
+    :param delta_t: Intervalo de tempo do passo (s).
+    :param aceleracao: Função que calcula a aceleração gravitacional em dadas posições e tempo.
+    :param aceleracao_externa: Aceleração adicional constante durante o passo (ex.: propulsão).
+    :param aceleracao_inicial: Aceleração gravitacional já conhecida no início do passo, se houver.
+    :return: Aceleração gravitacional nas posições finais, ou None se não for calculada.
+    """
+    a = aceleracao_inicial if aceleracao_inicial is not None else aceleracao(posicoes, t)
+    if aceleracao_externa is not None:
+        a = a + aceleracao_externa
+    velocidades += a * delta_t
+    posicoes += velocidades * delta_t
+    return None
+
+
+def passo_leapfrog(
+    posicoes: np.ndarray,
+    velocidades: np.ndarray,
+    t: float,
+    delta_t: float,
+    aceleracao: FuncaoAceleracao,
+    aceleracao_externa: Optional[np.ndarray] = None,
+    aceleracao_inicial: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """
+    Avança um passo com o leapfrog kick-drift-kick (simplético, segunda ordem).
+
+    Reaproveita a aceleração final do passo anterior, de modo que cada passo custa
+    uma única avaliação de forças.
+
+    :param posicoes: Posições dos corpos, shape (N, 3).
+    :param velocidades: Velocidades dos corpos, shape (N, 3).
+    :param t: Tempo de simulação no início do passo (s).
+    :param delta_t: Intervalo de tempo do passo (s).
+    :param aceleracao: Função que calcula a aceleração gravitacional em dadas posições e tempo.
+    :param aceleracao_externa: Aceleração adicional constante durante o passo (ex.: propulsão).
+    :param aceleracao_inicial: Aceleração gravitacional já conhecida no início do passo, se houver.
+    :return: Aceleração gravitacional nas posições finais.
+    """
+    a = aceleracao_inicial if aceleracao_inicial is not None else aceleracao(posicoes, t)
+    velocidades += (a if aceleracao_externa is None else a + aceleracao_externa) * (0.5 * delta_t)
+    posicoes += velocidades * delta_t
+    a = aceleracao(posicoes, t + delta_t)
+    velocidades += (a if aceleracao_externa is None else a + aceleracao_externa) * (0.5 * delta_t)
+    return a
+
+
+def passo_velocity_verlet(
+    posicoes: np.ndarray,
+    velocidades: np.ndarray,
+    t: float,
+    delta_t: float,
+    aceleracao: FuncaoAceleracao,
+    aceleracao_externa: Optional[np.ndarray] = None,
+    aceleracao_inicial: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """
+    Avança um passo com Velocity Verlet na forma de posição:
+    x += v·dt + a·dt²/2 e v += (a0 + a1)·dt/2.
+
+    Em aritmética exata equivale ao leapfrog kick-drift-kick; é mantido para comparação.
+
+    :param posicoes: Posições dos corpos, shape (N, 3).
+    :param velocidades: Velocidades dos corpos, shape (N, 3).
+    :param t: Tempo de simulação no início do passo (s).
+    :param delta_t: Intervalo de tempo do passo (s).
+    :param aceleracao: Função que calcula a aceleração gravitacional em dadas posições e tempo.
+    :param aceleracao_externa: Aceleração adicional constante durante o passo (ex.: propulsão).
+    :param aceleracao_inicial: Aceleração gravitacional já conhecida no início do passo, se houver.
+    :return: Aceleração gravitacional nas posições finais.
+    """
+    a0 = aceleracao_inicial if aceleracao_inicial is not None else aceleracao(posicoes, t)
+    if aceleracao_externa is not None:
+        a0 = a0 + aceleracao_externa
+    posicoes += velocidades * delta_t + a0 * (0.5 * delta_t**2)
+    a1 = aceleracao(posicoes, t + delta_t)
+    total_a1 = a1 + aceleracao_externa if aceleracao_externa is not None else a1
+    velocidades += (a0 + total_a1) * (0.5 * delta_t)
+    return a1
+
+
+def passo_yoshida4(
+    posicoes: np.ndarray,
+    velocidades: np.ndarray,
+    t: float,
+    delta_t: float,
+    aceleracao: FuncaoAceleracao,
+    aceleracao_externa: Optional[np.ndarray] = None,
+    aceleracao_inicial: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """
+    Avança um passo com o integrador simplético de quarta ordem de Yoshida,
+    composto por três subpassos de leapfrog com pesos w1, w0, w1.
+
+    Custa três avaliações de forças por passo.
+
+    :param posicoes: Posições dos corpos, shape (N, 3).
+    :param velocidades: Velocidades dos corpos, shape (N, 3).
+    :param t: Tempo de simulação no início do passo (s).
+    :param delta_t: Intervalo de tempo do passo (s).
+    :param aceleracao: Função que calcula a aceleração gravitacional em dadas posições e tempo.
+    :param aceleracao_externa: Aceleração adicional constante durante o passo (ex.: propulsão).
+    :param aceleracao_inicial: Aceleração gravitacional já conhecida no início do passo, se houver.
+    :return: Aceleração gravitacional nas posições finais.
+    """
+    a = aceleracao_inicial
+    for peso in (_W1, _W0, _W1):
+        a = passo_leapfrog(posicoes, velocidades, t, peso * delta_t, aceleracao, aceleracao_externa, a)
+        t += peso * delta_t
+    return a
+
+
+# Tabela de Butcher de Dormand–Prince 5(4)
+_DP_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_B5 = _DP_A[6] + (0.0,)
+_DP_B4 = (5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40)
+
+
+def passo_rk45(
+    posicoes: np.ndarray,
+    velocidades: np.ndarray,
+    t: float,
+    delta_t: float,
+    aceleracao: FuncaoAceleracao,
+    aceleracao_externa: Optional[np.ndarray] = None,
+    aceleracao_inicial: Optional[np.ndarray] = None,
+    tolerancia: float = 1e-9,
+    max_subpassos: int = 1000,
+    referencias: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """
+    Avança o intervalo delta_t com Runge–Kutta Dormand–Prince 5(4) de passo adaptativo.
+
+    Não é simplético; serve de referência para comparar a precisão dos demais integradores.
+    O erro de cada corpo é medido em relação ao estado relativo ao seu corpo de referência
+    (o atrator dominante), para que um satélite próximo do seu planeta não imponha ao resto
+    uma tolerância na escala de UA. O subpasso nunca fica menor que delta_t / max_subpassos:
+    se a tolerância exigir menos que isso, o subpasso mínimo é aceito mesmo assim e um
+    RuntimeWarning é emitido, de modo que o intervalo é sempre percorrido por inteiro.
+
+    :param posicoes: Posições dos corpos, shape (N, 3).
+    :param velocidades: Velocidades dos corpos, shape (N, 3).
+    :param t: Tempo de simulação no início do passo (s).
+    :param delta_t: Intervalo de tempo do passo (s).
+    :param aceleracao: Função que calcula a aceleração gravitacional em dadas posições e tempo.
+    :param aceleracao_externa: Aceleração adicional constante durante o passo (ex.: propulsão).
+    :param aceleracao_inicial: Ignorado; presente para manter a mesma assinatura.
+    :param tolerancia: Tolerância relativa do erro local por subpasso.
+    :param max_subpassos: Número máximo de subpassos aceitos (define o subpasso mínimo).
+    :param referencias: Índice do corpo de referência de cada corpo, shape (N,); -1 mede o
+        erro em relação à origem. Se None, todos usam a origem.
+    :return: Sempre None.
+    """
+    def derivada(x: np.ndarray, v: np.ndarray, tempo: float):
+        a = aceleracao(x, tempo)
+        if aceleracao_externa is not None:
+            a = a + aceleracao_externa
+        return v, a
+
+    def relativo(valores: np.ndarray) -> np.ndarray:
+        if referencias is None:
+            return valores
+        return valores - np.where(referencias[:, np.newaxis] >= 0, valores[referencias], 0.0)
+
+    def razao(erro: np.ndarray, escala: np.ndarray) -> float:
+        normas = np.linalg.norm(erro, axis=1)
+        return float(np.max(np.divide(normas, escala, out=np.where(normas > 0, np.inf, 0.0), where=escala > 0)))
+
+    x, v = posicoes.copy(), velocidades.copy()
+    restante = delta_t
+    h = delta_t
+    h_minimo = delta_t / max_subpassos
+    forcados = 0
+    # Cada rejeição reduz h ao menos 5x até o mínimo, então o laço sempre termina
+    for _ in range(50 * max_subpassos):
+        if restante <= 0:
+            break
+        h = min(max(h, h_minimo), restante)
+
+        kx, kv = [], []
+        for estagio in range(7):
+            xe = x + h * sum(coef * k for coef, k in zip(_DP_A[estagio], kx))
+            ve = v + h * sum(coef * k for coef, k in zip(_DP_A[estagio], kv))
+            dx, dv = derivada(xe, ve, t + _DP_C[estagio] * h)
+            kx.append(dx)
+            kv.append(dv)
+
+        x5 = x + h * sum(b * k for b, k in zip(_DP_B5, kx))
+        v5 = v + h * sum(b * k for b, k in zip(_DP_B5, kv))
+        erro_x = h * sum((b5 - b4) * k for b5, b4, k in zip(_DP_B5, _DP_B4, kx))
+        erro_v = h * sum((b5 - b4) * k for b5, b4, k in zip(_DP_B5, _DP_B4, kv))
+
+        # Escala de cada corpo: seu estado relativo à referência mais o quanto ele muda no subpasso
+        x_rel = np.linalg.norm(relativo(x5), axis=1)
+        v_rel = np.linalg.norm(relativo(v5), axis=1)
+        a_rel = np.linalg.norm(relativo(kv[0]), axis=1)
+        erro = max(
+            razao(erro_x, tolerancia * (x_rel + h * v_rel)),
+            razao(erro_v, tolerancia * (v_rel + h * a_rel)),
+        )
+
+        if erro <= 1.0 or h <= h_minimo:
+            forcados += erro > 1.0
+            x, v = x5, v5
+            t += h
+            restante -= h
+        h *= min(5.0, max(0.2, 0.9 * (erro if erro > 0 else 1e-10) ** -0.2))
+
+    if restante > 0:
+        raise RuntimeError(f"RK45 não completou o passo: faltaram {restante:.3g} s de {delta_t:.3g} s.")
+    if forcados:
+        warnings.warn(
+            f"RK45: subpassos mínimos de {h_minimo:.3g} s aceitos acima da tolerância {tolerancia:g}.",
+            RuntimeWarning,
+        )
+
+    posicoes[...] = x
+    velocidades[...] = v
+    return None
+
+
+def niveis_blocos(
+    aceleracoes: np.ndarray,
+    jerks: np.ndarray,
+    delta_t: float,
+    eta: float = 0.02,
+    nivel_maximo: int = 12,
+) -> np.ndarray:
+    """
+    Escolhe o nível de passo de cada corpo: o corpo no nível k avança com delta_t / 2^k,
+    o maior passo potência de dois que não excede eta · |a| / |j|.
+
+    :param aceleracoes: Acelerações dos corpos, shape (N, 3).
+    :param jerks: Jerks dos corpos, shape (N, 3).
+    :param delta_t: Passo do bloco mais grosso (s).
+    :param eta: Parâmetro de precisão do critério de passo.
+    :param nivel_maximo: Nível mais fino permitido.
+    :return: Nível de cada corpo, shape (N,).
+    """
+    modulo_a = np.linalg.norm(aceleracoes, axis=1)
+    modulo_j = np.linalg.norm(jerks, axis=1)
+    passos = np.full(len(aceleracoes), np.inf)
+    np.divide(eta * modulo_a, modulo_j, out=passos, where=modulo_j > 0)
+    with np.errstate(divide="ignore"):
+        niveis = np.ceil(np.log2(delta_t / passos))
+    return np.clip(np.nan_to_num(niveis, nan=0.0, neginf=0.0), 0, nivel_maximo).astype(np.int64)
+
+
+def passo_blocos(
+    posicoes: np.ndarray,
+    velocidades: np.ndarray,
+    t: float,
+    delta_t: float,
+    aceleracao: Callable[..., np.ndarray],
+    aceleracao_externa: Optional[np.ndarray] = None,
+    aceleracao_inicial: Optional[np.ndarray] = None,
+    jerk: Optional[Callable[[np.ndarray, np.ndarray, float], np.ndarray]] = None,
+    eta: float = 0.02,
+    nivel_maximo: int = 12,
+) -> Optional[np.ndarray]:
+    """
+    Avança delta_t com passos hierárquicos em blocos de potência de dois.
+
+    Cada corpo recebe um nível a partir da sua aceleração e jerk locais e avança com
+    Velocity Verlet no próprio passo. Só os corpos cujo passo termina no subpasso atual
+    recebem novas avaliações de força; os demais entram no cálculo como fontes, com a
+    posição prevista pela série de Taylor x0 + v0·τ + a0·τ²/2 + j0·τ³/6. Assim um
+    foguete em sobrevoo usa passos de segundos sem encarecer os planetas externos.
+
+    :param posicoes: Posições dos corpos, shape (N, 3).
+    :param velocidades: Velocidades dos corpos, shape (N, 3).
+    :param t: Tempo de simulação no início do passo (s).
+    :param delta_t: Intervalo de tempo do passo (s).
+    :param aceleracao: Função aceleracao(posicoes, t, alvos) que calcula a aceleração
+        gravitacional apenas dos corpos de índices `alvos` (todos, se None).
+    :param aceleracao_externa: Aceleração adicional constante durante o passo (ex.: propulsão).
+    :param aceleracao_inicial: Aceleração gravitacional já conhecida no início do passo, se houver.
+    :param jerk: Função jerk(posicoes, velocidades, t) que calcula o jerk gravitacional de todos os corpos.
+    :param eta: Parâmetro de precisão do critério de passo.
+    :param nivel_maximo: Nível mais fino permitido (passo mínimo delta_t / 2^nivel_maximo).
+    :return: Aceleração gravitacional nas posições finais.
+    """
+    if jerk is None:
+        raise ValueError("O integrador em blocos requer a função de jerk.")
+
+    a = aceleracao_inicial.copy() if aceleracao_inicial is not None else aceleracao(posicoes, t)
+    j = jerk(posicoes, velocidades, t)
+    niveis = niveis_blocos(a, j, delta_t, eta, nivel_maximo)
+
+    subpassos = 1 << int(niveis.max())
+    passo_minimo = delta_t / subpassos
+    passos = delta_t / (2.0 ** niveis)  # Passo de cada corpo (s)
+    periodos = subpassos >> niveis  # Subpassos mínimos por passo de cada corpo
+
+    # Estado de cada corpo no início do seu passo corrente
+    x0, v0 = posicoes.copy(), velocidades.copy()
+    a0 = a.copy() if aceleracao_externa is None else a + aceleracao_externa
+    inicio = np.zeros(len(posicoes), dtype=np.int64)  # Subpasso em que o passo corrente começou
+
+    for s in range(1, subpassos + 1):
+        ativos = np.flatnonzero(s % periodos == 0)
+
+        # Posições previstas de todos os corpos no instante atual
+        tau = ((s - inicio) * passo_minimo)[:, np.newaxis]
+        posicoes[...] = x0 + tau * (v0 + tau * (0.5 * a0 + tau * (j / 6.0)))
+        if len(ativos) == 0:
+            continue
+
+        # Corpos ativos fecham o passo com Velocity Verlet
+        h = passos[ativos][:, np.newaxis]
+        posicoes[ativos] = x0[ativos] + h * (v0[ativos] + 0.5 * h * a0[ativos])
+        a[ativos] = aceleracao(posicoes, t + s * passo_minimo, ativos)
+        a1 = a[ativos] if aceleracao_externa is None else a[ativos] + aceleracao_externa[ativos]
+
+        velocidades[ativos] = v0[ativos] + 0.5 * h * (a0[ativos] + a1)
+        j[ativos] = (a1 - a0[ativos]) / h  # Jerk estimado por diferença finita para a próxima previsão
+        x0[ativos] = posicoes[ativos]
+        v0[ativos] = velocidades[ativos]
+        a0[ativos] = a1
+        inicio[ativos] = s
+
+    return a
+
+
+# Integradores disponíveis, selecionáveis pelo nome
+INTEGRADORES: Dict[str, Callable[..., Optional[np.ndarray]]] = {
+    "euler": passo_euler_semi_implicito,
+    "leapfrog": passo_leapfrog,
+    "verlet": passo_velocity_verlet,
+    "yoshida4": passo_yoshida4,
+    "rk45": passo_rk45,
+    "blocos": passo_blocos,
+}
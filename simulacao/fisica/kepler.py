@@ -0,0 +1,85 @@
+from typing import Optional, Tuple
+import numpy as np
+from simulacao.fisica.gravidade import G
+
+
+def resolver_kepler(anomalia_media: np.ndarray, e: np.ndarray, tolerancia: float = 1e-14, max_iteracoes: int = 50) -> np.ndarray:
+    """
+    Resolve a equação de Kepler M = E - e·sin(E) para órbitas elípticas, de forma vetorizada.
+
+    :param anomalia_media: Anomalias médias M (rad).
+    :param e: Excentricidades (0 <= e < 1), mesmo shape de M ou escalar.
+    :param tolerancia: Tolerância absoluta em E (rad).
+    :param max_iteracoes: Número máximo de iterações de Newton.
+    :return: Anomalias excêntricas E (rad).
+    """
+    M = np.mod(anomalia_media, 2.0 * np.pi)
+    e = np.broadcast_to(e, M.shape)
+    # Chute inicial robusto também para excentricidades altas
+    E = np.where(e < 0.8, M, np.pi)
+    for _ in range(max_iteracoes):
+        correcao = (E - e * np.sin(E) - M) / (1.0 - e * np.cos(E))
+        E = E - correcao
+        if np.all(np.abs(correcao) < tolerancia):
+            break
+    return E
+
+
+class Efemerides:
+    """
+    Conjunto de corpos em órbita kepleriana não perturbada em torno da origem, propagados analiticamente.
+
+    Segue a mesma convenção de CorpoCeleste.calcular_posicao_velocidade: a órbita está no
+    plano XY com o periélio no eixo +X em t = 0 e é inclinada por uma rotação em torno de X.
+    """
+
+    def __init__(self, a: np.ndarray, e: np.ndarray, i_deg: np.ndarray, massa_central: np.ndarray):
+        """
+        Inicializa as efemérides a partir dos elementos orbitais.
+
+        :param a: Semi-eixos maiores (m), shape (K,).
+        :param e: Excentricidades, shape (K,).
+        :param i_deg: Inclinações em graus, shape (K,).
+        :param massa_central: Massas dos corpos centrais em kg, shape (K,).
+        """
+        self.a: np.ndarray = np.asarray(a, dtype=float).reshape(-1)
+        self.e: np.ndarray = np.asarray(e, dtype=float).reshape(-1)
+        if np.any((self.e < 0) | (self.e >= 1)):
+            raise ValueError("As efemérides suportam apenas órbitas elípticas (0 <= e < 1).")
+        i = np.radians(np.asarray(i_deg, dtype=float).reshape(-1))
+        self.cos_i: np.ndarray = np.cos(i)
+        self.sin_i: np.ndarray = np.sin(i)
+        mu = G * np.asarray(massa_central, dtype=float).reshape(-1)
+        self.movimento_medio: np.ndarray = np.sqrt(mu / self.a**3)  # n (rad/s)
+        self.semi_eixo_menor: np.ndarray = self.a * np.sqrt(1.0 - self.e**2)
+        # Último instante calculado; o motor consulta o mesmo t na força e no posicionamento
+        self._ultimo: Optional[Tuple[float, np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.a)
+
+    def estado(self, t: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula posições e velocidades de todos os corpos no instante t, em O(1) por corpo.
+
+        :param t: Tempo de simulação (s), contado a partir da passagem pelo periélio.
+        :return: Tupla com posições e velocidades, shapes (K, 3).
+        """
+        if self._ultimo is not None and self._ultimo[0] == t:
+            return self._ultimo[1], self._ultimo[2]
+
+        E = resolver_kepler(self.movimento_medio * t, self.e)
+        cos_E, sin_E = np.cos(E), np.sin(E)
+        taxa_E = self.movimento_medio / (1.0 - self.e * cos_E)  # dE/dt
+
+        # Coordenadas no plano orbital
+        x = self.a * (cos_E - self.e)
+        y = self.semi_eixo_menor * sin_E
+        vx = -self.a * sin_E * taxa_E
+        vy = self.semi_eixo_menor * cos_E * taxa_E
+
+        # Rotação de inclinação em torno do eixo X
+        posicoes = np.column_stack((x, y * self.cos_i, y * self.sin_i))
+        velocidades = np.column_stack((vx, vy * self.cos_i, vy * self.sin_i))
+        self._ultimo = (t, posicoes, velocidades)
+        return posicoes, velocidades
@@ -0,0 +1,378 @@
+from typing import Callable, Optional, Tuple
+import numpy as np
+
+# Estados (posições e velocidades, shapes (K, 3)) de um corpo em um array de instantes (K,),
+# relativos ao corpo central
+FuncaoEstados = Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+QUATRO_PI2 = 4.0 * np.pi**2  # Limite superior de z em transferências de menos de uma volta
+
+
+def stumpff(z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Funções de Stumpff C(z) e S(z) das variáveis universais, de forma vetorizada.
+
+    Perto de z = 0 as expressões fechadas perdem precisão por cancelamento e são trocadas
+    pelas séries de Taylor.
+
+    :param z: Argumentos (αχ²), qualquer shape.
+    :return: Tupla (C, S), com o shape de z.
+    """
+    z = np.asarray(z, dtype=float)
+    C = np.empty_like(z)
+    S = np.empty_like(z)
+
+    positivo = z > 1e-2
+    negativo = z < -1e-2
+    pequeno = ~(positivo | negativo)
+
+    raiz = np.sqrt(z[positivo])
+    C[positivo] = (1.0 - np.cos(raiz)) / z[positivo]
+    S[positivo] = (raiz - np.sin(raiz)) / raiz**3
+
+    raiz = np.sqrt(-z[negativo])
+    C[negativo] = (np.cosh(raiz) - 1.0) / -z[negativo]
+    S[negativo] = (np.sinh(raiz) - raiz) / raiz**3
+
+    zp = z[pequeno]
+    C[pequeno] = 1.0 / 2.0 - zp * (1.0 / 24.0 - zp * (1.0 / 720.0 - zp / 40320.0))
+    S[pequeno] = 1.0 / 6.0 - zp * (1.0 / 120.0 - zp * (1.0 / 5040.0 - zp / 362880.0))
+    return C, S
+
+
+def resolver_lambert(
+    r1: np.ndarray,
+    r2: np.ndarray,
+    tempo_voo: np.ndarray,
+    mu: float,
+    prograda: bool = True,
+    tolerancia: float = 1e-10,
+    max_iteracoes: int = 60,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resolve o problema de Lambert (menos de uma volta) para muitos casos de uma vez.
+
+    Usa a formulação de variáveis universais (Bate, Mueller & White; Curtis, alg. 5.2): para
+    cada caso, F(z) = 0 é resolvida por Newton protegido por um intervalo [lo, hi] que contém a
+    raiz (F é crescente em z); passos de Newton que saem do intervalo viram bisseção. Todos os
+    casos avançam juntos em operações vetorizadas do NumPy.
+
+    :param r1: Posições de partida relativas ao corpo central, shape (..., 3).
+    :param r2: Posições de chegada relativas ao corpo central, shape (..., 3).
+    :param tempo_voo: Tempos de voo (s), shape (...) compatível com r1 e r2.
+    :param mu: Parâmetro gravitacional do corpo central, G·M (m³/s²).
+    :param prograda: Se True, a transferência gira no sentido anti-horário visto de +Z (o das
+        órbitas da cena); se False, no sentido contrário.
+    :param tolerancia: Tolerância relativa em F (fração de √μ·t).
+    :param max_iteracoes: Número máximo de iterações.
+    :return: Tupla (v1, v2) com as velocidades na partida e na chegada, shape (..., 3); casos
+        sem solução (ângulo de transferência 0 ou 180°, tempo não positivo ou sem convergência)
+        ficam com NaN.
+    """
+    r1 = np.asarray(r1, dtype=float)
+    r2 = np.asarray(r2, dtype=float)
+    tempo_voo = np.asarray(tempo_voo, dtype=float)
+    forma = np.broadcast_shapes(r1.shape[:-1], r2.shape[:-1], tempo_voo.shape)
+    r1 = np.broadcast_to(r1, forma + (3,)).reshape(-1, 3)
+    r2 = np.broadcast_to(r2, forma + (3,)).reshape(-1, 3)
+    t = np.broadcast_to(tempo_voo, forma).reshape(-1)
+
+    with np.errstate(all="ignore"):
+        n1 = np.linalg.norm(r1, axis=1)
+        n2 = np.linalg.norm(r2, axis=1)
+        cos_dtheta = np.clip(np.einsum("ij,ij->i", r1, r2) / (n1 * n2), -1.0, 1.0)
+        cruz_z = r1[:, 0] * r2[:, 1] - r1[:, 1] * r2[:, 0]
+        # Ângulos de transferência acima de 180° têm seno negativo
+        longo = cruz_z < 0 if prograda else cruz_z >= 0
+        sin_dtheta = np.sqrt(1.0 - cos_dtheta**2)
+        sin_dtheta[longo] = -sin_dtheta[longo]
+        A = sin_dtheta * np.sqrt(n1 * n2 / (1.0 - cos_dtheta))
+        raiz_mu_t = np.sqrt(mu) * t
+        validos = (1.0 - cos_dtheta > 1e-12) & (np.abs(A) > 1e-9 * (n1 + n2)) & (t > 0) & np.isfinite(A)
+
+        def avaliar(z):
+            C, S = stumpff(z)
+            y = n1 + n2 + A * (z * S - 1.0) / np.sqrt(C)
+            positivo = y > 0
+            ym = np.where(positivo, y, 1.0)
+            F = (ym / C) ** 1.5 * S + A * np.sqrt(ym) - raiz_mu_t
+            # y < 0 não tem solução: z pequeno demais se A > 0 (y cresce com z), grande demais se A < 0
+            F = np.where(positivo, F, np.where(A > 0, -np.inf, np.inf))
+            return F, ym, C, S
+
+        # Intervalo inicial: hi logo abaixo de 4π² (F → +∞), lo recua até F(lo) < 0 (hiperbólicas)
+        hi = np.full(len(t), QUATRO_PI2 * (1.0 - 1e-9))
+        lo = np.full(len(t), -QUATRO_PI2)
+        for _ in range(60):
+            F_lo, _, _, _ = avaliar(lo)
+            recuar = validos & (F_lo > 0)
+            if not np.any(recuar):
+                break
+            lo[recuar] *= 2.0
+
+        z = np.zeros(len(t))
+        convergiu = np.zeros(len(t), dtype=bool)
+        for _ in range(max_iteracoes):
+            F, y, C, S = avaliar(z)
+            lo = np.where(F < 0, z, lo)
+            hi = np.where(F > 0, z, hi)
+            convergiu = np.abs(F) <= tolerancia * raiz_mu_t
+            if np.all(convergiu | ~validos):
+                break
+
+            # Derivada dF/dz (Curtis, eq. 5.43), com a forma limite perto de z = 0
+            raiz_y = np.sqrt(y)
+            derivada = np.where(
+                np.abs(z) > 1e-6,
+                (y / C) ** 1.5 * ((C - 1.5 * S / C) / (2.0 * z) + 0.75 * S**2 / C)
+                + 0.125 * A * (3.0 * S / C * raiz_y + A * np.sqrt(C / y)),
+                np.sqrt(2.0) / 40.0 * y**1.5 + 0.125 * A * (raiz_y + A * np.sqrt(0.5 / y)),
+            )
+            z_newton = z - F / derivada
+            fora = ~np.isfinite(z_newton) | (z_newton <= lo) | (z_newton >= hi)
+            z = np.where(convergiu, z, np.where(fora, 0.5 * (lo + hi), z_newton))
+
+        # Coeficientes de Lagrange
+        F, y, C, S = avaliar(z)
+        f = 1.0 - y / n1
+        g = A * np.sqrt(y / mu)
+        g_ponto = 1.0 - y / n2
+        v1 = (r2 - f[:, np.newaxis] * r1) / g[:, np.newaxis]
+        v2 = (g_ponto[:, np.newaxis] * r2 - r1) / g[:, np.newaxis]
+
+    falhas = ~(validos & (np.abs(F) <= tolerancia * raiz_mu_t))
+    v1[falhas] = np.nan
+    v2[falhas] = np.nan
+    return v1.reshape(forma + (3,)), v2.reshape(forma + (3,))
+
+
+def propagar_conica(
+    r0: np.ndarray,
+    v0: np.ndarray,
+    tempos: np.ndarray,
+    mu: float,
+    tolerancia: float = 1e-12,
+    max_iteracoes: int = 100,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Propaga um estado no problema de dois corpos para vários instantes (variáveis universais).
+
+    A equação de Kepler universal F(χ) = 0 é crescente em χ (dF/dχ é o raio), então cada
+    instante é resolvido por Newton protegido por um intervalo [lo, hi] que contém a raiz;
+    passos de Newton que saem do intervalo viram bisseção, como em resolver_lambert. Em órbitas
+    elípticas os instantes são reduzidos a um período, o que limita χ a [0, 2π/√α].
+
+    :param r0: Posição inicial relativa ao corpo central, shape (3,).
+    :param v0: Velocidade inicial relativa ao corpo central, shape (3,).
+    :param tempos: Instantes (s) relativos ao estado inicial, shape (K,).
+    :param mu: Parâmetro gravitacional do corpo central (m³/s²).
+    :param tolerancia: Tolerância relativa na anomalia universal χ.
+    :param max_iteracoes: Número máximo de iterações.
+    :return: Tupla (posições, velocidades), shapes (K, 3).
+    :raises RuntimeError: Se algum instante não convergir.
+    """
+    r0 = np.asarray(r0, dtype=float)
+    v0 = np.asarray(v0, dtype=float)
+    tempos = np.asarray(tempos, dtype=float).reshape(-1)
+    n0 = np.linalg.norm(r0)
+    vr0 = np.dot(r0, v0) / n0
+    alfa = 2.0 / n0 - np.dot(v0, v0) / mu  # Inverso do semi-eixo maior
+    raiz_mu = np.sqrt(mu)
+
+    def kepler(chi):
+        z = alfa * chi**2
+        C, S = stumpff(z)
+        F = n0 * vr0 / raiz_mu * chi**2 * C + (1.0 - alfa * n0) * chi**3 * S + n0 * chi - raiz_mu * tempos
+        raio = n0 * vr0 / raiz_mu * chi * (1.0 - z * S) + (1.0 - alfa * n0) * chi**2 * C + n0
+        # Estouro em |χ| grande só acontece além da raiz: conta como F do lado de χ
+        return np.where(np.isnan(F), np.sign(chi) * np.inf, F), raio
+
+    with np.errstate(all="ignore"):
+        if alfa > 0:
+            # Elipse: o estado se repete a cada período, então basta χ de uma volta
+            tempos = np.mod(tempos, 2.0 * np.pi / (raiz_mu * alfa**1.5))
+            lo = np.zeros(len(tempos))
+            hi = np.full(len(tempos), 2.0 * np.pi / np.sqrt(alfa))
+            chi = np.clip(raiz_mu * alfa * tempos, lo, hi)
+        else:
+            # Parábola/hipérbole: dobra o limite até F trocar de sinal
+            limite = np.where(tempos >= 0, 1.0, -1.0) * (raiz_mu * np.abs(tempos) / n0 + 1.0)
+            for _ in range(200):
+                F, _ = kepler(limite)
+                curto = ((tempos >= 0) & (F < 0)) | ((tempos < 0) & (F > 0))
+                if not np.any(curto):
+                    break
+                limite[curto] *= 2.0
+            lo = np.minimum(limite, 0.0)
+            hi = np.maximum(limite, 0.0)
+            chi = raiz_mu * tempos / n0
+
+        # Newton vira bisseção quando sai do intervalo ou não reduz o passo ao menos à metade
+        # (na hipérbole, F cresce como exp(χ√-α) e Newton puro avança devagar demais)
+        convergiu = np.zeros(len(tempos), dtype=bool)
+        passo_anterior = hi - lo
+        for _ in range(max_iteracoes):
+            F, raio = kepler(chi)
+            lo = np.where(F < 0, chi, lo)
+            hi = np.where(F > 0, chi, hi)
+            chi_newton = chi - F / raio
+            bissecao = (
+                ~np.isfinite(chi_newton) | (chi_newton < lo) | (chi_newton > hi)
+                | (np.abs(2.0 * F) > np.abs(passo_anterior * raio))
+            )
+            novo = np.where(F == 0, chi, np.where(bissecao, 0.5 * (lo + hi), chi_newton))
+            passo_anterior = novo - chi
+            convergiu = np.abs(passo_anterior) <= tolerancia * np.maximum(np.abs(novo), 1.0)
+            chi = novo
+            if np.all(convergiu):
+                break
+
+        z = alfa * chi**2
+        C, S = stumpff(z)
+        f = 1.0 - chi**2 / n0 * C
+        g = tempos - chi**3 / raiz_mu * S
+        posicoes = f[:, np.newaxis] * r0 + g[:, np.newaxis] * v0
+        raio = np.linalg.norm(posicoes, axis=1)
+        f_ponto = raiz_mu / (raio * n0) * (z * S - 1.0) * chi
+        g_ponto = 1.0 - chi**2 / raio * C
+        velocidades = f_ponto[:, np.newaxis] * r0 + g_ponto[:, np.newaxis] * v0
+
+    falhas = ~convergiu | ~np.isfinite(posicoes).all(axis=1) | ~np.isfinite(velocidades).all(axis=1)
+    if np.any(falhas):
+        raise RuntimeError(
+            f"Propagação cônica não convergiu em {int(falhas.sum())} de {len(tempos)} instantes."
+        )
+    return posicoes, velocidades
+
+
+def grade_porkchop(
+    estados_origem: FuncaoEstados,
+    estados_destino: FuncaoEstados,
+    tempos_partida: np.ndarray,
+    tempos_voo: np.ndarray,
+    mu: float,
+    prograda: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Avalia a grade "porkchop" de partida × tempo de voo com uma única chamada ao solver de Lambert.
+
+    :param estados_origem: Estados do ponto de partida em função do tempo (ver FuncaoEstados).
+    :param estados_destino: Estados do destino em função do tempo.
+    :param tempos_partida: Instantes de partida (s), shape (P,).
+    :param tempos_voo: Tempos de voo (s), shape (T,).
+    :param mu: Parâmetro gravitacional do corpo central (m³/s²).
+    :param prograda: Sentido da transferência (ver resolver_lambert).
+    :return: Tupla (Δv de partida, Δv de chegada), vetores de shape (P, T, 3): a variação de
+        velocidade para sair da órbita de origem e a necessária para igualar a velocidade do
+        destino na chegada. Casos sem solução ficam com NaN.
+    """
+    tempos_partida = np.asarray(tempos_partida, dtype=float).reshape(-1)
+    tempos_voo = np.asarray(tempos_voo, dtype=float).reshape(-1)
+    r1, v_origem = estados_origem(tempos_partida)
+    tempos_chegada = (tempos_partida[:, np.newaxis] + tempos_voo[np.newaxis, :]).reshape(-1)
+    r2, v_destino = estados_destino(tempos_chegada)
+    forma = (len(tempos_partida), len(tempos_voo), 3)
+    r2 = r2.reshape(forma)
+    v_destino = v_destino.reshape(forma)
+
+    v1, v2 = resolver_lambert(r1[:, np.newaxis, :], r2, tempos_voo[np.newaxis, :], mu, prograda)
+    return v1 - v_origem[:, np.newaxis, :], v_destino - v2
+
+
+class PlanoTransferencia:
+    """
+    Transferência de impulso duplo de mínimo Δv escolhida em uma grade porkchop.
+
+    As posições e velocidades são relativas ao corpo central, e os tempos, ao instante do planejamento.
+    """
+
+    def __init__(
+        self,
+        tempo_partida: float,
+        tempo_voo: float,
+        posicao_partida: np.ndarray,
+        velocidade_partida: np.ndarray,
+        delta_v_partida: np.ndarray,
+        delta_v_chegada: np.ndarray,
+        mu: float,
+    ):
+        """
+        :param tempo_partida: Instante da primeira queima (s).
+        :param tempo_voo: Duração da transferência (s).
+        :param posicao_partida: Posição na primeira queima.
+        :param velocidade_partida: Velocidade logo após a primeira queima (início do arco de Lambert).
+        :param delta_v_partida: Vetor Δv da primeira queima (m/s).
+        :param delta_v_chegada: Vetor Δv da queima de chegada (m/s).
+        :param mu: Parâmetro gravitacional do corpo central (m³/s²).
+        """
+        self.tempo_partida = tempo_partida
+        self.tempo_voo = tempo_voo
+        self.posicao_partida = posicao_partida
+        self.velocidade_partida = velocidade_partida
+        self.delta_v_partida = delta_v_partida
+        self.delta_v_chegada = delta_v_chegada
+        self.mu = mu
+
+    @property
+    def tempo_chegada(self) -> float:
+        return self.tempo_partida + self.tempo_voo
+
+    @property
+    def delta_v(self) -> float:
+        """
+        Δv total das duas queimas (m/s).
+        """
+        return float(np.linalg.norm(self.delta_v_partida) + np.linalg.norm(self.delta_v_chegada))
+
+    def estados_arco(self, tempos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Posições e velocidades ao longo do arco de transferência.
+
+        :param tempos: Instantes (s) contados a partir da primeira queima, shape (K,).
+        :return: Tupla (posições, velocidades), shapes (K, 3).
+        """
+        return propagar_conica(self.posicao_partida, self.velocidade_partida, tempos, self.mu)
+
+
+def planejar_transferencia(
+    estados_origem: FuncaoEstados,
+    estados_destino: FuncaoEstados,
+    tempos_partida: np.ndarray,
+    tempos_voo: np.ndarray,
+    mu: float,
+    igualar_velocidade: bool = True,
+    prograda: bool = True,
+) -> Optional[PlanoTransferencia]:
+    """
+    Escolhe, na grade porkchop, a transferência de menor Δv.
+
+    :param estados_origem: Estados do ponto de partida em função do tempo (ver FuncaoEstados).
+    :param estados_destino: Estados do destino em função do tempo.
+    :param tempos_partida: Instantes de partida candidatos (s), shape (P,).
+    :param tempos_voo: Tempos de voo candidatos (s), shape (T,).
+    :param mu: Parâmetro gravitacional do corpo central (m³/s²).
+    :param igualar_velocidade: Se True, soma o Δv de chegada (encontro com o destino); se False,
+        minimiza só o Δv de partida (interceptação).
+    :param prograda: Sentido da transferência (ver resolver_lambert).
+    :return: Plano de menor Δv, ou None se nenhum caso da grade tiver solução.
+    """
+    tempos_partida = np.asarray(tempos_partida, dtype=float).reshape(-1)
+    tempos_voo = np.asarray(tempos_voo, dtype=float).reshape(-1)
+    dv_partida, dv_chegada = grade_porkchop(estados_origem, estados_destino, tempos_partida, tempos_voo, mu, prograda)
+    custo = np.linalg.norm(dv_partida, axis=2)
+    if igualar_velocidade:
+        custo = custo + np.linalg.norm(dv_chegada, axis=2)
+    if np.all(np.isnan(custo)):
+        return None
+    i, j = np.unravel_index(np.nanargmin(custo), custo.shape)
+
+    r1, v_origem = estados_origem(tempos_partida[i:i + 1])
+    return PlanoTransferencia(
+        tempo_partida=float(tempos_partida[i]),
+        tempo_voo=float(tempos_voo[j]),
+        posicao_partida=r1[0],
+        velocidade_partida=v_origem[0] + dv_partida[i, j],
+        delta_v_partida=dv_partida[i, j],
+        delta_v_chegada=dv_chegada[i, j] if igualar_velocidade else np.zeros(3),
+        mu=mu,
+    )
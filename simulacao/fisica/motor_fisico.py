@@ -1,73 +1,288 @@
-from typing import List
+import warnings
+from typing import List, Optional
 import numpy as np
 from simulacao.objetos.corpo_celeste import CorpoCeleste
-from simulacao.objetos.foguete import Foguete
+from simulacao.fisica.estado_fisico import EstadoFisico
+from simulacao.fisica.gravidade import aceleracoes_diretas, jerks_diretos
+from simulacao.fisica.barnes_hut import aceleracoes_barnes_hut
+from simulacao.fisica.paralelo import AvaliadorParalelo
+from simulacao.fisica.integradores import INTEGRADORES
+
+# Métodos disponíveis para o cálculo da gravidade, selecionáveis pelo nome
+METODOS_GRAVIDADE = ("direto", "barnes_hut", "paralelo")
+
+# Modos de propagação: integração numérica de todos os corpos, ou efemérides keplerianas
+# analíticas para os corpos marcados com "efemeride" e integração apenas dos demais
+MODOS_PROPAGACAO = ("numerica", "efemeride")
 
 class MotorFisico:
     """
     Classe responsável pelos cálculos físicos da simulação.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        metodo_gravidade: str = "direto",
+        theta: float = 0.5,
+        integrador: str = "euler",
+        propagacao: str = "numerica",
+        trabalhadores: Optional[int] = None,
+    ):
         """
         Inicializa o motor físico.
+
+        :param metodo_gravidade: Método de cálculo da gravidade ("direto", "barnes_hut" ou "paralelo",
+            a soma direta dividida entre processos).
+        :param theta: Ângulo de abertura do método de Barnes–Hut.
+        :param integrador: Nome do integrador ("euler", "leapfrog", "verlet", "yoshida4", "rk45" ou "blocos").
+        :param propagacao: Modo de propagação ("numerica" ou "efemeride").
+        :param trabalhadores: Número de processos do método "paralelo" (None = número de CPUs).
+        """
+        if metodo_gravidade not in METODOS_GRAVIDADE:
+            raise ValueError(
+                f"Método de gravidade desconhecido: '{metodo_gravidade}'. Opções: {', '.join(METODOS_GRAVIDADE)}."
+            )
+        if integrador not in INTEGRADORES:
+            raise ValueError(f"Integrador desconhecido: '{integrador}'. Opções: {', '.join(INTEGRADORES)}.")
+        if propagacao not in MODOS_PROPAGACAO:
+            raise ValueError(f"Propagação desconhecida: '{propagacao}'. Opções: {', '.join(MODOS_PROPAGACAO)}.")
+        self.metodo_gravidade: str = metodo_gravidade
+        self.theta: float = theta
+        self.integrador: str = integrador
+        self.propagacao: str = propagacao
+        self.avaliador_paralelo: Optional[AvaliadorParalelo] = (
+            AvaliadorParalelo(trabalhadores) if metodo_gravidade == "paralelo" else None
+        )
+        self.tempo: float = 0.0  # Tempo de simulação decorrido (s)
+        self.estado: Optional[EstadoFisico] = None
+        # Aceleração gravitacional ao fim do último passo, reaproveitada pelos integradores simpléticos
+        self._aceleracao_final: Optional[np.ndarray] = None
+
+        # Subconjunto integrado numericamente (None = todos) e fontes, preparados a cada novo estado
+        self._indices_livres: Optional[np.ndarray] = None
+        self._indices_trilhos: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._fontes_livres: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._fontes_trilhos: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._indices_fontes: np.ndarray = np.zeros(0, dtype=np.int64)
+        # Linhas da frota integradas e a posição de cada foguete no subconjunto integrado
+        self._linhas_frota: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._foguetes_locais: np.ndarray = np.zeros(0, dtype=np.int64)
+
+    def obter_estado(self, corpos: List[CorpoCeleste]) -> EstadoFisico:
+        """
+        Retorna o estado físico contíguo dos corpos, remontando-o se a lista de corpos mudou.
+
+        :param corpos: Lista de corpos celestes na simulação.
+        :return: Estado físico vinculado aos corpos.
+        """
+        if self.estado is None or not self.estado.corresponde(corpos):
+            self.estado = EstadoFisico.de_corpos(corpos)
+            self._aceleracao_final = None
+            self._preparar_propagacao()
+        return self.estado
+
+    def adotar_estado(self, estado: EstadoFisico) -> None:
         """
-        pass  # Pode ser utilizado para inicializar parâmetros futuros
+        Passa a usar um estado já montado (por exemplo, lido de uma cena binária), que pode ter
+        linhas sem objeto correspondente além dos corpos vinculados.
+
+        :param estado: Estado físico com os corpos vinculados em estado.corpos.
+        """
+        self.estado = estado
+        self._aceleracao_final = None
+        self._preparar_propagacao()
+
+    def _preparar_propagacao(self) -> None:
+        """
+        Separa os corpos integrados numericamente dos corpos sobre trilhos e organiza as fontes de gravidade.
+
+        Os índices de fontes são locais: `_fontes_livres` indexa o subconjunto integrado e
+        `_fontes_trilhos` indexa as efemérides; `_indices_fontes` traz os índices globais na mesma ordem.
+        Na propagação por efemérides, uma cena sem corpos marcados com "efemeride" é integrada
+        numericamente por inteiro, com um aviso.
+        """
+        estado = self.estado
+        fontes = estado.indices_fontes
+        if self.propagacao == "efemeride" and not len(estado.indices_efemeride):
+            warnings.warn(
+                'Propagação "efemeride" sem corpos marcados com "efemeride" na cena: '
+                "todos os corpos serão integrados numericamente.",
+                RuntimeWarning,
+            )
+        if self.propagacao == "efemeride" and len(estado.indices_efemeride):
+            self._indices_trilhos = estado.indices_efemeride
+            self._indices_livres = np.setdiff1d(np.arange(len(estado)), self._indices_trilhos)
+            self._fontes_livres = np.flatnonzero(np.isin(self._indices_livres, fontes))
+            self._fontes_trilhos = np.flatnonzero(np.isin(self._indices_trilhos, fontes))
+            self._indices_fontes = np.concatenate(
+                (self._indices_livres[self._fontes_livres], self._indices_trilhos[self._fontes_trilhos])
+            )
+            locais = {int(idx): local for local, idx in enumerate(self._indices_livres)}
+        else:
+            self._indices_trilhos = np.zeros(0, dtype=np.int64)
+            self._indices_livres = None
+            self._fontes_livres = fontes
+            self._fontes_trilhos = np.zeros(0, dtype=np.int64)
+            self._indices_fontes = fontes
+            locais = {idx: idx for idx in range(len(estado))}
+        pares = [(linha, locais[idx]) for linha, idx in enumerate(estado.indices_foguetes) if idx in locais]
+        self._linhas_frota = np.array([linha for linha, _ in pares], dtype=np.int64)
+        self._foguetes_locais = np.array([local for _, local in pares], dtype=np.int64)
 
     def atualizar_corpos(self, corpos: List[CorpoCeleste], delta_t: float) -> None:
         """
-        Atualiza as posições e velocidades dos corpos celestes.
+        Atualiza as posições e velocidades dos corpos celestes com o integrador selecionado.
+
+        Na propagação por efemérides, apenas os corpos livres (foguetes e corpos perturbados)
+        são integrados; os corpos sobre trilhos são posicionados analiticamente.
         """
-        # Calcula as forças resultantes em cada corpo
-        forcas = self.calcular_forcas_gravitacionais(corpos)
+        estado = self.obter_estado(corpos)
+        livres = self._indices_livres
+        if livres is None:
+            posicoes, velocidades = estado.posicoes, estado.velocidades
+        else:
+            posicoes, velocidades = estado.posicoes[livres], estado.velocidades[livres]
 
-        # Atualiza velocidade e posição de cada corpo
-        for idx, (corpo, forca_gravitacional) in enumerate(zip(corpos, forcas)):
-            # Inicializa a aceleração total com a aceleração gravitacional
-            aceleracao_total = forca_gravitacional / corpo.massa
+        # Atualiza a frota (combustível, massa) e coleta a propulsão de todos os foguetes de uma vez
+        propulsao = None
+        if len(self._linhas_frota):
+            propulsao = np.zeros_like(posicoes)
+            propulsao[self._foguetes_locais] = estado.frota.atualizar(delta_t, self._linhas_frota)
 
-            # Verifica se o corpo é um Foguete
-            if isinstance(corpo, Foguete):
-                # Atualiza o estado interno do foguete (combustível, massa, etc.)
-                corpo.atualizar_estado(delta_t)
-                # Adiciona a aceleração devido à propulsão
-                aceleracao_total += corpo.aceleracao_propulsao
+        # Avança posições e velocidades dos corpos integrados
+        opcoes = {}
+        if self.integrador == "blocos":
+            opcoes["jerk"] = self.calcular_jerks
+        elif self.integrador == "rk45":
+            opcoes["referencias"] = self.referencias_dominantes(posicoes)
+        self._aceleracao_final = INTEGRADORES[self.integrador](
+            posicoes,
+            velocidades,
+            self.tempo,
+            delta_t,
+            self.calcular_aceleracoes,
+            aceleracao_externa=propulsao,
+            aceleracao_inicial=self._aceleracao_final,
+            **opcoes,
+        )
+        self.tempo += delta_t
 
-            # Atualiza a velocidade do corpo
-            corpo.velocidade += aceleracao_total * delta_t
+        if livres is not None:
+            estado.posicoes[livres] = posicoes
+            estado.velocidades[livres] = velocidades
+            self.posicionar_efemerides(self.tempo)
 
-            # Atualiza a posição do corpo
-            corpo.atualizar_posicao(delta_t)
+        # Adiciona as novas posições aos rastros
+        for corpo in corpos:
+            corpo.adicionar_ponto_rastro(corpo.posicao)
 
-    def calcular_forcas_gravitacionais(self, corpos: List[CorpoCeleste]) -> List[np.ndarray]:
+    def posicionar_efemerides(self, t: float) -> None:
         """
-        Calcula as forças gravitacionais resultantes em cada corpo.
+        Coloca os corpos sobre trilhos na posição e velocidade keplerianas do instante t.
+
+        :param t: Tempo de simulação (s).
+        """
+        if len(self._indices_trilhos):
+            posicoes, velocidades = self.estado.efemerides.estado(t)
+            self.estado.posicoes[self._indices_trilhos] = posicoes
+            self.estado.velocidades[self._indices_trilhos] = velocidades
+
+    def saltar_para_tempo(self, corpos: List[CorpoCeleste], t: float) -> None:
+        """
+        Salta instantaneamente para o instante t, posicionando analiticamente os corpos sobre trilhos.
+
+        Os corpos integrados numericamente não são avançados; o salto é indicado para cenas
+        em que todos os corpos relevantes seguem efemérides.
 
         :param corpos: Lista de corpos celestes na simulação.
-        :return: Lista de vetores de força para cada corpo.
+        :param t: Tempo de simulação de destino (s).
+        """
+        self.obter_estado(corpos)
+        self.tempo = t
+        self.posicionar_efemerides(t)
+        self._aceleracao_final = None
+
+    def _fontes(self, posicoes: np.ndarray, t: float, velocidades: Optional[np.ndarray] = None):
+        """
+        Monta as fontes de gravidade: corpos massivos integrados (nas posições informadas)
+        e corpos massivos sobre trilhos (nas posições keplerianas do instante t).
+
+        :return: Tupla (posições, velocidades ou None, massas) das fontes.
+        """
+        posicoes_fonte = posicoes[self._fontes_livres]
+        velocidades_fonte = velocidades[self._fontes_livres] if velocidades is not None else None
+        if len(self._fontes_trilhos):
+            posicoes_trilhos, velocidades_trilhos = self.estado.efemerides.estado(t)
+            posicoes_fonte = np.concatenate((posicoes_fonte, posicoes_trilhos[self._fontes_trilhos]))
+            if velocidades is not None:
+                velocidades_fonte = np.concatenate((velocidades_fonte, velocidades_trilhos[self._fontes_trilhos]))
+        return posicoes_fonte, velocidades_fonte, self.estado.massas[self._indices_fontes]
+
+    def _aceleracoes(self, posicoes_alvo: np.ndarray, posicoes_fonte: np.ndarray, massas_fonte: np.ndarray) -> np.ndarray:
+        """
+        Calcula as acelerações dos alvos com o método de gravidade selecionado.
+        """
+        if self.metodo_gravidade == "barnes_hut":
+            return aceleracoes_barnes_hut(posicoes_alvo, posicoes_fonte, massas_fonte, theta=self.theta)
+        if self.metodo_gravidade == "paralelo":
+            return self.avaliador_paralelo.aceleracoes(posicoes_alvo, posicoes_fonte, massas_fonte)
+        return aceleracoes_diretas(posicoes_alvo, posicoes_fonte, massas_fonte)
+
+    def calcular_aceleracoes(self, posicoes: np.ndarray, t: float = 0.0, alvos: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        n = len(corpos)
-        forcas = [np.zeros(3) for _ in range(n)]
+        Calcula as acelerações gravitacionais dos corpos integrados nas posições informadas.
 
-        for i in range(n):
-            for j in range(i + 1, n):
-                corpo_i = corpos[i]
-                corpo_j = corpos[j]
+        Apenas os corpos massivos atuam como fontes; partículas de teste só recebem
+        aceleração, de modo que o custo é O(M·N) para M fontes e N corpos.
 
-                direcao = corpo_j.posicao - corpo_i.posicao
-                distancia = np.linalg.norm(direcao)
-                if distancia == 0:
-                    continue  # Evita divisão por zero
+        :param posicoes: Posições dos corpos integrados (todos, na propagação numérica), shape (N, 3).
+        :param t: Tempo de simulação em que as acelerações são avaliadas (s).
+        :param alvos: Índices dos corpos cujas acelerações devem ser calculadas (todos, se None).
+        :return: Array de acelerações, shape (N, 3) ou (len(alvos), 3).
+        """
+        posicoes_fonte, _, massas_fonte = self._fontes(posicoes, t)
+        posicoes_alvo = posicoes if alvos is None else posicoes[alvos]
+        return self._aceleracoes(posicoes_alvo, posicoes_fonte, massas_fonte)
+
+    def referencias_dominantes(self, posicoes: np.ndarray) -> np.ndarray:
+        """
+        Corpo de referência de cada corpo integrado: a fonte integrada que mais o atrai
+        (maior m/r²), usada pelo RK45 para medir o erro no estado relativo.
 
-                direcao_unitaria = direcao / distancia
+        :param posicoes: Posições dos corpos integrados, shape (N, 3).
+        :return: Índice local da referência de cada corpo, ou -1 (origem) sem fonte integrada, shape (N,).
+        """
+        fontes = self._fontes_livres
+        if len(fontes) == 0:
+            return np.full(len(posicoes), -1, dtype=np.int64)
+        massas = self.estado.massas[self._indices_fontes[:len(fontes)]]
+        distancias2 = np.sum((posicoes[:, np.newaxis, :] - posicoes[fontes][np.newaxis, :, :]) ** 2, axis=-1)
+        with np.errstate(divide="ignore"):
+            atracao = np.where(distancias2 > 0, massas / distancias2, 0.0)
+        referencias = fontes[np.argmax(atracao, axis=1)]
+        # Quem não é atraído por nenhuma outra fonte (ex.: o corpo central) mede o erro na origem
+        return np.where(atracao.max(axis=1) > 0, referencias, -1)
 
-                # Constante gravitacional universal (m^3 kg^-1 s^-2)
-                G = 6.67430e-11
-                forca_magnitude = G * corpo_i.massa * corpo_j.massa / distancia**2
-                forca_vetor = forca_magnitude * direcao_unitaria
+    def calcular_jerks(self, posicoes: np.ndarray, velocidades: np.ndarray, t: float = 0.0) -> np.ndarray:
+        """
+        Calcula o jerk gravitacional dos corpos integrados, usado na escolha dos passos em blocos.
 
-                # Aplica a força nos corpos (ação e reação)
-                forcas[i] += forca_vetor
-                forcas[j] -= forca_vetor
+        :param posicoes: Posições dos corpos integrados, shape (N, 3).
+        :param velocidades: Velocidades dos corpos integrados, shape (N, 3).
+        :param t: Tempo de simulação em que os jerks são avaliados (s).
+        :return: Array de jerks, shape (N, 3).
+        """
+        posicoes_fonte, velocidades_fonte, massas_fonte = self._fontes(posicoes, t, velocidades)
+        return jerks_diretos(posicoes, velocidades, posicoes_fonte, velocidades_fonte, massas_fonte)
 
-        return forcas
+    def calcular_forcas_gravitacionais(self, corpos: List[CorpoCeleste]) -> np.ndarray:
+        """
+        Calcula as forças gravitacionais resultantes em cada corpo.
+
+        :param corpos: Lista de corpos celestes na simulação.
+        :return: Array de vetores de força para cada corpo, shape (N, 3).
+        """
+        estado = self.obter_estado(corpos)
+        fontes = estado.indices_fontes
+        aceleracoes = self._aceleracoes(estado.posicoes, estado.posicoes[fontes], estado.massas[fontes])
+        return estado.massas[:, np.newaxis] * aceleracoes
@@ -0,0 +1,184 @@
+from __future__ import annotations
+import argparse
+import os
+import time
+import weakref
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from simulacao.fisica.gravidade import aceleracoes_diretas
+
+# Blocos de memória compartilhada já abertos em cada processo trabalhador, por nome
+_ANEXOS: Dict[str, SharedMemory] = {}
+
+
+def _anexar(nome: str, forma: Tuple[int, ...]) -> np.ndarray:
+    """
+    Abre (uma única vez por processo) um bloco de memória compartilhada e o expõe como array float64.
+    """
+    memoria = _ANEXOS.get(nome)
+    if memoria is None:
+        memoria = SharedMemory(name=nome)
+        _ANEXOS[nome] = memoria
+    return np.ndarray(forma, dtype=np.float64, buffer=memoria.buf)
+
+
+def _avaliar_faixa(tarefa: Tuple[str, str, str, str, int, int, int, int]) -> None:
+    """
+    Executada nos trabalhadores: calcula as acelerações das linhas [inicio, fim) de alvos
+    contra todas as fontes e escreve o resultado direto na memória compartilhada.
+    """
+    nome_alvos, nome_fontes, nome_massas, nome_saida, n_alvos, n_fontes, inicio, fim = tarefa
+    alvos = _anexar(nome_alvos, (n_alvos, 3))
+    fontes = _anexar(nome_fontes, (n_fontes, 3))
+    massas = _anexar(nome_massas, (n_fontes,))
+    saida = _anexar(nome_saida, (n_alvos, 3))
+    saida[inicio:fim] = aceleracoes_diretas(alvos[inicio:fim], fontes, massas)
+
+
+def _liberar(pool, memorias: List[SharedMemory]) -> None:
+    """
+    Encerra o pool e remove os blocos de memória compartilhada (também chamada na coleta do objeto).
+    """
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+    for memoria in memorias:
+        memoria.close()
+        memoria.unlink()
+
+
+class AvaliadorParalelo:
+    """
+    Soma direta da gravidade distribuída entre vários processos.
+
+    Posições e massas são copiadas para blocos de `multiprocessing.shared_memory`; cada tarefa
+    recebe apenas nomes e uma faixa de linhas (alvos), avalia essa faixa contra todas as fontes
+    (em blocos de colunas, como em aceleracoes_diretas) e escreve as acelerações de volta na
+    memória compartilhada, sem serializar arrays.
+    """
+
+    def __init__(self, trabalhadores: Optional[int] = None, faixas_por_trabalhador: int = 4, pares_minimos: int = 1 << 22):
+        """
+        Inicializa o avaliador. O pool de processos é criado no primeiro uso.
+
+        :param trabalhadores: Número de processos. Se None, usa o número de CPUs.
+        :param faixas_por_trabalhador: Faixas de linhas por processo, para equilibrar a carga.
+        :param pares_minimos: Abaixo deste número de pares (alvo, fonte), a soma é feita no próprio
+            processo, pois o custo de despachar as tarefas supera o ganho.
+        """
+        self.trabalhadores: int = trabalhadores or os.cpu_count() or 1
+        self.faixas_por_trabalhador: int = faixas_por_trabalhador
+        self.pares_minimos: int = pares_minimos
+        self._pool = None
+        self._capacidade_alvos: int = 0
+        self._capacidade_fontes: int = 0
+        self._memorias: Dict[str, SharedMemory] = {}
+        self._finalizador = None
+
+    def _preparar(self, n_alvos: int, n_fontes: int) -> None:
+        """
+        Cria o pool e (re)aloca a memória compartilhada quando a capacidade atual não basta.
+        """
+        if self._pool is not None and n_alvos <= self._capacidade_alvos and n_fontes <= self._capacidade_fontes:
+            return
+        self.fechar()
+        # Folga para que pequenas variações de N não forcem nova alocação
+        self._capacidade_alvos = max(n_alvos, int(1.25 * self._capacidade_alvos))
+        self._capacidade_fontes = max(n_fontes, int(1.25 * self._capacidade_fontes))
+        tamanhos = {
+            "alvos": self._capacidade_alvos * 3,
+            "fontes": self._capacidade_fontes * 3,
+            "massas": self._capacidade_fontes,
+            "saida": self._capacidade_alvos * 3,
+        }
+        self._memorias = {chave: SharedMemory(create=True, size=max(8, 8 * tamanho)) for chave, tamanho in tamanhos.items()}
+        self._pool = get_context("spawn").Pool(self.trabalhadores)
+        self._finalizador = weakref.finalize(self, _liberar, self._pool, list(self._memorias.values()))
+
+    def _array(self, chave: str, forma: Tuple[int, ...]) -> np.ndarray:
+        return np.ndarray(forma, dtype=np.float64, buffer=self._memorias[chave].buf)
+
+    def aceleracoes(self, posicoes_alvo: np.ndarray, posicoes_fonte: np.ndarray, massas_fonte: np.ndarray) -> np.ndarray:
+        """
+        Calcula as mesmas acelerações de aceleracoes_diretas, dividindo os alvos entre os processos.
+
+        :param posicoes_alvo: Posições dos corpos que sofrem a força, shape (N, 3).
+        :param posicoes_fonte: Posições dos corpos que geram o campo, shape (M, 3).
+        :param massas_fonte: Massas das fontes em kg, shape (M,).
+        :return: Acelerações em m/s², shape (N, 3).
+        """
+        n, m = len(posicoes_alvo), len(posicoes_fonte)
+        if n * m < self.pares_minimos:
+            return aceleracoes_diretas(posicoes_alvo, posicoes_fonte, massas_fonte)
+        self._preparar(n, m)
+
+        self._array("alvos", (n, 3))[...] = posicoes_alvo
+        self._array("fontes", (m, 3))[...] = posicoes_fonte
+        self._array("massas", (m,))[...] = massas_fonte
+
+        nomes = tuple(self._memorias[chave].name for chave in ("alvos", "fontes", "massas", "saida"))
+        limites = np.linspace(0, n, min(n, self.trabalhadores * self.faixas_por_trabalhador) + 1).astype(int)
+        tarefas = [(*nomes, n, m, int(inicio), int(fim)) for inicio, fim in zip(limites[:-1], limites[1:]) if fim > inicio]
+        self._pool.map(_avaliar_faixa, tarefas, chunksize=1)
+
+        return self._array("saida", (n, 3)).copy()
+
+    def fechar(self) -> None:
+        """
+        Encerra os processos e libera a memória compartilhada.
+        """
+        if self._finalizador is not None:
+            self._finalizador()
+            self._finalizador = None
+        self._pool = None
+        self._memorias = {}
+
+    def __enter__(self) -> AvaliadorParalelo:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.fechar()
+
+
+def medir_escalabilidade(tamanhos: List[int], trabalhadores: List[int], repeticoes: int = 3) -> None:
+    """
+    Mede o tempo da avaliação paralela para cada N e número de processos e imprime
+    o speedup e a eficiência em relação à soma direta em um único processo.
+
+    :param tamanhos: Valores de N (todos os corpos são alvos e fontes).
+    :param trabalhadores: Números de processos a testar.
+    :param repeticoes: Avaliações por medida (vale o menor tempo).
+    """
+    rng = np.random.default_rng(0)
+    print(f"{'N':>7} {'proc.':>5} {'tempo (s)':>10} {'speedup':>8} {'eficiência':>10}")
+    for n in tamanhos:
+        posicoes = rng.normal(scale=1e11, size=(n, 3))
+        massas = rng.uniform(1e20, 1e25, size=n)
+
+        inicio = time.perf_counter()
+        referencia = aceleracoes_diretas(posicoes, posicoes, massas)
+        tempo_serial = time.perf_counter() - inicio
+        print(f"{n:>7} {'serial':>5} {tempo_serial:>10.3f} {1.0:>8.2f} {1.0:>10.2f}")
+
+        for p in trabalhadores:
+            with AvaliadorParalelo(p) as avaliador:
+                resultado = avaliador.aceleracoes(posicoes, posicoes, massas)  # Aquece o pool
+                tempos = []
+                for _ in range(repeticoes):
+                    inicio = time.perf_counter()
+                    resultado = avaliador.aceleracoes(posicoes, posicoes, massas)
+                    tempos.append(time.perf_counter() - inicio)
+            assert np.allclose(resultado, referencia, rtol=1e-12, atol=0.0)
+            speedup = tempo_serial / min(tempos)
+            print(f"{n:>7} {p:>5} {min(tempos):>10.3f} {speedup:>8.2f} {speedup / p:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mede a escalabilidade da gravidade por soma direta em paralelo.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[2000, 5000, 10000, 20000])
+    parser.add_argument("--trabalhadores", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+    medir_escalabilidade(args.tamanhos, args.trabalhadores, args.repeticoes)
@@ -0,0 +1,153 @@
+from typing import Callable, Optional, Tuple
+import numpy as np
+from simulacao.fisica.gravidade import aceleracoes_diretas
+
+
+class TabelaEfemerides:
+    """
+    Posições e velocidades previstas de um conjunto de corpos, amostradas em instantes regulares.
+
+    A tabela é calculada uma vez (ver `integrar`) e consultada em qualquer instante por
+    interpolação de Hermite cúbica entre as amostras vizinhas, que usa as velocidades
+    amostradas e não exige avançar a física de novo. Os tempos são relativos ao instante em que
+    a tabela foi construída.
+    """
+
+    def __init__(self, passo: float, posicoes: np.ndarray, velocidades: np.ndarray):
+        """
+        :param passo: Intervalo entre amostras (s).
+        :param posicoes: Posições amostradas, shape (S, N, 3); a amostra k corresponde a t = k·passo.
+        :param velocidades: Velocidades amostradas, shape (S, N, 3).
+        """
+        self.passo: float = float(passo)
+        self.posicoes: np.ndarray = posicoes
+        self.velocidades: np.ndarray = velocidades
+
+    @property
+    def duracao(self) -> float:
+        """
+        Último instante coberto pela tabela (s).
+        """
+        return (len(self.posicoes) - 1) * self.passo
+
+    @classmethod
+    def integrar(
+        cls,
+        posicoes: np.ndarray,
+        velocidades: np.ndarray,
+        massas: np.ndarray,
+        indices_fontes: np.ndarray,
+        passo: float,
+        duracao_maxima: float,
+        parar: Optional[Callable[[float, np.ndarray], bool]] = None,
+        subpassos: int = 1,
+    ) -> "TabelaEfemerides":
+        """
+        Constrói a tabela integrando os corpos com leapfrog (KDK), amostrando a cada `passo`.
+
+        :param posicoes: Posições iniciais, shape (N, 3).
+        :param velocidades: Velocidades iniciais, shape (N, 3).
+        :param massas: Massas, shape (N,).
+        :param indices_fontes: Índices dos corpos que geram gravidade; os demais só a sofrem.
+        :param passo: Intervalo entre amostras (s).
+        :param duracao_maxima: Tempo máximo coberto pela tabela (s).
+        :param parar: Chamada após cada amostra com (t, posições); se retornar True, a integração termina.
+        :param subpassos: Passos de integração por amostra (o passo de integração é passo / subpassos).
+        :return: Tabela com as amostras de t = 0 até o fim da integração.
+        """
+        posicoes = np.array(posicoes, dtype=float)
+        velocidades = np.array(velocidades, dtype=float)
+        massas_fonte = np.asarray(massas, dtype=float)[indices_fontes]
+        amostras_p = [posicoes.copy()]
+        amostras_v = [velocidades.copy()]
+
+        delta_t = passo / subpassos
+        aceleracoes = aceleracoes_diretas(posicoes, posicoes[indices_fontes], massas_fonte)
+        for k in range(1, int(np.ceil(duracao_maxima / passo)) + 1):
+            for _ in range(subpassos):
+                velocidades += 0.5 * delta_t * aceleracoes
+                posicoes += delta_t * velocidades
+                aceleracoes = aceleracoes_diretas(posicoes, posicoes[indices_fontes], massas_fonte)
+                velocidades += 0.5 * delta_t * aceleracoes
+            amostras_p.append(posicoes.copy())
+            amostras_v.append(velocidades.copy())
+            if parar is not None and parar(k * passo, posicoes):
+                break
+        return cls(passo, np.array(amostras_p), np.array(amostras_v))
+
+    def _intervalo(self, t: float):
+        """
+        Índice da amostra inicial do intervalo que contém t e a posição relativa s ∈ [0, 1] nele.
+        Fora da tabela, s sai de [0, 1] e a interpolação vira extrapolação linear.
+        """
+        ultimo = len(self.posicoes) - 1
+        if ultimo == 0:
+            return 0, 0.0
+        k = min(max(int(t // self.passo), 0), ultimo - 1)
+        return k, t / self.passo - k
+
+    def posicoes_em(self, t: float, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Posições interpoladas no instante t.
+
+        :param t: Instante (s) relativo à construção da tabela.
+        :param indices: Corpos consultados (padrão: todos).
+        :return: Posições, shape (N, 3) (ou (len(indices), 3)).
+        """
+        k, s = self._intervalo(t)
+        selecao = slice(None) if indices is None else indices
+        p0 = self.posicoes[k, selecao]
+        v0 = self.velocidades[k, selecao]
+        if len(self.posicoes) == 1:
+            return p0 + t * v0
+        p1 = self.posicoes[k + 1, selecao]
+        v1 = self.velocidades[k + 1, selecao]
+        if s < 0.0:
+            return p0 + (s * self.passo) * v0
+        if s > 1.0:
+            return p1 + ((s - 1.0) * self.passo) * v1
+        # Bases de Hermite cúbica
+        s2, s3 = s * s, s * s * s
+        h00 = 2 * s3 - 3 * s2 + 1
+        h10 = s3 - 2 * s2 + s
+        h01 = -2 * s3 + 3 * s2
+        h11 = s3 - s2
+        return h00 * p0 + (h10 * self.passo) * v0 + h01 * p1 + (h11 * self.passo) * v1
+
+    def estados_em(self, tempos: np.ndarray, indice: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Posições e velocidades interpoladas de um corpo em vários instantes de uma vez.
+
+        A velocidade é a derivada do mesmo polinômio de Hermite usado nas posições.
+
+        :param tempos: Instantes (s) relativos à construção da tabela, shape (K,).
+        :param indice: Corpo consultado.
+        :return: Tupla (posições, velocidades), shapes (K, 3).
+        """
+        tempos = np.asarray(tempos, dtype=float).reshape(-1)
+        ultimo = len(self.posicoes) - 1
+        if ultimo == 0:
+            p0, v0 = self.posicoes[0, indice], self.velocidades[0, indice]
+            return p0 + tempos[:, np.newaxis] * v0, np.broadcast_to(v0, (len(tempos), 3)).copy()
+
+        k = np.clip((tempos // self.passo).astype(int), 0, ultimo - 1)
+        s = (tempos / self.passo - k)[:, np.newaxis]
+        p0, v0 = self.posicoes[k, indice], self.velocidades[k, indice]
+        p1, v1 = self.posicoes[k + 1, indice], self.velocidades[k + 1, indice]
+        sc = np.clip(s, 0.0, 1.0)
+        s2, s3 = sc * sc, sc * sc * sc
+        posicoes = (
+            (2 * s3 - 3 * s2 + 1) * p0 + ((s3 - 2 * s2 + sc) * self.passo) * v0
+            + (-2 * s3 + 3 * s2) * p1 + ((s3 - s2) * self.passo) * v1
+        )
+        velocidades = (
+            (6 * s2 - 6 * sc) / self.passo * (p0 - p1)
+            + (3 * s2 - 4 * sc + 1) * v0 + (3 * s2 - 2 * sc) * v1
+        )
+        # Fora da tabela: extrapolação linear a partir da amostra da ponta
+        antes, depois = s[:, 0] < 0.0, s[:, 0] > 1.0
+        posicoes[antes] = p0[antes] + (s[antes] * self.passo) * v0[antes]
+        velocidades[antes] = v0[antes]
+        posicoes[depois] = p1[depois] + ((s[depois] - 1.0) * self.passo) * v1[depois]
+        velocidades[depois] = v1[depois]
+        return posicoes, velocidades
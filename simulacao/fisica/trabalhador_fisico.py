@@ -0,0 +1,294 @@
+from __future__ import annotations
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+import numpy as np
+from simulacao.objetos.corpo_celeste import CorpoCeleste
+from simulacao.fisica.motor_fisico import MotorFisico
+
+# Leituras de um buffer em escrita: as primeiras só cedem a GIL; as seguintes dormem ESPERA_LEITURA (s)
+TENTATIVAS_SEM_ESPERA = 8
+ESPERA_LEITURA = 1e-4
+
+
+class InstantaneoFisico:
+    """
+    Cópia do estado da simulação publicada para o desenho e para os controles: posições dos dois
+    últimos passos físicos (para interpolação), velocidades, orientações, o total de pontos de
+    rastro, o ponto mais recente, a âncora e a geração de cada rastro, em arrays pré-alocados.
+
+    Os rastros não são copiados inteiros: os pontos fixos não mudam, e o desenho os lê
+    diretamente do buffer circular de cada corpo até o total publicado. Só o ponto mais recente,
+    que a física reescreve enquanto é provisório, vem copiado aqui; os pontos antigos que a
+    física sobrescreve ao dar a volta no buffer não são desenhados (ver RastroGPU.desenhar).
+    Os pontos são relativos à âncora publicada; uma geração diferente da copiada para a GPU
+    indica que a física reancorou o rastro e regravou todos os pontos.
+    """
+
+    def __init__(self, num_corpos: int):
+        """
+        Aloca os arrays do instantâneo.
+
+        :param num_corpos: Número de corpos na simulação.
+        """
+        # Contador de sequência: ímpar enquanto o buffer está sendo escrito
+        self.versao: int = 0
+        self.tempo: float = 0.0  # Tempo de simulação do estado atual (s)
+        self.acumulador: float = 0.0  # Tempo simulado já decorrido além do estado atual (s)
+        self.relogio: float = 0.0  # Instante real (perf_counter) da publicação
+        self.escala_tempo: float = 0.0  # Segundos simulados por segundo real no momento da publicação
+        self.posicoes_anteriores: np.ndarray = np.zeros((num_corpos, 3))
+        self.posicoes: np.ndarray = np.zeros((num_corpos, 3))
+        self.velocidades: np.ndarray = np.zeros((num_corpos, 3))
+        self.orientacoes: np.ndarray = np.zeros((num_corpos, 3))
+        self.totais_rastro: np.ndarray = np.zeros(num_corpos, dtype=np.int64)
+        self.ultimos_rastro: np.ndarray = np.zeros((num_corpos, 3), dtype=np.float32)
+        self.ancoras_rastro: np.ndarray = np.zeros((num_corpos, 3))
+        self.geracoes_rastro: np.ndarray = np.zeros(num_corpos, dtype=np.int64)
+
+    def copiar_de(self, outro: InstantaneoFisico) -> None:
+        """
+        Copia o conteúdo de outro instantâneo com o mesmo formato, sem alocar memória.
+
+        :param outro: Instantâneo de origem.
+        """
+        self.tempo = outro.tempo
+        self.acumulador = outro.acumulador
+        self.relogio = outro.relogio
+        self.escala_tempo = outro.escala_tempo
+        np.copyto(self.posicoes_anteriores, outro.posicoes_anteriores)
+        np.copyto(self.posicoes, outro.posicoes)
+        np.copyto(self.velocidades, outro.velocidades)
+        np.copyto(self.orientacoes, outro.orientacoes)
+        np.copyto(self.totais_rastro, outro.totais_rastro)
+        np.copyto(self.ultimos_rastro, outro.ultimos_rastro)
+        np.copyto(self.ancoras_rastro, outro.ancoras_rastro)
+        np.copyto(self.geracoes_rastro, outro.geracoes_rastro)
+
+
+class TrabalhadorFisico:
+    """
+    Avança a física em passos fixos e publica instantâneos do estado em buffer duplo.
+
+    Pode rodar em uma thread própria (iniciar/parar), em ritmo independente do desenho, ou ser
+    avançado de forma síncrona pelo laço principal (avancar). O desenho lê o último instantâneo
+    completo com ler_instantaneo, sem travas: cada buffer tem um contador de sequência
+    (seqlock) e a leitura é repetida se o buffer for reescrito durante a cópia.
+
+    O laço principal não escreve no estado físico: comandos de propulsão e orientação dos
+    foguetes são enfileirados com enviar_comando e aplicados por este trabalhador entre passos.
+    """
+
+    def __init__(
+        self,
+        motor_fisico: MotorFisico,
+        corpos: List[CorpoCeleste],
+        delta_t_fisica: float = 3600.0,
+        escala_tempo: float = 3600.0 * 60,
+        max_passos_por_quadro: int = 512,
+        max_delta_t_real: float = 0.25,
+        taxa_publicacao: float = 120.0,
+    ):
+        """
+        Inicializa o trabalhador.
+
+        :param motor_fisico: Motor físico usado para avançar os corpos (acessado apenas por este trabalhador).
+        :param corpos: Lista de corpos celestes da simulação; não deve mudar enquanto o trabalhador roda.
+        :param delta_t_fisica: Passo físico fixo (s simulados).
+        :param escala_tempo: Segundos simulados por segundo real, antes do fator de aceleração.
+        :param max_passos_por_quadro: Máximo de passos por avanço; o excesso de tempo é descartado.
+        :param max_delta_t_real: Maior intervalo real considerado em um avanço (s).
+        :param taxa_publicacao: Frequência máxima de publicação durante lotes longos de passos (Hz).
+        """
+        self.motor_fisico = motor_fisico
+        self.corpos = corpos
+        self.delta_t_fisica = delta_t_fisica
+        self.escala_tempo = escala_tempo
+        self.max_passos_por_quadro = max_passos_por_quadro
+        self.max_delta_t_real = max_delta_t_real
+        self.intervalo_publicacao = 1.0 / taxa_publicacao
+        self.acumulador = 0.0
+
+        # Controles escritos pelo laço principal e lidos pela thread (atribuições simples, atômicas)
+        self.fator_tempo: float = 1.0
+        self.pausado: bool = False
+        # Comandos do laço principal (append e popleft de deque são atômicos)
+        self._comandos: Deque[Tuple[Callable, tuple]] = deque()
+
+        self._buffers = [InstantaneoFisico(len(corpos)) for _ in range(2)]
+        self._publicado = 0
+        self._posicoes_anteriores = np.zeros((len(corpos), 3))
+        self._thread: Optional[threading.Thread] = None
+        self._executando = False
+
+        estado = self.motor_fisico.obter_estado(self.corpos)
+        np.copyto(self._posicoes_anteriores, estado.posicoes)
+        self.publicar()
+
+    def criar_instantaneo(self) -> InstantaneoFisico:
+        """
+        Cria um instantâneo vazio com o formato dos buffers, para ser preenchido por ler_instantaneo.
+        """
+        return InstantaneoFisico(len(self.corpos))
+
+    def enviar_comando(self, funcao: Callable, *args) -> None:
+        """
+        Enfileira uma chamada que altera o estado físico (por exemplo, Foguete.girar ou
+        Foguete.ativar_propulsao), para ser executada pelo trabalhador antes do próximo passo.
+
+        :param funcao: Função ou método a chamar.
+        :param args: Argumentos da chamada.
+        """
+        self._comandos.append((funcao, args))
+
+    def _aplicar_comandos(self) -> int:
+        """
+        Executa, em ordem, os comandos enfileirados até agora.
+
+        :return: Número de comandos executados.
+        """
+        aplicados = 0
+        while self._comandos:
+            funcao, args = self._comandos.popleft()
+            funcao(*args)
+            aplicados += 1
+        return aplicados
+
+    def avancar(self, delta_t_real: float) -> int:
+        """
+        Acumula o tempo real decorrido e executa os passos físicos fixos correspondentes,
+        publicando um instantâneo ao final.
+
+        :param delta_t_real: Tempo real decorrido desde o último avanço (s).
+        :return: Número de passos físicos executados.
+        """
+        aplicados = self._aplicar_comandos()
+        if self.pausado:
+            # Republica com escala nula para o desenho congelar a interpolação (e mostrar os comandos)
+            if aplicados or self._buffers[self._publicado].escala_tempo != 0.0:
+                self.publicar()
+            return 0
+
+        delta_t_real = min(delta_t_real, self.max_delta_t_real)
+        self.acumulador += delta_t_real * self.escala_tempo * self.fator_tempo
+
+        passos = int(self.acumulador // self.delta_t_fisica)
+        if passos > self.max_passos_por_quadro:
+            # A física não acompanha a escala pedida: descarta o excesso em vez de acumular atraso
+            passos = self.max_passos_por_quadro
+            self.acumulador = passos * self.delta_t_fisica
+
+        ultima_publicacao = time.perf_counter()
+        for passo in range(passos):
+            if passo:
+                self._aplicar_comandos()
+            estado = self.motor_fisico.obter_estado(self.corpos)
+            np.copyto(self._posicoes_anteriores, estado.posicoes)
+            self.motor_fisico.atualizar_corpos(self.corpos, self.delta_t_fisica)
+            self.acumulador -= self.delta_t_fisica
+            # Em lotes longos, publica no meio para o desenho não ficar parado
+            if passo < passos - 1 and time.perf_counter() - ultima_publicacao >= self.intervalo_publicacao:
+                self.publicar()
+                ultima_publicacao = time.perf_counter()
+
+        if passos or aplicados:
+            self.publicar()
+        return passos
+
+    def publicar(self) -> None:
+        """
+        Escreve o estado atual no buffer que não está publicado e o torna o buffer publicado.
+        """
+        indice = 1 - self._publicado
+        buffer = self._buffers[indice]
+        buffer.versao += 1  # Ímpar: escrita em andamento
+
+        estado = self.motor_fisico.obter_estado(self.corpos)
+        buffer.tempo = self.motor_fisico.tempo
+        buffer.acumulador = self.acumulador
+        buffer.relogio = time.perf_counter()
+        buffer.escala_tempo = 0.0 if self.pausado else self.escala_tempo * self.fator_tempo
+        np.copyto(buffer.posicoes_anteriores, self._posicoes_anteriores)
+        np.copyto(buffer.posicoes, estado.posicoes)
+        np.copyto(buffer.velocidades, estado.velocidades)
+        if estado.frota is not None:
+            buffer.orientacoes[estado.indices_foguetes] = estado.frota.angulos_euler()
+        for idx, corpo in enumerate(self.corpos):
+            rastro = corpo.rastro
+            buffer.totais_rastro[idx] = rastro.total
+            buffer.ancoras_rastro[idx] = rastro.ancora
+            buffer.geracoes_rastro[idx] = rastro.geracao
+            if rastro.total:
+                buffer.ultimos_rastro[idx] = rastro.pontos[(rastro.total - 1) % rastro.capacidade]
+
+        buffer.versao += 1  # Par: buffer completo
+        self._publicado = indice
+
+    def ler_instantaneo(self, destino: InstantaneoFisico) -> InstantaneoFisico:
+        """
+        Copia o último instantâneo completo para `destino`, sem bloquear a física.
+
+        Se o buffer estiver sendo escrito, cede a GIL (e, após algumas tentativas, dorme) antes de
+        tentar de novo, para não disputar o processador com a própria escrita que espera.
+
+        :param destino: Instantâneo do leitor, criado com criar_instantaneo.
+        :return: O próprio `destino`, preenchido.
+        """
+        tentativas = 0
+        while True:
+            buffer = self._buffers[self._publicado]
+            versao = buffer.versao
+            if versao % 2 == 0:
+                destino.copiar_de(buffer)
+                if buffer.versao == versao:
+                    return destino
+            tentativas += 1
+            time.sleep(0.0 if tentativas < TENTATIVAS_SEM_ESPERA else ESPERA_LEITURA)
+
+    def alfa(self, instantaneo: InstantaneoFisico) -> float:
+        """
+        Fração do passo físico seguinte já decorrida, usada para interpolar o desenho.
+
+        Inclui o tempo real passado desde a publicação, de modo que a interpolação continua
+        avançando suavemente mesmo quando a física publica com menos frequência que o desenho.
+
+        :param instantaneo: Instantâneo lido com ler_instantaneo.
+        :return: Valor entre 0 e 1.
+        """
+        decorrido = (time.perf_counter() - instantaneo.relogio) * instantaneo.escala_tempo
+        return min((instantaneo.acumulador + decorrido) / self.delta_t_fisica, 1.0)
+
+    def iniciar(self) -> None:
+        """
+        Inicia a thread da física, que avança em ritmo próprio até parar() ser chamado.
+        """
+        if self._thread is not None:
+            return
+        self._executando = True
+        self._thread = threading.Thread(target=self._executar, name="TrabalhadorFisico", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        """
+        Sinaliza a thread da física para terminar e aguarda seu término.
+        """
+        self._executando = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _executar(self) -> None:
+        """
+        Laço da thread da física: avança pelo tempo real decorrido e dorme até o próximo passo.
+        """
+        anterior = time.perf_counter()
+        while self._executando:
+            agora = time.perf_counter()
+            self.avancar(agora - anterior)
+            anterior = agora
+
+            # Dorme até o próximo passo ser devido (libera a GIL para o desenho)
+            taxa = 0.0 if self.pausado else self.escala_tempo * self.fator_tempo
+            espera = (self.delta_t_fisica - self.acumulador) / taxa if taxa > 0 else self.intervalo_publicacao
+            time.sleep(min(max(espera, 0.0), self.intervalo_publicacao))
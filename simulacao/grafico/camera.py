@@ -1,59 +1,159 @@
+from typing import Optional, Tuple
 import numpy as np
 from OpenGL.GL import *
-from OpenGL.GLU import *
+
+
+def matriz_rotacao(angulo: float, eixo: int) -> np.ndarray:
+    """
+    Matriz 3×3 de rotação em torno de um eixo coordenado, equivalente a glRotate.
+
+    :param angulo: Ângulo em graus.
+    :param eixo: Índice do eixo (0 = X, 1 = Y, 2 = Z).
+    :return: Matriz de rotação (np.ndarray).
+    """
+    c, s = np.cos(np.radians(angulo)), np.sin(np.radians(angulo))
+    i, j = (eixo + 1) % 3, (eixo + 2) % 3  # Ordem cíclica mantém o sentido da rotação
+    rotacao = np.eye(3)
+    rotacao[i, i], rotacao[i, j], rotacao[j, i], rotacao[j, j] = c, -s, s, c
+    return rotacao
+
+
+def matriz_olhar(posicao: np.ndarray, alvo: np.ndarray, cima: np.ndarray) -> np.ndarray:
+    """
+    Parte rotacional da matriz de gluLookAt: leva direções do mundo para o referencial do olho.
+
+    :param posicao: Posição do olho.
+    :param alvo: Ponto observado.
+    :param cima: Vetor "up" aproximado.
+    :return: Matriz 3×3 (linhas: direita, cima e trás do olho).
+    """
+    frente = alvo - posicao
+    frente = frente / np.linalg.norm(frente)
+    direita = np.cross(frente, cima)
+    direita = direita / np.linalg.norm(direita)
+    return np.array([direita, np.cross(direita, frente), -frente])
+
+
+def matriz_perspectiva(campo_visao: float, aspecto: float, proximo: float, distante: float) -> np.ndarray:
+    """
+    Matriz de projeção 4×4 (convenção de coluna), equivalente a gluPerspective.
+
+    :param campo_visao: Campo de visão vertical, em graus.
+    :param aspecto: Razão largura/altura.
+    :param proximo: Distância do plano de recorte próximo.
+    :param distante: Distância do plano de recorte distante.
+    """
+    f = 1.0 / np.tan(np.radians(campo_visao) / 2.0)
+    return np.array([
+        [f / aspecto, 0.0, 0.0, 0.0],
+        [0.0, f, 0.0, 0.0],
+        [0.0, 0.0, (distante + proximo) / (proximo - distante), 2.0 * distante * proximo / (proximo - distante)],
+        [0.0, 0.0, -1.0, 0.0],
+    ])
+
 
 class Camera:
-    def __init__(self, posicao: np.ndarray = np.array([0.0, 0.0, 0.0]), alvo: np.ndarray = np.array([0.0, 0.0, 0.0]), rotacao: np.ndarray = np.array([0.0, 0.0, 0.0])):
-        self.posicao = posicao
-        self.alvo = alvo
-        self.rotacao = rotacao
+    """
+    Câmera da simulação.
 
-    def atualizar(self) -> None:
+    A matriz de visão é calculada em float64 com NumPy e mantida em cache até a pose mudar.
+    O desenho usa origem flutuante: a matriz carregada no OpenGL contém só a rotação, e as
+    posições são passadas relativas à câmera (ver MotorGrafico.aplicar_camera), de modo que a
+    precisão float32 da GPU fica concentrada perto do observador, e não perto do Sol.
+    """
+
+    def __init__(self, posicao: Optional[np.ndarray] = None, alvo: Optional[np.ndarray] = None, rotacao: Optional[np.ndarray] = None):
         """
-        Aplica a rotação e posição da câmera para a cena.
+        :param posicao: Posição do olho no mundo (m). Padrão: origem.
+        :param alvo: Ponto observado (m). Padrão: origem.
+        :param rotacao: Rotações (graus) em torno de X, Y e Z aplicadas após o "olhar para".
         """
-        glLoadIdentity()
+        self.posicao = np.zeros(3) if posicao is None else np.array(posicao, dtype=float)
+        self.alvo = np.zeros(3) if alvo is None else np.array(alvo, dtype=float)
+        self.rotacao = np.zeros(3) if rotacao is None else np.array(rotacao, dtype=float)
 
-        # Aplica as rotações da câmera
-        glRotatef(self.rotacao[0], 1.0, 0.0, 0.0)  # Rotação em torno do eixo X
-        glRotatef(self.rotacao[1], 0.0, 1.0, 0.0)  # Rotação em torno do eixo Y
-        glRotatef(self.rotacao[2], 0.0, 0.0, 1.0)  # Rotação em torno do eixo Z
+        # Pose usada no último cálculo; posição, alvo e rotação podem ser alterados no lugar
+        self._pose: Optional[np.ndarray] = None
+        self._rotacao_visao: np.ndarray = np.eye(3)
+        self._matriz_relativa: np.ndarray = np.eye(4)
+        self._angulos_direcoes: Optional[Tuple[float, float]] = None
+        self._direcoes: Tuple[np.ndarray, np.ndarray, np.ndarray] = (np.zeros(3), np.zeros(3), np.zeros(3))
 
-        # Define a câmera
-        gluLookAt(
-            self.posicao[0], self.posicao[1], self.posicao[2],
-            self.alvo[0], self.alvo[1], self.alvo[2],
-            0.0, 1.0, 0.0  # Vetor "up" fixo
+    def _atualizar_cache(self) -> None:
+        pose = np.concatenate((self.posicao, self.alvo, self.rotacao))
+        if self._pose is not None and np.array_equal(pose, self._pose):
+            return
+        self._pose = pose
+        # Mesma composição das chamadas glRotatef(X), glRotatef(Y), glRotatef(Z) seguidas de gluLookAt
+        self._rotacao_visao = (
+            matriz_rotacao(self.rotacao[0], 0)
+            @ matriz_rotacao(self.rotacao[1], 1)
+            @ matriz_rotacao(self.rotacao[2], 2)
+            @ matriz_olhar(self.posicao, self.alvo, np.array([0.0, 1.0, 0.0]))
         )
+        self._matriz_relativa = np.eye(4)
+        self._matriz_relativa[:3, :3] = self._rotacao_visao
 
-    def mover_camera_relativo(self, movimento: np.ndarray) -> None:
+    def matriz_visao_relativa(self) -> np.ndarray:
         """
-        Move a câmera em relação à sua orientação atual (frente, trás, esquerda, direita).
+        Matriz de visão 4×4 (convenção de coluna) para posições relativas à câmera: só rotação.
+        """
+        self._atualizar_cache()
+        return self._matriz_relativa
 
-        :param movimento: O vetor de movimento no espaço local da câmera (x, y, z).
+    def matriz_visao(self) -> np.ndarray:
         """
-        # Converte os ângulos de rotação da câmera em uma matriz de rotação
-        yaw = np.radians(self.rotacao[1])  # Rotação em torno do eixo Y (esquerda/direita)
-        pitch = np.radians(self.rotacao[0])  # Rotação em torno do eixo X (para cima/baixo)
+        Matriz de visão 4×4 completa, em coordenadas do mundo (float64).
+        """
+        self._atualizar_cache()
+        matriz = self._matriz_relativa.copy()
+        matriz[:3, 3] = -self._rotacao_visao @ self.posicao
+        return matriz
 
-        # Vetor "frente" da câmera baseado na rotação
-        direcao_frente = np.array([
-            np.cos(pitch) * np.sin(yaw),
-            np.sin(pitch),
-            np.cos(pitch) * np.cos(yaw)
-        ])
+    def atualizar(self) -> None:
+        """
+        Carrega a matriz de visão relativa à câmera no OpenGL, com uma única chamada.
+        """
+        glMatrixMode(GL_MODELVIEW)
+        glLoadMatrixd(self.matriz_visao_relativa().T)
 
-        # Vetor "direita" da câmera baseado na rotação
-        direcao_direita = np.array([
-            np.cos(yaw),
-            0.0,
-            -np.sin(yaw)
-        ])
+    def mover_camera_relativo(self, movimento: np.ndarray) -> None:
+        """
+        Move a câmera em relação à sua orientação atual (frente, trás, esquerda, direita).
 
-        # Vetor "cima" é o vetor cruzado entre "direita" e "frente"
-        direcao_cima = np.cross(direcao_direita, direcao_frente)
+        :param movimento: O vetor de movimento no espaço local da câmera (x, y, z).
+        """
+        direcao_direita, direcao_cima, direcao_frente = self._direcoes_locais()
 
         # Aplica o movimento relativo às direções da câmera
         self.posicao += movimento[0] * direcao_direita  # Movimento no eixo X
         self.posicao += movimento[1] * direcao_cima     # Movimento no eixo Y
         self.posicao += movimento[2] * direcao_frente   # Movimento no eixo Z
+
+    def _direcoes_locais(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Direções direita, cima e frente derivadas do yaw e do pitch, recalculadas só quando mudam.
+        """
+        angulos = (float(self.rotacao[0]), float(self.rotacao[1]))
+        if angulos != self._angulos_direcoes:
+            self._angulos_direcoes = angulos
+            pitch, yaw = np.radians(angulos)  # Rotações em torno de X (cima/baixo) e de Y (esquerda/direita)
+
+            # Vetor "frente" da câmera baseado na rotação
+            direcao_frente = np.array([
+                np.cos(pitch) * np.sin(yaw),
+                np.sin(pitch),
+                np.cos(pitch) * np.cos(yaw)
+            ])
+
+            # Vetor "direita" da câmera baseado na rotação
+            direcao_direita = np.array([
+                np.cos(yaw),
+                0.0,
+                -np.sin(yaw)
+            ])
+
+            # Vetor "cima" é o vetor cruzado entre "direita" e "frente"
+            direcao_cima = np.cross(direcao_direita, direcao_frente)
+            self._direcoes = (direcao_direita, direcao_cima, direcao_frente)
+        return self._direcoes
@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from OpenGL.GL import *
 
 def configurar_luz() -> None:
@@ -17,11 +19,114 @@ def definir_posicao_luz(posicao: list[float]) -> None:
     luz_posicao = [posicao[0], posicao[1], posicao[2], 1.0]
     glLightfv(GL_LIGHT0, GL_POSITION, luz_posicao)
 
-def aplicar_material(emissivo: bool, cor: list[float]) -> None:
-    if emissivo:
-        glMaterialfv(GL_FRONT_AND_BACK, GL_EMISSION, cor)
-    else:
-        glMaterialfv(GL_FRONT_AND_BACK, GL_EMISSION, [0.0, 0.0, 0.0, 1.0])
-        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, cor)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
-        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 50.0)
+def aplicar_material(emissao: list[float], ambiente_difusa: list[float]) -> None:
+    glMaterialfv(GL_FRONT_AND_BACK, GL_EMISSION, emissao)
+    glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE, ambiente_difusa)
+
+class CacheMateriais:
+    """
+    Materiais de corpos por (cor, brilho), com as listas de parâmetros calculadas uma única vez.
+
+    O último material aplicado é lembrado: aplicar o mesmo material de novo não gera chamadas
+    OpenGL, então desenhar corpos ordenados por material só muda o estado nas fronteiras.
+    """
+
+    def __init__(self):
+        self._materiais: Dict[Tuple[Tuple[int, int, int], float], int] = {}
+        self._parametros: List[Tuple[List[float], List[float]]] = []
+        self._atual: Optional[int] = None
+
+    def obter(self, cor: Tuple[int, int, int], brilho: float) -> int:
+        """
+        Identificador do material de um corpo, criado no primeiro uso.
+
+        :param cor: Cor RGB (0-255) do corpo.
+        :param brilho: Brilho do corpo; maior que zero torna o material emissivo.
+        """
+        chave = (tuple(cor), float(brilho))
+        material = self._materiais.get(chave)
+        if material is None:
+            cor_normalizada = [cor[0] / 255.0, cor[1] / 255.0, cor[2] / 255.0, 1.0]
+            if brilho > 0.0:
+                # Corpo brilhante: só emissão, sem ambiente/difusa para evitar iluminação adicional
+                parametros = ([componente * brilho for componente in cor_normalizada], [0.0, 0.0, 0.0, 1.0])
+            else:
+                parametros = ([0.0, 0.0, 0.0, 1.0], cor_normalizada)
+            material = self._materiais[chave] = len(self._parametros)
+            self._parametros.append(parametros)
+        return material
+
+    def aplicar(self, material: int) -> None:
+        """
+        Torna `material` o material atual, se ainda não for.
+        """
+        if material == self._atual:
+            return
+        if self._atual is None:
+            # Especular e brilho são iguais para todos os materiais
+            glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
+            glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 50.0)
+        aplicar_material(*self._parametros[material])
+        self._atual = material
+
+    def invalidar(self) -> None:
+        """
+        Esquece o material atual (após outro código alterar o estado de material do OpenGL).
+        """
+        self._atual = None
+
+class GerenciadorLuzes:
+    """
+    Luzes pontuais dos corpos emissores, reenviadas ao OpenGL só quando mudam.
+
+    A posição de uma luz é guardada pelo OpenGL em coordenadas do olho, transformada pela
+    modelo-visão do momento do envio; por isso todas as posições são reenviadas quando a matriz
+    de visão muda, e fora isso só as luzes que se moveram mais que `limiar_posicao`.
+    """
+
+    def __init__(self, max_luzes: int = 8, limiar_posicao: float = 1e7):
+        """
+        :param max_luzes: Número de luzes disponíveis (GL_LIGHT0 em diante).
+        :param limiar_posicao: Deslocamento (m) abaixo do qual a posição enviada não é atualizada.
+        """
+        self.max_luzes: int = max_luzes
+        self.limiar_posicao: float = limiar_posicao
+        self.ativas: Optional[int] = None  # None: estado do OpenGL desconhecido
+        self._posicoes: np.ndarray = np.zeros((max_luzes, 3))
+        self._cores: List[Optional[List[float]]] = [None] * max_luzes
+        self._matriz_visao: Optional[np.ndarray] = None
+
+    def atualizar(self, posicoes: np.ndarray, cores: List[List[float]], matriz_visao: np.ndarray) -> int:
+        """
+        Configura as luzes do quadro.
+
+        :param posicoes: Posições das fontes, no mesmo referencial da modelo-visão atual, shape (K, 3).
+        :param cores: Cor RGBA (difusa e especular) de cada fonte.
+        :param matriz_visao: Modelo-visão atual, usada para detectar mudanças de câmera.
+        :return: Número de luzes ativas (as excedentes a `max_luzes` são ignoradas).
+        """
+        num_luzes = min(len(posicoes), self.max_luzes)
+        anteriores = self.max_luzes if self.ativas is None else self.ativas
+        for i in range(num_luzes, anteriores):
+            glDisable(GL_LIGHT0 + i)
+
+        visao_mudou = self._matriz_visao is None or not np.array_equal(matriz_visao, self._matriz_visao)
+        if visao_mudou:
+            self._matriz_visao = matriz_visao.copy()
+        for i in range(num_luzes):
+            nova = self.ativas is None or i >= self.ativas
+            if nova:
+                glEnable(GL_LIGHT0 + i)
+                glLightf(GL_LIGHT0 + i, GL_CONSTANT_ATTENUATION, 1.0)
+                glLightf(GL_LIGHT0 + i, GL_LINEAR_ATTENUATION, 0.0)
+                glLightf(GL_LIGHT0 + i, GL_QUADRATIC_ATTENUATION, 0.0)
+            deslocamento = posicoes[i] - self._posicoes[i]
+            if nova or visao_mudou or deslocamento @ deslocamento > self.limiar_posicao ** 2:
+                glLightfv(GL_LIGHT0 + i, GL_POSITION, [*posicoes[i], 1.0])
+                self._posicoes[i] = posicoes[i]
+            if nova or cores[i] != self._cores[i]:
+                glLightfv(GL_LIGHT0 + i, GL_DIFFUSE, cores[i])
+                glLightfv(GL_LIGHT0 + i, GL_SPECULAR, cores[i])
+                self._cores[i] = list(cores[i])
+        self.ativas = num_luzes
+        return num_luzes
@@ -0,0 +1,258 @@
+import ctypes
+from typing import List, Optional, Tuple
+import numpy as np
+from OpenGL.GL import *
+from OpenGL.GL.shaders import compileProgram, compileShader
+from simulacao.objetos.corpo_celeste import CorpoCeleste
+from simulacao.objetos.foguete import Foguete
+from simulacao.grafico.malhas import CacheMalhas, Malha
+from simulacao.grafico.visibilidade import NIVEL_PONTO, RESOLUCOES_DETALHE
+
+# Dados por instância: posição (3), escala (1) e cor (3), em float32
+_FLOATS_POR_INSTANCIA = 7
+_PASSO_INSTANCIA = _FLOATS_POR_INSTANCIA * 4
+
+_VERTICE_ESFERA = """
+#version 120
+attribute vec4 instancia_posicao_escala;
+attribute vec3 instancia_cor;
+varying vec3 normal_olho;
+varying vec3 posicao_olho;
+varying vec3 cor;
+
+void main() {
+    vec4 olho = gl_ModelViewMatrix * vec4(gl_Vertex.xyz * instancia_posicao_escala.w + instancia_posicao_escala.xyz, 1.0);
+    posicao_olho = olho.xyz;
+    normal_olho = gl_NormalMatrix * gl_Normal;
+    cor = instancia_cor;
+    gl_Position = gl_ProjectionMatrix * olho;
+}
+"""
+
+# Reproduz a iluminação fixa usada nos corpos individuais: ambiente global + difusa + especular
+_FRAGMENTO_ESFERA = """
+#version 120
+uniform int num_luzes;
+varying vec3 normal_olho;
+varying vec3 posicao_olho;
+varying vec3 cor;
+
+void main() {
+    vec3 n = normalize(normal_olho);
+    vec3 v = normalize(-posicao_olho);
+    vec3 resultado = gl_LightModel.ambient.rgb * cor;
+    for (int i = 0; i < 8; i++) {
+        if (i >= num_luzes) break;
+        vec3 l = normalize(gl_LightSource[i].position.xyz - posicao_olho);
+        float difusa = max(dot(n, l), 0.0);
+        resultado += gl_LightSource[i].diffuse.rgb * cor * difusa;
+        if (difusa > 0.0) {
+            resultado += gl_LightSource[i].specular.rgb * pow(max(dot(n, normalize(l + v)), 0.0), 50.0);
+        }
+    }
+    gl_FragColor = vec4(resultado, 1.0);
+}
+"""
+
+_VERTICE_PONTO = """
+#version 120
+attribute vec4 instancia_posicao_escala;
+attribute vec3 instancia_cor;
+uniform float pixels_por_radiano;
+uniform float tamanho_minimo;
+varying vec3 cor;
+
+void main() {
+    vec4 olho = gl_ModelViewMatrix * vec4(instancia_posicao_escala.xyz, 1.0);
+    gl_Position = gl_ProjectionMatrix * olho;
+    gl_PointSize = max(2.0 * instancia_posicao_escala.w * pixels_por_radiano / max(-olho.z, 1.0), tamanho_minimo);
+    cor = instancia_cor;
+}
+"""
+
+_FRAGMENTO_PONTO = """
+#version 120
+varying vec3 cor;
+
+void main() {
+    // Sprite circular
+    vec2 d = gl_PointCoord - vec2(0.5);
+    if (dot(d, d) > 0.25) discard;
+    gl_FragColor = vec4(cor, 1.0);
+}
+"""
+
+
+class DesenhoInstanciado:
+    """
+    Desenha populações grandes de corpos pequenos com uma chamada por população.
+
+    Posições, escalas e cores vão em um único array por instância, montado direto das posições
+    da física. Corpos fora do volume de visão são descartados; os que ficam abaixo do primeiro
+    nível de detalhe viram sprites de ponto (GL_POINTS), e os demais são esferas instanciadas
+    (glDrawElementsInstanced) com a malha do seu nível de detalhe. Corpos
+    emissores (fontes de luz) e foguetes continuam no desenho individual.
+    """
+
+    def __init__(
+        self,
+        campo_visao: float,
+        altura: int,
+        min_instancias: int = 64,
+        tamanho_minimo_ponto: float = 2.0,
+    ):
+        """
+        Inicializa o desenho instanciado. Os shaders e buffers são criados no primeiro uso.
+
+        :param campo_visao: Campo de visão vertical da projeção, em graus.
+        :param altura: Altura da janela em pixels.
+        :param min_instancias: Número mínimo de corpos elegíveis para usar o caminho instanciado.
+        :param tamanho_minimo_ponto: Diâmetro mínimo dos pontos (px).
+        """
+        self.pixels_por_radiano: float = altura / (2.0 * np.tan(np.radians(campo_visao) / 2.0))
+        self.min_instancias: int = min_instancias
+        self.tamanho_minimo_ponto: float = tamanho_minimo_ponto
+
+        self._corpos: Optional[List[CorpoCeleste]] = None
+        self._individuais: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._instanciados: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._escalas: np.ndarray = np.zeros(0, dtype=np.float32)
+        self._cores: np.ndarray = np.zeros((0, 3), dtype=np.float32)
+        self._dados: np.ndarray = np.zeros((0, _FLOATS_POR_INSTANCIA), dtype=np.float32)
+
+        self._suportado: Optional[bool] = None
+        self._programa_esfera = None
+        self._programa_ponto = None
+        self._vbo_instancias = None
+
+    @property
+    def suportado(self) -> bool:
+        """
+        Indica se o driver oferece instanciamento; na primeira consulta, compila os shaders.
+        """
+        if self._suportado is None:
+            self._suportado = bool(glDrawElementsInstanced) and bool(glVertexAttribDivisor)
+            if self._suportado:
+                self._inicializar_gl()
+        return self._suportado
+
+    def _inicializar_gl(self) -> None:
+        self._programa_esfera = compileProgram(
+            compileShader(_VERTICE_ESFERA, GL_VERTEX_SHADER), compileShader(_FRAGMENTO_ESFERA, GL_FRAGMENT_SHADER)
+        )
+        self._programa_ponto = compileProgram(
+            compileShader(_VERTICE_PONTO, GL_VERTEX_SHADER), compileShader(_FRAGMENTO_PONTO, GL_FRAGMENT_SHADER)
+        )
+        self._vbo_instancias = glGenBuffers(1)
+
+    def separar(self, corpos: List[CorpoCeleste]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Separa os corpos desenhados individualmente dos desenhados por instância.
+
+        A separação e os atributos fixos (escala, cor) são recalculados só quando a lista muda.
+
+        :param corpos: Lista de corpos celestes a desenhar.
+        :return: Tupla (índices individuais, índices instanciados).
+        """
+        if self._corpos is not corpos or len(self._individuais) + len(self._instanciados) != len(corpos):
+            elegiveis = np.array(
+                [corpo.brilho <= 0.0 and not isinstance(corpo, Foguete) for corpo in corpos], dtype=bool
+            )
+            if elegiveis.sum() < self.min_instancias or not self.suportado:
+                elegiveis[:] = False
+            self._corpos = corpos
+            self._individuais = np.flatnonzero(~elegiveis)
+            self._instanciados = np.flatnonzero(elegiveis)
+            self._escalas = np.array(
+                [corpos[idx].raio * corpos[idx].fator_escala for idx in self._instanciados], dtype=np.float32
+            )
+            self._cores = np.array([corpos[idx].cor for idx in self._instanciados], dtype=np.float32).reshape(-1, 3) / 255.0
+            self._dados = np.zeros((len(self._instanciados), _FLOATS_POR_INSTANCIA), dtype=np.float32)
+        return self._individuais, self._instanciados
+
+    def desenhar(
+        self, posicoes: np.ndarray, malhas: CacheMalhas, visiveis: np.ndarray, niveis: np.ndarray, num_luzes: int
+    ) -> None:
+        """
+        Desenha os corpos instanciados visíveis: uma chamada por nível de detalhe das esferas e
+        uma para os pontos.
+
+        :param posicoes: Posições de todos os corpos (mesma ordem de `corpos`), shape (N, 3).
+        :param malhas: Cache das malhas unitárias de esfera de cada nível.
+        :param visiveis: Máscara de visibilidade de todos os corpos, shape (N,) (ver Visibilidade).
+        :param niveis: Nível de detalhe de todos os corpos, shape (N,) (ver RESOLUCOES_DETALHE).
+        :param num_luzes: Número de luzes ativas (GL_LIGHT0 em diante).
+        """
+        locais = np.flatnonzero(visiveis[self._instanciados])
+        n = len(locais)
+        if n == 0:
+            return
+        # Agrupa por nível de detalhe: pontos (nível 0) primeiro, depois esferas da menor à maior
+        niveis = niveis[self._instanciados[locais]]
+        ordem = np.argsort(niveis, kind="stable")
+        locais, niveis = locais[ordem], niveis[ordem]
+        inicios = np.searchsorted(niveis, np.arange(len(RESOLUCOES_DETALHE) + 1))
+
+        dados = self._dados[:n]
+        dados[:, 0:3] = posicoes[self._instanciados[locais]]
+        dados[:, 3] = self._escalas[locais]
+        dados[:, 4:7] = self._cores[locais]
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo_instancias)
+        # Realoca a cada quadro (orphaning) para não esperar a GPU terminar o quadro anterior
+        glBufferData(GL_ARRAY_BUFFER, dados.nbytes, None, GL_STREAM_DRAW)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, dados.nbytes, dados)
+
+        num_pontos = int(inicios[NIVEL_PONTO + 1])
+        if num_pontos:
+            glUseProgram(self._programa_ponto)
+            glUniform1f(glGetUniformLocation(self._programa_ponto, "pixels_por_radiano"), self.pixels_por_radiano)
+            glUniform1f(glGetUniformLocation(self._programa_ponto, "tamanho_minimo"), self.tamanho_minimo_ponto)
+            glEnable(GL_VERTEX_PROGRAM_POINT_SIZE)
+            glEnable(GL_POINT_SPRITE)
+            atributos = self._apontar_instancias(self._programa_ponto, 0, divisor=0)
+            glDrawArrays(GL_POINTS, 0, num_pontos)
+            self._liberar_atributos(atributos)
+            glDisable(GL_POINT_SPRITE)
+            glDisable(GL_VERTEX_PROGRAM_POINT_SIZE)
+
+        if n > num_pontos:
+            glUseProgram(self._programa_esfera)
+            glUniform1i(glGetUniformLocation(self._programa_esfera, "num_luzes"), num_luzes)
+            for nivel in range(NIVEL_PONTO + 1, len(RESOLUCOES_DETALHE)):
+                primeira, fim = int(inicios[nivel]), int(inicios[nivel + 1])
+                if fim == primeira:
+                    continue
+                malha_esfera = malhas.esfera(*RESOLUCOES_DETALHE[nivel])
+                malha_esfera.vincular()
+                glBindBuffer(GL_ARRAY_BUFFER, self._vbo_instancias)
+                atributos = self._apontar_instancias(self._programa_esfera, primeira, divisor=1)
+                glDrawElementsInstanced(
+                    GL_TRIANGLES, malha_esfera.num_indices, GL_UNSIGNED_INT, ctypes.c_void_p(0), fim - primeira
+                )
+                self._liberar_atributos(atributos)
+            Malha.desvincular()
+
+        glUseProgram(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    @staticmethod
+    def _apontar_instancias(programa, primeira: int, divisor: int) -> List[int]:
+        """
+        Configura os atributos por instância a partir da instância `primeira` do buffer vinculado.
+        """
+        deslocamento = primeira * _PASSO_INSTANCIA
+        atributos = []
+        for nome, componentes, inicio in (("instancia_posicao_escala", 4, 0), ("instancia_cor", 3, 16)):
+            local = glGetAttribLocation(programa, nome)
+            glEnableVertexAttribArray(local)
+            glVertexAttribPointer(local, componentes, GL_FLOAT, GL_FALSE, _PASSO_INSTANCIA, ctypes.c_void_p(deslocamento + inicio))
+            glVertexAttribDivisor(local, divisor)
+            atributos.append(local)
+        return atributos
+
+    @staticmethod
+    def _liberar_atributos(atributos: List[int]) -> None:
+        for local in atributos:
+            glVertexAttribDivisor(local, 0)
+            glDisableVertexAttribArray(local)
@@ -0,0 +1,168 @@
+import ctypes
+from typing import Dict, Optional, Tuple
+import numpy as np
+from OpenGL.GL import *
+
+# Bytes por vértice no buffer intercalado: posição (3 float32) seguida da normal (3 float32)
+_PASSO_VERTICE = 6 * 4
+
+
+def gerar_esfera(fatias: int = 20, pilhas: int = 20) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gera uma esfera de raio unitário como malha indexada de triângulos.
+
+    :param fatias: Número de subdivisões em longitude.
+    :param pilhas: Número de subdivisões em latitude.
+    :return: Tupla (vértices (K, 3) float32, normais (K, 3) float32, índices (T*3,) uint32).
+    """
+    latitudes = np.pi * (-0.5 + np.arange(pilhas + 1) / pilhas)
+    longitudes = 2 * np.pi * np.arange(fatias + 1) / fatias
+    lat, lng = np.meshgrid(latitudes, longitudes, indexing="ij")  # shape (pilhas+1, fatias+1)
+
+    # Na esfera unitária, a normal de cada vértice é o próprio vetor posição
+    normais = np.stack((np.cos(lat) * np.cos(lng), np.cos(lat) * np.sin(lng), np.sin(lat)), axis=-1).reshape(-1, 3)
+
+    # Dois triângulos por quadrilátero (i, j) -> (i+1, j+1)
+    i, j = np.meshgrid(np.arange(pilhas), np.arange(fatias), indexing="ij")
+    v00 = (i * (fatias + 1) + j).ravel()
+    v01 = v00 + 1
+    v10 = v00 + (fatias + 1)
+    v11 = v10 + 1
+    indices = np.stack((v00, v10, v11, v00, v11, v01), axis=-1).ravel()
+
+    normais = normais.astype(np.float32)
+    return normais.copy(), normais, indices.astype(np.uint32)
+
+
+def gerar_foguete() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gera a malha do foguete com tamanho unitário: uma pirâmide de base quadrada apontando
+    para +Y e uma pirâmide menor no topo, como triângulos com normais por face.
+
+    :return: Tupla (vértices (K, 3) float32, normais (K, 3) float32).
+    """
+    def piramide(topo: float, base_y: float, meia_base: float):
+        t = (0.0, topo, 0.0)
+        b = [
+            (-meia_base, base_y, meia_base),   # Base frontal esquerda
+            (meia_base, base_y, meia_base),    # Base frontal direita
+            (meia_base, base_y, -meia_base),   # Base traseira direita
+            (-meia_base, base_y, -meia_base),  # Base traseira esquerda
+        ]
+        # Faces laterais (frente, direita, traseira, esquerda) e a base em dois triângulos
+        return [
+            (t, b[0], b[1]), (t, b[1], b[2]), (t, b[2], b[3]), (t, b[3], b[0]),
+            (b[0], b[3], b[2]), (b[0], b[2], b[1]),
+        ]
+
+    triangulos = np.array(piramide(1.0, -1.0, 1.0) + piramide(1.5, 1.0, 0.5), dtype=np.float32)
+    normais_face = np.cross(triangulos[:, 1] - triangulos[:, 0], triangulos[:, 2] - triangulos[:, 0])
+    normais_face /= np.linalg.norm(normais_face, axis=1, keepdims=True)
+
+    vertices = triangulos.reshape(-1, 3)
+    normais = np.repeat(normais_face, 3, axis=0).astype(np.float32)
+    return vertices, normais
+
+
+class Malha:
+    """
+    Malha de triângulos armazenada em buffers de vértices (VBO) na GPU.
+
+    Os dados são enviados uma única vez; cada desenho custa apenas a vinculação dos buffers
+    (omitida se a malha já estiver vinculada) e uma chamada glDrawElements/glDrawArrays.
+    """
+
+    # Malha atualmente vinculada, para evitar revincular entre corpos que usam a mesma malha
+    _vinculada: Optional["Malha"] = None
+
+    def __init__(self, vertices: np.ndarray, normais: np.ndarray, indices: Optional[np.ndarray] = None):
+        """
+        Envia a malha para a GPU. Requer um contexto OpenGL ativo.
+
+        :param vertices: Posições dos vértices, shape (K, 3).
+        :param normais: Normais dos vértices, shape (K, 3).
+        :param indices: Índices dos triângulos (uint32). Se None, os vértices são desenhados em ordem.
+        """
+        intercalado = np.ascontiguousarray(np.hstack((vertices, normais)), dtype=np.float32)
+        self.num_vertices: int = len(vertices)
+        self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, intercalado.nbytes, intercalado, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        self.ibo = None
+        self.num_indices: int = 0
+        if indices is not None:
+            indices = np.ascontiguousarray(indices, dtype=np.uint32)
+            self.num_indices = len(indices)
+            self.ibo = glGenBuffers(1)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def vincular(self) -> None:
+        """
+        Vincula os buffers e configura os ponteiros de posição e normal.
+        """
+        if Malha._vinculada is self:
+            return
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, _PASSO_VERTICE, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, _PASSO_VERTICE, ctypes.c_void_p(12))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo or 0)
+        Malha._vinculada = self
+
+    @staticmethod
+    def desvincular() -> None:
+        """
+        Desfaz a vinculação, restaurando o estado para o desenho em modo imediato.
+        """
+        if Malha._vinculada is None:
+            return
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        Malha._vinculada = None
+
+    def desenhar(self) -> None:
+        """
+        Desenha a malha com a matriz de modelo e o material atuais.
+        """
+        self.vincular()
+        if self.ibo is not None:
+            glDrawElements(GL_TRIANGLES, self.num_indices, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        else:
+            glDrawArrays(GL_TRIANGLES, 0, self.num_vertices)
+
+
+class CacheMalhas:
+    """
+    Cria cada malha uma única vez, no primeiro uso, e a reaproveita nos quadros seguintes.
+    """
+
+    def __init__(self):
+        self._malhas: Dict[Tuple, Malha] = {}
+
+    def esfera(self, fatias: int = 20, pilhas: int = 20) -> Malha:
+        """
+        Retorna a esfera unitária com a resolução pedida.
+
+        :param fatias: Número de subdivisões em longitude.
+        :param pilhas: Número de subdivisões em latitude.
+        """
+        chave = ("esfera", fatias, pilhas)
+        if chave not in self._malhas:
+            self._malhas[chave] = Malha(*gerar_esfera(fatias, pilhas))
+        return self._malhas[chave]
+
+    def foguete(self) -> Malha:
+        """
+        Retorna a malha unitária do foguete.
+        """
+        chave = ("foguete",)
+        if chave not in self._malhas:
+            self._malhas[chave] = Malha(*gerar_foguete())
+        return self._malhas[chave]
@@ -2,36 +2,62 @@ import pygame
 import numpy as np
 from pygame.locals import *
 from OpenGL.GL import *
-from OpenGL.GLU import *
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from simulacao.objetos.foguete import Foguete
 from simulacao.objetos.corpo_celeste import CorpoCeleste
-from simulacao.grafico.iluminacao import configurar_luz, aplicar_material, definir_posicao_luz
+from simulacao.grafico.camera import Camera, matriz_perspectiva
+from simulacao.grafico.malhas import CacheMalhas, Malha
+from simulacao.grafico.instancias import DesenhoInstanciado
+from simulacao.grafico.rastros import RastroGPU
+from simulacao.grafico.visibilidade import NIVEL_PONTO, RESOLUCOES_DETALHE, Visibilidade
+from simulacao.grafico.iluminacao import CacheMateriais, GerenciadorLuzes, configurar_luz
 
 GL_MAX_LIGHTS = 8
+# Comprimento mínimo (px) dos segmentos desenhados de um rastro; abaixo disso pontos são pulados
+PIXELS_MINIMOS_SEGMENTO_RASTRO = 2.0
+MAX_PASSO_RASTRO = 64
+TAMANHO_PONTO = 2.0  # Diâmetro (px) dos corpos individuais pequenos demais para uma esfera
 
 class MotorGrafico:
     """
     Classe responsável pela renderização gráfica dos corpos celestes.
     """
 
-    def __init__(self, largura: int = 800, altura: int = 600, titulo: str = "Simulação do Sistema Solar"):
+    def __init__(
+        self, largura: int = 800, altura: int = 600, titulo: str = "Simulação do Sistema Solar", oculta: bool = False
+    ):
         """
         Inicializa o motor gráfico e configura a janela de exibição.
+
+        :param oculta: Se True, cria a janela oculta, apenas para obter um contexto OpenGL
+            (desenho fora da tela, ver simulacao.gravacao).
         """
         self.largura = largura
         self.altura = altura
         self.titulo = titulo
+        self.oculta = oculta
+        self.campo_visao = 45.0  # Campo de visão vertical (graus)
+        self.matriz_projecao = matriz_perspectiva(self.campo_visao, self.largura / self.altura, 1e9, 1e13)
+        # Origem flutuante: posição da câmera subtraída (em float64) de tudo que é desenhado
+        self.origem = np.zeros(3)
+        self.matriz_visao: Optional[np.ndarray] = None  # Matriz de visão relativa da última câmera aplicada
         self._inicializar_janela()
         self._configurar_openGL()
-        self.clock = pygame.time.Clock()
-        self.fps = 60  # Taxa de quadros por segundo
+        self.malhas = CacheMalhas()  # Malhas em VBO, criadas no primeiro uso
+        self.instancias = DesenhoInstanciado(self.campo_visao, self.altura)
+        self.visibilidade = Visibilidade(self.campo_visao, self.altura)
+        self.rastros_gpu: Dict[CorpoCeleste, RastroGPU] = {}  # VBO do rastro de cada corpo
+        self.materiais = CacheMateriais()
+        self.luzes = GerenciadorLuzes(GL_MAX_LIGHTS)
+        # Material de cada corpo, recalculado quando a lista de corpos muda
+        self._corpos_materiais: Optional[List[CorpoCeleste]] = None
+        self._ids_materiais: np.ndarray = np.zeros(0, dtype=np.int64)
 
     def _inicializar_janela(self) -> None:
         """
         Inicializa a janela de exibição usando pygame.
         """
-        pygame.display.set_mode((self.largura, self.altura), DOUBLEBUF | OPENGL)
+        pygame.display.set_mode((self.largura, self.altura), DOUBLEBUF | OPENGL | (HIDDEN if self.oculta else 0))
         pygame.display.set_caption(self.titulo)
 
     def _configurar_openGL(self) -> None:
@@ -41,9 +67,11 @@ class MotorGrafico:
         glEnable(GL_DEPTH_TEST)
         glDepthFunc(GL_LEQUAL)
         glClearColor(0.0, 0.0, 0.0, 1.0)
+        # As malhas são unitárias e escaladas uniformemente; reescala as normais para a iluminação
+        glEnable(GL_RESCALE_NORMAL)
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
-        gluPerspective(45, (self.largura / self.altura), 1e9, 1e13)
+        glLoadMatrixd(self.matriz_projecao.T)
         glMatrixMode(GL_MODELVIEW)
 
         # Chama a configuração de luz inicial
@@ -51,10 +79,19 @@ class MotorGrafico:
 
     def atualizar_tela(self) -> None:
         """
-        Atualiza a tela e controla a taxa de quadros.
+        Apresenta o quadro desenhado. A taxa de quadros é controlada pelo laço principal.
         """
         pygame.display.flip()
-        self.clock.tick(self.fps)
+
+    def aplicar_camera(self, camera: Camera) -> None:
+        """
+        Carrega a matriz de visão da câmera e passa a desenhar relativo à sua posição.
+
+        :param camera: Câmera do quadro.
+        """
+        camera.atualizar()
+        self.origem = camera.posicao.copy()
+        self.matriz_visao = camera.matriz_visao_relativa()
 
     def limpar_tela(self) -> None:
         """
@@ -62,80 +99,140 @@ class MotorGrafico:
         """
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-    def desenhar_corpos(self, corpos: List[CorpoCeleste]) -> None:
+    def desenhar_corpos(
+        self,
+        corpos: List[CorpoCeleste],
+        posicoes: Optional[np.ndarray] = None,
+        orientacoes: Optional[np.ndarray] = None,
+        totais_rastro: Optional[np.ndarray] = None,
+        ultimos_rastro: Optional[np.ndarray] = None,
+        ancoras_rastro: Optional[np.ndarray] = None,
+        geracoes_rastro: Optional[np.ndarray] = None,
+    ) -> None:
         """
         Renderiza todos os corpos celestes na tela e define as posições das luzes
         com base nos corpos com brilho.
+
+        Quando a física roda em outra thread, posições, orientações, totais, últimos pontos,
+        âncoras e gerações de rastro devem vir de um instantâneo publicado por ela, e não
+        diretamente dos corpos.
+
+        Populações grandes de corpos não emissores são desenhadas por instanciamento
+        (ver DesenhoInstanciado); fontes de luz e foguetes são desenhados individualmente.
+        Corpos fora do volume de visão não são desenhados, e a resolução de cada esfera (ou o
+        desenho como ponto) é escolhida pelo raio projetado (ver Visibilidade). As luzes são
+        configuradas mesmo quando a fonte está fora da tela.
+
+        :param corpos: Lista de corpos celestes a desenhar.
+        :param posicoes: Posições de desenho (ex.: interpoladas entre dois passos físicos), shape (N, 3).
+            Se None, usa a posição atual de cada corpo.
+        :param orientacoes: Orientações de desenho dos foguetes, shape (N, 3). Se None, usa as dos corpos.
+        :param totais_rastro: Total de pontos de rastro publicados por corpo, shape (N,). Se None, usa o total atual.
+        :param ultimos_rastro: Cópia publicada do ponto mais recente de cada rastro, shape (N, 3).
+            Se None, o ponto é lido do próprio rastro.
+        :param ancoras_rastro: Âncoras publicadas dos rastros, shape (N, 3). Se None, usa as atuais.
+        :param geracoes_rastro: Gerações publicadas dos rastros, shape (N,). Se None, usa as atuais.
+        """
+        if posicoes is None:
+            posicoes = np.array([corpo.posicao for corpo in corpos])
+        # Posições relativas à câmera, calculadas em float64 antes de chegar à GPU
+        posicoes = posicoes - self.origem
+        individuais, instanciados = self.instancias.separar(corpos)
+        if orientacoes is None:
+            orientacoes = [getattr(corpo, "orientacao", None) for corpo in corpos]
+
+        modelo_visao = self._matriz_modelo_visao()
+
+        # Luzes nos corpos com brilho > 0 (só o que mudou desde o quadro anterior é reenviado)
+        fontes = [idx for idx in individuais if corpos[idx].brilho > 0.0]
+        cores_luz = [
+            [
+                (corpos[idx].cor[0] / 255.0) * corpos[idx].brilho,
+                (corpos[idx].cor[1] / 255.0) * corpos[idx].brilho,
+                (corpos[idx].cor[2] / 255.0) * corpos[idx].brilho,
+                1.0
+            ]
+            for idx in fontes
+        ]
+        light_index = self.luzes.atualizar(posicoes[fontes], cores_luz, modelo_visao)
+
+        self.visibilidade.atualizar_camera(self.matriz_projecao, modelo_visao)
+        visiveis, _, niveis = self.visibilidade.calcular(corpos, posicoes)
+
+        # Renderizar os corpos visíveis, ordenados por material e nível de detalhe
+        # (primeiro todos os corpos, para que corpos com a mesma malha não precisem revinculá-la,
+        # e o estado de material só muda entre grupos)
+        desenhados = individuais[visiveis[individuais]]
+        pontos = desenhados[niveis[desenhados] == NIVEL_PONTO]
+        desenhados = desenhados[niveis[desenhados] != NIVEL_PONTO]
+        ids_materiais = self._materiais_corpos(corpos)
+        for idx in desenhados[np.lexsort((niveis[desenhados], ids_materiais[desenhados]))]:
+            self.desenhar_corpo(corpos[idx], posicoes[idx], orientacoes[idx], RESOLUCOES_DETALHE[niveis[idx]])
+        Malha.desvincular()
+        if len(pontos):
+            self.desenhar_pontos(posicoes[pontos], [corpos[idx].cor for idx in pontos])
+        if len(instanciados):
+            self.instancias.desenhar(posicoes, self.malhas, visiveis, niveis, light_index)
+        self.desenhar_rastros(corpos, totais_rastro, ultimos_rastro, ancoras_rastro, geracoes_rastro)
+
+
+    def _materiais_corpos(self, corpos: List[CorpoCeleste]) -> np.ndarray:
+        """
+        Identificador do material (ver CacheMateriais) de cada corpo.
+        """
+        if self._corpos_materiais is not corpos or len(self._ids_materiais) != len(corpos):
+            self._corpos_materiais = corpos
+            self._ids_materiais = np.array(
+                [self.materiais.obter(corpo.cor, corpo.brilho) for corpo in corpos], dtype=np.int64
+            )
+        return self._ids_materiais
+
+    def _matriz_modelo_visao(self) -> np.ndarray:
+        """
+        Matriz de visão do quadro: a da câmera aplicada ou, sem ela, a lida do OpenGL.
+        """
+        if self.matriz_visao is not None:
+            return self.matriz_visao
+        return np.array(glGetDoublev(GL_MODELVIEW_MATRIX)).reshape(4, 4).T
+
+    def posicao_camera(self) -> np.ndarray:
+        """
+        Posição da câmera no mundo.
+        """
+        modelo_visao = self._matriz_modelo_visao()
+        rotacao, translacao = modelo_visao[:3, :3], modelo_visao[:3, 3]
+        return self.origem - rotacao.T @ translacao
+
+    def desenhar_corpo(
+        self,
+        corpo: CorpoCeleste,
+        posicao: Optional[np.ndarray] = None,
+        orientacao: Optional[np.ndarray] = None,
+        resolucao: Tuple[int, int] = (20, 20),
+    ) -> None:
+        """
+        Desenha um corpo com seu material, como esfera ou, no caso de foguetes, pirâmide.
+
+        :param resolucao: Subdivisões (fatias, pilhas) da esfera.
         """
-        # Desativar todas as luzes inicialmente
-        for i in range(GL_MAX_LIGHTS):
-            glDisable(GL_LIGHT0 + i)
-
-        # Ativar e configurar luzes para corpos com brilho > 0
-        light_index = 0
-        for corpo in corpos:
-            if corpo.brilho > 0.0 and light_index < GL_MAX_LIGHTS:
-                glEnable(GL_LIGHT0 + light_index)
-                posicao_luz = [*corpo.posicao, 1.0]
-                cor_luz = [
-                    (corpo.cor[0] / 255.0) * corpo.brilho,
-                    (corpo.cor[1] / 255.0) * corpo.brilho,
-                    (corpo.cor[2] / 255.0) * corpo.brilho,
-                    1.0
-                ]
-                glLightfv(GL_LIGHT0 + light_index, GL_POSITION, posicao_luz)
-                glLightfv(GL_LIGHT0 + light_index, GL_DIFFUSE, cor_luz)
-                glLightfv(GL_LIGHT0 + light_index, GL_SPECULAR, cor_luz)
-                # Configurar atenuação (opcional)
-                glLightf(GL_LIGHT0 + light_index, GL_CONSTANT_ATTENUATION, 1.0)
-                glLightf(GL_LIGHT0 + light_index, GL_LINEAR_ATTENUATION, 0.0)
-                glLightf(GL_LIGHT0 + light_index, GL_QUADRATIC_ATTENUATION, 0.0)
-                light_index += 1
-
-        # Renderizar todos os corpos
-        for corpo in corpos:
-            self.desenhar_corpo(corpo)
-            self.desenhar_rastro(corpo)
-
-
-    def desenhar_corpo(self, corpo: CorpoCeleste) -> None:
         glPushMatrix()
 
         # Aplica a posição do corpo
-        glTranslatef(*corpo.posicao)
-
-        # Normaliza a cor do corpo
-        cor_normalizada = [
-            corpo.cor[0] / 255.0,
-            corpo.cor[1] / 255.0,
-            corpo.cor[2] / 255.0,
-            1.0
-        ]
+        glTranslatef(*(corpo.posicao if posicao is None else posicao))
 
-        # Configura o material
-        if corpo.brilho > 0.0:
-            # Corpo brilhante (emite luz)
-            emissao = [component * corpo.brilho for component in cor_normalizada]
-            glMaterialfv(GL_FRONT_AND_BACK, GL_EMISSION, emissao)
-            # Definir a cor ambiente e difusa para zero para evitar iluminação adicional
-            glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE, [0.0, 0.0, 0.0, 1.0])
-        else:
-            # Corpo não brilhante (reflete luz)
-            glMaterialfv(GL_FRONT_AND_BACK, GL_EMISSION, [0.0, 0.0, 0.0, 1.0])
-            glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE, cor_normalizada)
-
-        # Propriedades especulares (opcional)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
-        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 50.0)
+        # Configura o material (sem chamadas OpenGL se for o mesmo do corpo anterior)
+        self.materiais.aplicar(self.materiais.obter(corpo.cor, corpo.brilho))
 
         # Desenhar o corpo celeste ou foguete
         if isinstance(corpo, Foguete):
-            glRotatef(corpo.orientacao[2], 0.0, 0.0, 1.0)
-            glRotatef(corpo.orientacao[1], 0.0, 1.0, 0.0)
-            glRotatef(corpo.orientacao[0], 1.0, 0.0, 0.0)
+            if orientacao is None:
+                orientacao = corpo.orientacao
+            glRotatef(orientacao[2], 0.0, 0.0, 1.0)
+            glRotatef(orientacao[1], 0.0, 1.0, 0.0)
+            glRotatef(orientacao[0], 1.0, 0.0, 0.0)
             self.desenhar_piramide(corpo.raio * corpo.fator_escala)
         else:
-            self.desenhar_esfera(corpo.raio * corpo.fator_escala)
+            self.desenhar_esfera(corpo.raio * corpo.fator_escala, *resolucao)
 
         glPopMatrix()
 
@@ -143,158 +240,125 @@ class MotorGrafico:
     def desenhar_piramide(self, tamanho: float) -> None:
         """
         Desenha uma pirâmide com o topo apontando para a orientação do foguete, 
-        com uma pirâmide menor no topo e uma face colorida para melhor orientação.
+        com uma pirâmide menor no topo para melhor orientação.
+
+        A malha é gerada uma única vez e fica em um VBO; aqui apenas é escalada e desenhada.
 
         :param tamanho: Escala do tamanho da pirâmide.
         """
-        # Vértices da pirâmide principal (parte inferior)
-        vertices_principal = [
-            (0.0, tamanho, 0.0),  # Topo
-            (-tamanho, -tamanho, tamanho),  # Base frontal esquerda
-            (tamanho, -tamanho, tamanho),   # Base frontal direita
-            (tamanho, -tamanho, -tamanho),  # Base traseira direita
-            (-tamanho, -tamanho, -tamanho)  # Base traseira esquerda
-        ]
-
-        # Normais das faces principais
-        normais_principal = [
-            (0.0, 0.4472, tamanho / np.sqrt(2) * 0.4472),  # Frente
-            (tamanho / np.sqrt(3), 0.4472, 0.0),  # Direita
-            (0.0, 0.4472, -tamanho / np.sqrt(2) * 0.4472),  # Traseira
-            (-tamanho / np.sqrt(3), 0.4472, 0.0)  # Esquerda
-        ]
-
-        # Desenhar as faces da pirâmide principal
-        glBegin(GL_TRIANGLES)
-        
-        # Frente
-        glNormal3fv(normais_principal[0])
-        glVertex3fv(vertices_principal[0])
-        glVertex3fv(vertices_principal[1])
-        glVertex3fv(vertices_principal[2])
-
-        # Direita
-        glNormal3fv(normais_principal[1])
-        glVertex3fv(vertices_principal[0])
-        glVertex3fv(vertices_principal[2])
-        glVertex3fv(vertices_principal[3])
-
-        # Traseira
-        glNormal3fv(normais_principal[2])
-        glVertex3fv(vertices_principal[0])
-        glVertex3fv(vertices_principal[3])
-        glVertex3fv(vertices_principal[4])
-
-        # Esquerda
-        glNormal3fv(normais_principal[3])
-        glVertex3fv(vertices_principal[0])
-        glVertex3fv(vertices_principal[4])
-        glVertex3fv(vertices_principal[1])
-        
-        glEnd()
-
-        # Desenhar a base da pirâmide principal (quadrado)
-        glBegin(GL_QUADS)
-        glNormal3f(0.0, -1.0, 0.0)  # Normal para baixo
-        glVertex3fv(vertices_principal[1])
-        glVertex3fv(vertices_principal[2])
-        glVertex3fv(vertices_principal[3])
-        glVertex3fv(vertices_principal[4])
-        glEnd()
-
-        # Agora desenhar a pirâmide menor no topo da pirâmide principal
-        tamanho_menor = tamanho * 0.5  # Tamanho menor da segunda pirâmide no topo
-
-        vertices_menor = [
-            (0.0, tamanho * 1.5, 0.0),  # Topo da pirâmide menor
-            (-tamanho_menor, tamanho, tamanho_menor),  # Base frontal esquerda
-            (tamanho_menor, tamanho, tamanho_menor),   # Base frontal direita
-            (tamanho_menor, tamanho, -tamanho_menor),  # Base traseira direita
-            (-tamanho_menor, tamanho, -tamanho_menor)  # Base traseira esquerda
-        ]
-
-        # Desenhar as faces da pirâmide menor, com a face frontal de outra cor
-        glBegin(GL_TRIANGLES)
-        
-        # Frente (face colorida diferente para ajudar na orientação)
-        glColor3f(1.0, 0.0, 0.0)  # Cor vermelha para a face frontal
-        glVertex3fv(vertices_menor[0])
-        glVertex3fv(vertices_menor[1])
-        glVertex3fv(vertices_menor[2])
-
-        # Direita
-        glColor3f(1.0, 1.0, 1.0)  # Branco para as outras faces
-        glVertex3fv(vertices_menor[0])
-        glVertex3fv(vertices_menor[2])
-        glVertex3fv(vertices_menor[3])
-
-        # Traseira
-        glVertex3fv(vertices_menor[0])
-        glVertex3fv(vertices_menor[3])
-        glVertex3fv(vertices_menor[4])
-
-        # Esquerda
-        glVertex3fv(vertices_menor[0])
-        glVertex3fv(vertices_menor[4])
-        glVertex3fv(vertices_menor[1])
-
-        glEnd()
-
-        # Desenhar a base da pirâmide menor (quadrado)
-        glBegin(GL_QUADS)
-        glNormal3f(0.0, -1.0, 0.0)  # Normal para baixo
-        glVertex3fv(vertices_menor[1])
-        glVertex3fv(vertices_menor[2])
-        glVertex3fv(vertices_menor[3])
-        glVertex3fv(vertices_menor[4])
-        glEnd()
-
-        # Resetar a cor para o padrão após desenhar
-        glColor3f(1.0, 1.0, 1.0)
-
+        glPushMatrix()
+        glScalef(tamanho, tamanho, tamanho)
+        self.malhas.foguete().desenhar()
+        glPopMatrix()
 
     def desenhar_esfera(self, raio: float, slices: int = 20, stacks: int = 20) -> None:
         """
-        Desenha uma esfera sem o uso do GLUT.
+        Desenha uma esfera a partir da malha unitária em cache (VBO) para a resolução pedida.
 
         :param raio: Raio da esfera.
         :param slices: Número de subdivisões horizontais.
         :param stacks: Número de subdivisões verticais.
         """
-        for i in range(0, stacks):
-            lat0 = np.pi * (-0.5 + float(i) / stacks)
-            z0 = raio * np.sin(lat0)
-            zr0 = raio * np.cos(lat0)
+        glPushMatrix()
+        glScalef(raio, raio, raio)
+        self.malhas.esfera(slices, stacks).desenhar()
+        glPopMatrix()
 
-            lat1 = np.pi * (-0.5 + float(i + 1) / stacks)
-            z1 = raio * np.sin(lat1)
-            zr1 = raio * np.cos(lat1)
+    def desenhar_pontos(self, posicoes: np.ndarray, cores: List[Tuple[int, int, int]]) -> None:
+        """
+        Desenha corpos distantes como pontos de cor sólida, em uma única chamada.
 
-            glBegin(GL_QUAD_STRIP)
-            for j in range(0, slices + 1):
-                lng = 2 * np.pi * float(j) / slices
-                x = np.cos(lng)
-                y = np.sin(lng)
+        :param posicoes: Posições dos pontos, shape (K, 3).
+        :param cores: Cor RGB (0-255) de cada ponto.
+        """
+        glDisable(GL_LIGHTING)
+        glPointSize(TAMANHO_PONTO)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_DOUBLE, 0, np.ascontiguousarray(posicoes, dtype=np.float64))
+        glColorPointer(3, GL_UNSIGNED_BYTE, 0, np.array(cores, dtype=np.uint8))
+        glDrawArrays(GL_POINTS, 0, len(posicoes))
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glEnable(GL_LIGHTING)
+
+    def desenhar_rastros(
+        self,
+        corpos: List[CorpoCeleste],
+        totais_rastro: Optional[np.ndarray] = None,
+        ultimos_rastro: Optional[np.ndarray] = None,
+        ancoras_rastro: Optional[np.ndarray] = None,
+        geracoes_rastro: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Desenha os rastros dos corpos a partir de VBOs atualizados incrementalmente,
+        com uma chamada de desenho por rastro.
+
+        Rastros distantes, cujos segmentos ficariam menores que PIXELS_MINIMOS_SEGMENTO_RASTRO na
+        tela, são desenhados com menos pontos (um a cada `passo`, em potências de 2).
+
+        :param corpos: Corpos cujos rastros são desenhados (a cor do rastro é a do corpo).
+        :param totais_rastro: Total de pontos publicados do rastro de cada corpo. Se None, usa o total atual.
+        :param ultimos_rastro: Cópia publicada do ponto mais recente de cada rastro, shape (N, 3).
+            Se None, o ponto é lido do próprio rastro.
+        :param ancoras_rastro: Âncoras publicadas dos rastros, shape (N, 3). Se None, usa as atuais.
+        :param geracoes_rastro: Gerações publicadas dos rastros, shape (N,). Se None, usa as atuais.
+        """
+        # Desativar iluminação para o rastro
+        glDisable(GL_LIGHTING)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        posicao_camera = self.posicao_camera()
+
+        for idx, corpo in enumerate(corpos):
+            total = corpo.rastro.total if totais_rastro is None else int(totais_rastro[idx])
+            if corpo.rastro.tamanho(total) < 2:
+                continue
+            rastro_gpu = self.rastros_gpu.get(corpo)
+            if rastro_gpu is None or rastro_gpu.rastro is not corpo.rastro:
+                rastro_gpu = self.rastros_gpu[corpo] = RastroGPU(corpo.rastro)
+            ultimo = None if ultimos_rastro is None else ultimos_rastro[idx]
+            ancora = corpo.rastro.ancora if ancoras_rastro is None else ancoras_rastro[idx]
+            geracao = None if geracoes_rastro is None else int(geracoes_rastro[idx])
+            glColor3ub(*corpo.cor)  # Usa a cor do corpo para o rastro
+            passo = self._passo_rastro(corpo.rastro, total, posicao_camera, ancora, ultimo)
+            # Os pontos (float32) são relativos à âncora do rastro: o deslocamento até a origem
+            # flutuante é calculado em float64
+            glPushMatrix()
+            glTranslated(*(ancora - self.origem))
+            rastro_gpu.desenhar(total, passo, ultimo, geracao)
+            glPopMatrix()
 
-                # Normais
-                glNormal3f(x, y, np.sin(lat0))
-                glVertex3f(x * zr0, y * zr0, z0)
-                glNormal3f(x, y, np.sin(lat1))
-                glVertex3f(x * zr1, y * zr1, z1)
-            glEnd()
+        # Reativar iluminação após desenhar o rastro
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glEnable(GL_LIGHTING)
+
+    def _passo_rastro(
+        self,
+        rastro,
+        total: int,
+        posicao_camera: np.ndarray,
+        ancora: np.ndarray,
+        ultimo: Optional[np.ndarray] = None,
+    ) -> int:
+        """
+        Nível de detalhe de um rastro a partir do tamanho projetado de um segmento típico,
+        estimado na distância da câmera ao ponto mais recente.
+
+        :param ancora: Âncora do rastro à qual os pontos são relativos.
+        :param ultimo: Cópia publicada do ponto mais recente; se None, é lido do rastro.
+        :return: Passo entre os pontos desenhados (1 desenha todos).
+        """
+        if ultimo is None:
+            ultimo = rastro.pontos[(total - 1) % rastro.capacidade]
+        distancia = float(np.linalg.norm(ancora + ultimo - posicao_camera))
+        pixels_segmento = rastro.comprimento_segmento * self.instancias.pixels_por_radiano / max(distancia, 1.0)
+        if pixels_segmento <= 0.0 or pixels_segmento >= PIXELS_MINIMOS_SEGMENTO_RASTRO:
+            return 1
+        passo = 2 ** int(np.floor(np.log2(PIXELS_MINIMOS_SEGMENTO_RASTRO / pixels_segmento)))
+        return min(passo, MAX_PASSO_RASTRO)
 
     def desenhar_rastro(self, corpo: CorpoCeleste) -> None:
         """
         Desenha o rastro do corpo celeste.
         """
-        # Desativar iluminação para o rastro
-        glDisable(GL_LIGHTING)
-        
-        glBegin(GL_LINE_STRIP)
-        glColor3ub(*corpo.cor)  # Usa a cor do corpo para o rastro
-        for posicao in corpo.rastro:
-            glVertex3f(*posicao)
-        glEnd()
-        
-        # Reativar iluminação após desenhar o rastro
-        glEnable(GL_LIGHTING)
\ No newline at end of file
+        self.desenhar_rastros([corpo])
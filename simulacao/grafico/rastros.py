@@ -0,0 +1,161 @@
+import ctypes
+from typing import Optional
+import numpy as np
+from OpenGL.GL import *
+from simulacao.objetos.rastro import Rastro
+
+_BYTES_POR_PONTO = 3 * 4
+
+
+class RastroGPU:
+    """
+    Cópia na GPU do buffer circular espelhado de um Rastro.
+
+    A cada quadro só os pontos adicionados desde o último envio são copiados (glBufferSubData
+    nas duas posições espelhadas de cada ponto), e o rastro é desenhado com um único
+    glDrawArrays sobre a janela contígua dos pontos mais recentes.
+
+    Quando a física roda em outra thread, o ponto mais recente vem da cópia publicada no
+    instantâneo (`ultimo`), e não do buffer que a física reescreve (ver InstantaneoFisico).
+
+    Os pontos no VBO são relativos à âncora do rastro (ver Rastro); quando a geração publicada
+    muda, o rastro foi reancorado e é reenviado inteiro.
+    """
+
+    def __init__(self, rastro: Rastro):
+        """
+        Aloca o VBO com o mesmo tamanho do buffer do rastro. Requer um contexto OpenGL ativo.
+
+        :param rastro: Rastro de origem.
+        """
+        self.rastro: Rastro = rastro
+        self.enviados: int = 0  # Total de pontos do rastro já copiados para a GPU
+        # Pontos anteriores a este podem ter sido copiados enquanto a física os sobrescrevia
+        self.sobrescritos: int = 0
+        # Geração (âncora) dos pontos no VBO; -1 força o reenvio completo
+        self.geracao: int = -1
+        self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, max(rastro.pontos.nbytes, _BYTES_POR_PONTO), None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def _enviar_faixa(self, inicio: int, fim: int) -> None:
+        """
+        Copia as linhas [inicio, fim) do buffer do rastro para as mesmas posições do VBO.
+        """
+        if fim > inicio:
+            dados = self.rastro.pontos[inicio:fim]
+            glBufferSubData(GL_ARRAY_BUFFER, inicio * _BYTES_POR_PONTO, dados.nbytes, dados)
+
+    def _enviar_ultimo(self, total: int, ultimo: Optional[np.ndarray]) -> None:
+        """
+        Copia o ponto `total` - 1 para as suas duas posições no VBO, a partir de `ultimo` (se
+        informado) ou do buffer do rastro.
+        """
+        capacidade = self.rastro.capacidade
+        k = (total - 1) % capacidade
+        if ultimo is None:
+            self._enviar_faixa(k, k + 1)
+            self._enviar_faixa(k + capacidade, k + capacidade + 1)
+            return
+        dados = np.ascontiguousarray(ultimo, dtype=np.float32)
+        for deslocamento in (0, capacidade):
+            glBufferSubData(GL_ARRAY_BUFFER, (k + deslocamento) * _BYTES_POR_PONTO, _BYTES_POR_PONTO, dados)
+
+    def sincronizar(self, total: int, ultimo: Optional[np.ndarray] = None, geracao: Optional[int] = None) -> None:
+        """
+        Envia à GPU os pontos novos até o ponto `total` (exclusive). O VBO deve estar vinculado.
+
+        :param total: Total de pontos publicados do rastro.
+        :param ultimo: Cópia do ponto `total` - 1 publicada junto com `total`, usada no lugar do
+            buffer do rastro. Se None, o ponto é lido do buffer.
+        :param geracao: Geração do rastro publicada junto com `total` (padrão: a atual).
+        """
+        capacidade = self.rastro.capacidade
+        geracao = self.rastro.geracao if geracao is None else int(geracao)
+        if total < self.enviados or geracao != self.geracao:
+            # O rastro foi limpo ou reancorado: reenvia a partir do início
+            self.enviados = 0
+            self.sobrescritos = 0
+            self.geracao = geracao
+        novos = total - self.enviados
+        if novos <= 0:
+            if total and self.rastro.decimado:
+                # O ponto provisório de um rastro decimado é reescrito sem aumentar o total
+                self._enviar_ultimo(total, ultimo)
+            return
+        if novos >= capacidade:
+            # Mais pontos novos que a capacidade: reenvia o buffer inteiro
+            self._enviar_faixa(0, 2 * capacidade)
+        else:
+            primeiro = self.enviados % capacidade
+            fim = primeiro + novos  # Exclusive; pode passar da capacidade
+            for deslocamento in (0, capacidade):
+                self._enviar_faixa(primeiro + deslocamento, min(fim, capacidade) + deslocamento)
+                if fim > capacidade:
+                    self._enviar_faixa(deslocamento, fim - capacidade + deslocamento)
+        if self.rastro.decimado and self.enviados > 0 and novos < capacidade:
+            # O antigo ponto provisório pode ter sido reescrito antes de ser fixado
+            anterior = (self.enviados - 1) % capacidade
+            self._enviar_faixa(anterior, anterior + 1)
+            self._enviar_faixa(anterior + capacidade, anterior + capacidade + 1)
+        if ultimo is not None:
+            # O ponto mais recente lido do buffer pode ter sido reescrito durante a cópia
+            self._enviar_ultimo(total, ultimo)
+        self.enviados = total
+
+    def desenhar(
+        self,
+        total: Optional[int] = None,
+        passo: int = 1,
+        ultimo: Optional[np.ndarray] = None,
+        geracao: Optional[int] = None,
+    ) -> None:
+        """
+        Sincroniza e desenha o rastro até o ponto `total` como uma linha contínua, em
+        coordenadas relativas à âncora do rastro.
+
+        :param total: Total de pontos publicados do rastro (padrão: o total atual).
+        :param passo: Nível de detalhe: desenha um a cada `passo` pontos, sempre incluindo o
+            ponto mais recente (a janela é contígua, então basta um stride no ponteiro).
+        :param ultimo: Cópia do ponto mais recente publicada junto com `total` por uma física
+            em outra thread. Com ela, os pontos mais antigos da janela que a física já
+            sobrescreveu (ou pode estar sobrescrevendo) ao dar a volta no buffer não são desenhados.
+        :param geracao: Geração do rastro publicada junto com `total` (padrão: a atual).
+        """
+        rastro = self.rastro
+        total = rastro.total if total is None else int(total)
+        geracao = rastro.geracao if geracao is None else int(geracao)
+        if rastro.tamanho(total) < 2:
+            return
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        if ultimo is None or rastro.geracao == geracao:
+            self.sincronizar(total, ultimo, geracao)
+            if rastro.geracao != geracao:
+                # A física reancorou o rastro durante a cópia: o VBO pode misturar as duas âncoras
+                self.geracao = -1
+        else:
+            # A física já reancorou o rastro, mas o instantâneo ainda não: desenha o que já está na GPU
+            total = min(total, self.enviados)
+        tamanho = rastro.tamanho(total)
+        if self.geracao != geracao or tamanho < 2:
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            return
+        inicio = rastro.inicio(total)
+        if ultimo is not None:
+            # Lido depois da cópia: o ponto `rastro.total` pode estar sendo gravado agora. Os
+            # pontos sobrescritos só são corrigidos no VBO quando já saíram da janela.
+            self.sobrescritos = max(self.sobrescritos, rastro.total + 1 - rastro.capacidade)
+            descartados = self.sobrescritos - (total - tamanho)
+            if descartados > 0:
+                inicio += descartados
+                tamanho -= descartados
+                if tamanho < 2:
+                    glBindBuffer(GL_ARRAY_BUFFER, 0)
+                    return
+        passo = max(1, min(int(passo), (tamanho - 1) // 2 or 1))
+        resto = (tamanho - 1) % passo
+        deslocamento = (inicio + resto) * _BYTES_POR_PONTO
+        glVertexPointer(3, GL_FLOAT, passo * _BYTES_POR_PONTO, ctypes.c_void_p(deslocamento))
+        glDrawArrays(GL_LINE_STRIP, 0, (tamanho - 1) // passo + 1)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
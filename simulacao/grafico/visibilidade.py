@@ -0,0 +1,89 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from simulacao.objetos.corpo_celeste import CorpoCeleste
+
+# Níveis de detalhe das esferas: raio projetado mínimo (px) de cada nível e a resolução
+# (fatias, pilhas) da malha. Abaixo do primeiro limite o corpo é desenhado como ponto (nível 0).
+LIMITES_DETALHE: Tuple[float, ...] = (1.5, 12.0, 48.0, 160.0)
+RESOLUCOES_DETALHE: Tuple[Optional[Tuple[int, int]], ...] = (None, (8, 8), (12, 12), (20, 20), (32, 32))
+NIVEL_PONTO = 0
+
+
+def planos_frustum(projecao: np.ndarray, modelo_visao: np.ndarray) -> np.ndarray:
+    """
+    Extrai os seis planos do volume de visão, em coordenadas do mundo.
+
+    Usa as linhas da matriz projeção × modelo-visão (método de Gribb e Hartmann); cada plano é
+    normalizado para que a distância com sinal de um ponto seja n·p + d, positiva dentro do volume.
+
+    :param projecao: Matriz de projeção 4×4 (convenção de coluna, como em OpenGL).
+    :param modelo_visao: Matriz de modelo-visão 4×4.
+    :return: Array (6, 4) com (nx, ny, nz, d) dos planos esquerdo, direito, inferior, superior, próximo e distante.
+    """
+    m = projecao @ modelo_visao
+    planos = np.array([m[3] + m[0], m[3] - m[0], m[3] + m[1], m[3] - m[1], m[3] + m[2], m[3] - m[2]])
+    return planos / np.linalg.norm(planos[:, :3], axis=1, keepdims=True)
+
+
+class Visibilidade:
+    """
+    Passo de visibilidade por quadro, vetorizado sobre as posições de todos os corpos.
+
+    Descarta as esferas fora do volume de visão e escolhe o nível de detalhe de cada corpo a
+    partir do seu raio projetado em pixels (ver LIMITES_DETALHE).
+    """
+
+    def __init__(self, campo_visao: float, altura: int):
+        """
+        :param campo_visao: Campo de visão vertical da projeção, em graus.
+        :param altura: Altura da janela em pixels.
+        """
+        self.pixels_por_radiano: float = altura / (2.0 * np.tan(np.radians(campo_visao) / 2.0))
+        self.planos: np.ndarray = np.zeros((6, 4))
+        self.profundidade: np.ndarray = np.zeros(4)  # Linha da modelo-visão que dá a profundidade (-z do olho)
+        self.posicao_camera: np.ndarray = np.zeros(3)
+
+        self._corpos: Optional[List[CorpoCeleste]] = None
+        self._raios: np.ndarray = np.zeros(0)
+
+    def atualizar_camera(self, projecao: np.ndarray, modelo_visao: np.ndarray) -> None:
+        """
+        Atualiza os planos do volume de visão para as matrizes do quadro.
+
+        :param projecao: Matriz de projeção 4×4 (convenção de coluna).
+        :param modelo_visao: Matriz de modelo-visão 4×4 (convenção de coluna).
+        """
+        self.planos = planos_frustum(projecao, modelo_visao)
+        self.profundidade = -modelo_visao[2]
+        rotacao, translacao = modelo_visao[:3, :3], modelo_visao[:3, 3]
+        self.posicao_camera = -rotacao.T @ translacao
+
+    def raios(self, corpos: List[CorpoCeleste]) -> np.ndarray:
+        """
+        Raios de desenho (raio × fator de escala) dos corpos, recalculados só quando a lista muda.
+        """
+        if self._corpos is not corpos or len(self._raios) != len(corpos):
+            self._corpos = corpos
+            self._raios = np.array([corpo.raio * corpo.fator_escala for corpo in corpos], dtype=float)
+        return self._raios
+
+    def calcular(self, corpos: List[CorpoCeleste], posicoes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Classifica os corpos do quadro.
+
+        :param corpos: Lista de corpos celestes.
+        :param posicoes: Posições de desenho dos corpos, shape (N, 3).
+        :return: Tupla (visíveis (N,) bool, raio projetado em pixels (N,), nível de detalhe (N,) int).
+            O nível indexa RESOLUCOES_DETALHE; NIVEL_PONTO indica desenho como ponto.
+        """
+        raios = self.raios(corpos)
+        if len(raios) == 0:
+            return np.zeros(0, dtype=bool), np.zeros(0), np.zeros(0, dtype=np.int64)
+        # Uma esfera está visível se não estiver inteiramente atrás de nenhum dos seis planos
+        distancias = posicoes @ self.planos[:, :3].T + self.planos[:, 3]
+        visiveis = np.all(distancias > -raios[:, None], axis=1)
+
+        profundidades = posicoes @ self.profundidade[:3] + self.profundidade[3]
+        raio_pixels = raios * self.pixels_por_radiano / np.maximum(profundidades, 1.0)
+        niveis = np.digitize(raio_pixels, LIMITES_DETALHE)
+        return visiveis, raio_pixels, niveis
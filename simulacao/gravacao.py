@@ -0,0 +1,325 @@
+# simulacao/gravacao.py
+#
+# Gravação de vídeos de simulações longas: a física avança em passo fixo, cada quadro é
+# desenhado fora da tela (framebuffer object em uma janela oculta) e lido de volta de forma
+# assíncrona por pixel buffer objects, sem depender do tempo real.
+
+import argparse
+import ctypes
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from typing import List, Optional
+import numpy as np
+import pygame
+from OpenGL.GL import *
+from simulacao.grafico.motor_grafico import MotorGrafico
+from simulacao.grafico.camera import Camera
+from simulacao.fisica.motor_fisico import MotorFisico, METODOS_GRAVIDADE, MODOS_PROPAGACAO
+from simulacao.fisica.integradores import INTEGRADORES
+from simulacao.headless import resolver_caminho_cena
+from simulacao.util.gerenciador_dados import carregar_cena
+
+# Extensões gravadas como vídeo por um codificador externo; qualquer outro destino é um diretório de PNGs
+EXTENSOES_VIDEO = (".mp4", ".mkv", ".mov", ".avi", ".webm")
+
+
+class QuadroOffscreen:
+    """
+    Framebuffer object com buffers de cor (RGBA8) e profundidade, usado como alvo do desenho.
+    """
+
+    def __init__(self, largura: int, altura: int):
+        """
+        Cria o framebuffer. Requer um contexto OpenGL ativo.
+
+        :param largura: Largura em pixels.
+        :param altura: Altura em pixels.
+        """
+        self.largura: int = largura
+        self.altura: int = altura
+        self.fbo = glGenFramebuffers(1)
+        self.buffer_cor, self.buffer_profundidade = glGenRenderbuffers(2)
+
+        glBindRenderbuffer(GL_RENDERBUFFER, self.buffer_cor)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, largura, altura)
+        glBindRenderbuffer(GL_RENDERBUFFER, self.buffer_profundidade)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, largura, altura)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, self.buffer_cor)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, self.buffer_profundidade)
+        situacao = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        if situacao != GL_FRAMEBUFFER_COMPLETE:
+            raise RuntimeError(f"Framebuffer offscreen incompleto (status 0x{int(situacao):x}).")
+
+    def vincular(self) -> None:
+        """
+        Direciona o desenho e a leitura de pixels para este framebuffer.
+        """
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        glViewport(0, 0, self.largura, self.altura)
+
+    def liberar(self) -> None:
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glDeleteFramebuffers(1, [self.fbo])
+        glDeleteRenderbuffers(2, [self.buffer_cor, self.buffer_profundidade])
+
+
+class LeitorQuadros:
+    """
+    Leitura assíncrona de quadros com um anel de pixel buffer objects.
+
+    glReadPixels com um PBO vinculado retorna sem esperar a GPU; o quadro só é mapeado para a
+    CPU `num_buffers - 1` quadros depois, quando a cópia já terminou, de modo que a leitura não
+    interrompe o desenho dos quadros seguintes.
+    """
+
+    def __init__(self, largura: int, altura: int, num_buffers: int = 3):
+        """
+        Aloca os PBOs. Requer um contexto OpenGL ativo.
+
+        :param largura: Largura dos quadros em pixels.
+        :param altura: Altura dos quadros em pixels.
+        :param num_buffers: Tamanho do anel (latência, em quadros, entre a leitura e a entrega).
+        """
+        self.largura: int = largura
+        self.altura: int = altura
+        self.tamanho_quadro: int = largura * altura * 3
+        self.pbos: List[int] = list(np.atleast_1d(glGenBuffers(max(num_buffers, 2))))
+        for pbo in self.pbos:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+            glBufferData(GL_PIXEL_PACK_BUFFER, self.tamanho_quadro, None, GL_STREAM_READ)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        self.lidos: int = 0  # Quadros com leitura já iniciada
+        self.entregues: int = 0  # Quadros já copiados para a CPU
+
+    def ler(self) -> Optional[np.ndarray]:
+        """
+        Inicia a leitura do quadro atual e entrega o quadro mais antigo já disponível.
+
+        :return: Quadro (altura, largura, 3) uint8, de baixo para cima como em OpenGL, ou None
+            enquanto o anel ainda está enchendo.
+        """
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.pbos[self.lidos % len(self.pbos)])
+        glReadPixels(0, 0, self.largura, self.altura, GL_RGB, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        self.lidos += 1
+        quadro = self._entregar() if self.lidos - self.entregues >= len(self.pbos) else None
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        return quadro
+
+    def esvaziar(self) -> List[np.ndarray]:
+        """
+        Entrega todos os quadros cuja leitura foi iniciada e ainda não foram entregues.
+        """
+        quadros = []
+        while self.entregues < self.lidos:
+            quadros.append(self._entregar())
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        return quadros
+
+    def _entregar(self) -> np.ndarray:
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.pbos[self.entregues % len(self.pbos)])
+        endereco = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+        # Copia antes de desmapear: o PBO será reutilizado pela próxima leitura
+        dados = (ctypes.c_ubyte * self.tamanho_quadro).from_address(endereco)
+        quadro = np.frombuffer(dados, dtype=np.uint8).reshape(self.altura, self.largura, 3).copy()
+        glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        self.entregues += 1
+        return quadro
+
+    def liberar(self) -> None:
+        glDeleteBuffers(len(self.pbos), self.pbos)
+
+
+class SaidaQuadros:
+    """
+    Grava os quadros em uma thread própria: sequência de PNGs em um diretório ou vídeo
+    codificado pelo ffmpeg (quadros brutos RGB enviados por um pipe).
+    """
+
+    def __init__(self, destino: str, largura: int, altura: int, fps: int, max_pendentes: int = 16):
+        """
+        :param destino: Arquivo de vídeo (extensão em EXTENSOES_VIDEO) ou diretório para os PNGs.
+        :param largura: Largura dos quadros em pixels.
+        :param altura: Altura dos quadros em pixels.
+        :param fps: Taxa de quadros do vídeo.
+        :param max_pendentes: Quadros aguardando gravação antes de o desenho esperar pelo disco/codificador.
+        """
+        self.destino: str = destino
+        self.largura: int = largura
+        self.altura: int = altura
+        self.gravados: int = 0
+        self._processo: Optional[subprocess.Popen] = None
+        self._erro: Optional[BaseException] = None
+
+        if destino.lower().endswith(EXTENSOES_VIDEO):
+            ffmpeg = shutil.which("ffmpeg")
+            if ffmpeg is None:
+                raise FileNotFoundError("ffmpeg não encontrado no PATH; grave em um diretório de PNGs.")
+            self._processo = subprocess.Popen(
+                [
+                    ffmpeg, "-y", "-loglevel", "error",
+                    "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{largura}x{altura}", "-r", str(fps), "-i", "-",
+                    "-c:v", "libx264", "-pix_fmt", "yuv420p", destino,
+                ],
+                stdin=subprocess.PIPE,
+            )
+        else:
+            os.makedirs(destino, exist_ok=True)
+
+        self._fila: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=max_pendentes)
+        self._thread = threading.Thread(target=self._executar, name="saida-quadros", daemon=True)
+        self._thread.start()
+
+    def enviar(self, quadro: np.ndarray) -> None:
+        """
+        Enfileira um quadro (de baixo para cima, como lido do OpenGL) para gravação.
+        """
+        if self._erro is not None:
+            raise self._erro
+        self._fila.put(quadro)
+
+    def _executar(self) -> None:
+        try:
+            while True:
+                quadro = self._fila.get()
+                if quadro is None:
+                    break
+                quadro = np.ascontiguousarray(quadro[::-1])  # OpenGL lê de baixo para cima
+                if self._processo is not None:
+                    self._processo.stdin.write(quadro.tobytes())
+                else:
+                    superficie = pygame.image.frombuffer(quadro.tobytes(), (self.largura, self.altura), "RGB")
+                    pygame.image.save(superficie, os.path.join(self.destino, f"quadro_{self.gravados:06d}.png"))
+                self.gravados += 1
+        except BaseException as erro:
+            self._erro = erro
+            # Continua consumindo a fila para não bloquear quem envia
+            while self._fila.get() is not None:
+                pass
+
+    def fechar(self) -> None:
+        """
+        Espera a gravação dos quadros pendentes e encerra o codificador.
+        """
+        self._fila.put(None)
+        self._thread.join()
+        if self._processo is not None:
+            self._processo.stdin.close()
+            if self._processo.wait() != 0 and self._erro is None:
+                self._erro = RuntimeError(f"ffmpeg terminou com código {self._processo.returncode}.")
+        if self._erro is not None:
+            raise self._erro
+
+
+def renderizar_video(
+    caminho_cena: str,
+    destino: str,
+    duracao: float,
+    tempo_por_quadro: float = 86400.0,
+    delta_t: float = 3600.0,
+    fps: int = 30,
+    largura: int = 1280,
+    altura: int = 720,
+    motor_fisico: Optional[MotorFisico] = None,
+    camera: Optional[Camera] = None,
+) -> int:
+    """
+    Avança a simulação em passo fixo e grava um quadro a cada `tempo_por_quadro` segundos simulados,
+    o mais rápido que a CPU e a GPU permitirem.
+
+    :param caminho_cena: Caminho para o arquivo JSON da cena.
+    :param destino: Arquivo de vídeo (ex.: "missao.mp4", requer ffmpeg) ou diretório para a sequência de PNGs.
+    :param duracao: Tempo simulado total (s).
+    :param tempo_por_quadro: Tempo simulado entre quadros (s); arredondado para um múltiplo de `delta_t`.
+    :param delta_t: Passo de integração (s).
+    :param fps: Taxa de quadros do vídeo.
+    :param largura: Largura dos quadros em pixels.
+    :param altura: Altura dos quadros em pixels.
+    :param motor_fisico: Motor físico já configurado. Se None, usa o padrão da simulação interativa.
+    :param camera: Câmera usada nos quadros. Se None, usa a vista inicial da simulação interativa.
+    :return: Número de quadros gravados.
+    """
+    corpos, _ = carregar_cena(caminho_cena)
+    motor = motor_fisico if motor_fisico is not None else MotorFisico(integrador="leapfrog")
+    if camera is None:
+        camera = Camera(
+            posicao=np.array([3e11, 0, 5e10]),
+            alvo=np.array([0.0, 0.0, 0.0]),
+            rotacao=np.array([0.0, 0.0, -90.0])
+        )
+    passos_por_quadro = max(1, int(round(tempo_por_quadro / delta_t)))
+    num_quadros = int(np.ceil(duracao / (passos_por_quadro * delta_t))) + 1
+
+    pygame.display.init()
+    motor_grafico = MotorGrafico(largura=largura, altura=altura, oculta=True)
+    alvo = QuadroOffscreen(largura, altura)
+    leitor = LeitorQuadros(largura, altura)
+    saida = SaidaQuadros(destino, largura, altura, fps)
+    try:
+        alvo.vincular()
+        for quadro in range(num_quadros):
+            if quadro:
+                for _ in range(passos_por_quadro):
+                    motor.atualizar_corpos(corpos, delta_t)
+            motor_grafico.limpar_tela()
+            motor_grafico.aplicar_camera(camera)
+            motor_grafico.desenhar_corpos(corpos)
+            imagem = leitor.ler()
+            if imagem is not None:
+                saida.enviar(imagem)
+        for imagem in leitor.esvaziar():
+            saida.enviar(imagem)
+    finally:
+        saida.fechar()
+        leitor.liberar()
+        alvo.liberar()
+        pygame.display.quit()
+    return saida.gravados
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Grava um vídeo da simulação desenhando fora da tela, sem depender do tempo real.")
+    parser.add_argument("cena", help="Arquivo JSON da cena ou nome de uma cena embutida (ex.: solar).")
+    parser.add_argument("--duracao", type=float, required=True, help="Tempo simulado total, em segundos.")
+    parser.add_argument("--tempo-por-quadro", type=float, default=86400.0, help="Tempo simulado entre quadros, em segundos.")
+    parser.add_argument("--delta-t", type=float, default=3600.0, help="Passo de integração, em segundos.")
+    parser.add_argument("--fps", type=int, default=30, help="Taxa de quadros do vídeo.")
+    parser.add_argument("--largura", type=int, default=1280)
+    parser.add_argument("--altura", type=int, default=720)
+    parser.add_argument("--integrador", choices=list(INTEGRADORES), default="leapfrog")
+    parser.add_argument("--propagacao", choices=MODOS_PROPAGACAO, default="numerica", help="\"efemeride\" move analiticamente os corpos marcados com \"efemeride\" na cena.")
+    parser.add_argument("--gravidade", choices=METODOS_GRAVIDADE, default="direto")
+    parser.add_argument("--saida", default="simulacao.mp4", help="Arquivo de vídeo (requer ffmpeg) ou diretório para PNGs.")
+    args = parser.parse_args(argv)
+
+    motor = MotorFisico(metodo_gravidade=args.gravidade, integrador=args.integrador, propagacao=args.propagacao)
+
+    inicio = time.perf_counter()
+    quadros = renderizar_video(
+        resolver_caminho_cena(args.cena),
+        args.saida,
+        duracao=args.duracao,
+        tempo_por_quadro=args.tempo_por_quadro,
+        delta_t=args.delta_t,
+        fps=args.fps,
+        largura=args.largura,
+        altura=args.altura,
+        motor_fisico=motor,
+    )
+    decorrido = time.perf_counter() - inicio
+
+    print(
+        f"{quadros} quadros ({quadros / args.fps:.1f} s de vídeo) gravados em {decorrido:.2f} s "
+        f"({quadros / max(decorrido, 1e-9):.1f} quadros/s) -> {args.saida}"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# simulacao/headless.py
+#
+# Execução da física sem interface gráfica: não importa pygame nem OpenGL,
+# podendo rodar em nós de cálculo sem GPU e em integração contínua.
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Optional
+import numpy as np
+from simulacao.fisica.motor_fisico import MotorFisico, METODOS_GRAVIDADE, MODOS_PROPAGACAO
+from simulacao.fisica.integradores import INTEGRADORES
+from simulacao.util.gerenciador_dados import carregar_cena, carregar_estado_binario
+
+DIRETORIO_CENAS = os.path.join(os.path.dirname(__file__), "cenas")
+
+
+def resolver_caminho_cena(cena: str) -> str:
+    """
+    Aceita um caminho para um arquivo de cena (JSON ou binária .npz) ou o nome de uma cena embutida (ex.: "solar").
+
+    :param cena: Caminho ou nome da cena.
+    :return: Caminho do arquivo da cena.
+    """
+    if os.path.exists(cena):
+        return cena
+    nome = cena if cena.endswith(".json") else f"{cena}.json"
+    caminho = os.path.join(DIRETORIO_CENAS, nome)
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"Cena não encontrada: '{cena}'.")
+    return caminho
+
+
+def executar_sem_interface(
+    caminho_cena: str,
+    duracao: float,
+    delta_t: float = 3600.0,
+    intervalo_saida: Optional[float] = None,
+    motor_fisico: Optional[MotorFisico] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Avança a física de uma cena pelo tempo simulado pedido, o mais rápido que a CPU permitir.
+
+    Cenas binárias (.npz) são carregadas direto no estado físico, sem objetos para as
+    partículas de teste (ver carregar_estado_binario).
+
+    :param caminho_cena: Caminho para o arquivo da cena (JSON ou binária .npz).
+    :param duracao: Tempo simulado total (s).
+    :param delta_t: Passo de integração (s).
+    :param intervalo_saida: Intervalo de tempo simulado entre amostras gravadas (s). Se None, grava só o estado final.
+    :param motor_fisico: Motor físico já configurado. Se None, usa o padrão.
+    :return: Dicionário com "nomes", "tempos", "posicoes" (T, N, 3), "velocidades" (T, N, 3) e "massas" (T, N).
+    """
+    motor = motor_fisico if motor_fisico is not None else MotorFisico()
+    if caminho_cena.endswith(".npz"):
+        estado, _ = carregar_estado_binario(caminho_cena)
+        corpos = estado.corpos
+        motor.adotar_estado(estado)
+        nomes = estado.nomes
+    else:
+        corpos, _ = carregar_cena(caminho_cena)
+        nomes = np.array([corpo.nome for corpo in corpos])
+
+    tempos: List[float] = []
+    posicoes: List[np.ndarray] = []
+    velocidades: List[np.ndarray] = []
+    massas: List[np.ndarray] = []
+
+    def amostrar() -> None:
+        estado = motor.obter_estado(corpos)
+        tempos.append(motor.tempo)
+        posicoes.append(estado.posicoes.copy())
+        velocidades.append(estado.velocidades.copy())
+        massas.append(estado.massas.copy())
+
+    passos = int(np.ceil(duracao / delta_t))
+    passos_por_amostra = max(1, int(round(intervalo_saida / delta_t))) if intervalo_saida else None
+    if passos_por_amostra:
+        amostrar()
+
+    for passo in range(1, passos + 1):
+        # O último passo é encurtado para terminar exatamente na duração pedida
+        motor.atualizar_corpos(corpos, min(delta_t, duracao - (passo - 1) * delta_t))
+        if passos_por_amostra and passo % passos_por_amostra == 0:
+            amostrar()
+
+    if not tempos or tempos[-1] != motor.tempo:
+        amostrar()
+
+    return {
+        "nomes": nomes,
+        "tempos": np.array(tempos),
+        "posicoes": np.array(posicoes),
+        "velocidades": np.array(velocidades),
+        "massas": np.array(massas),
+    }
+
+
+def salvar_resultados(resultados: Dict[str, np.ndarray], caminho_saida: str) -> None:
+    """
+    Grava os resultados em .npz (trajetórias completas) ou .json (apenas o estado final).
+
+    :param resultados: Dicionário retornado por executar_sem_interface.
+    :param caminho_saida: Caminho do arquivo de saída.
+    """
+    if caminho_saida.endswith(".json"):
+        final = {
+            "tempo": float(resultados["tempos"][-1]),
+            "corpos": [
+                {
+                    "nome": str(nome),
+                    "massa": float(massa),
+                    "posicao": posicao.tolist(),
+                    "velocidade": velocidade.tolist(),
+                }
+                for nome, massa, posicao, velocidade in zip(
+                    resultados["nomes"], resultados["massas"][-1], resultados["posicoes"][-1], resultados["velocidades"][-1]
+                )
+            ],
+        }
+        with open(caminho_saida, "w") as arquivo:
+            json.dump(final, arquivo, indent=4, ensure_ascii=False)
+    else:
+        np.savez_compressed(caminho_saida, **resultados)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Executa a simulação sem interface gráfica (sem pygame/OpenGL).")
+    parser.add_argument("cena", help="Arquivo da cena (JSON ou .npz) ou nome de uma cena embutida (ex.: solar).")
+    parser.add_argument("--duracao", type=float, required=True, help="Tempo simulado total, em segundos.")
+    parser.add_argument("--delta-t", type=float, default=3600.0, help="Passo de integração, em segundos.")
+    parser.add_argument("--intervalo-saida", type=float, default=None, help="Intervalo entre amostras gravadas, em segundos.")
+    parser.add_argument("--integrador", choices=list(INTEGRADORES), default="leapfrog")
+    parser.add_argument("--propagacao", choices=MODOS_PROPAGACAO, default="numerica", help="\"efemeride\" move analiticamente os corpos marcados com \"efemeride\" na cena.")
+    parser.add_argument("--gravidade", choices=METODOS_GRAVIDADE, default="direto")
+    parser.add_argument("--theta", type=float, default=0.5, help="Ângulo de abertura do Barnes–Hut.")
+    parser.add_argument("--trabalhadores", type=int, default=None, help="Processos da gravidade \"paralelo\" (padrão: nº de CPUs).")
+    parser.add_argument("--saida", default="resultado.npz", help="Arquivo de saída (.npz ou .json).")
+    args = parser.parse_args(argv)
+
+    motor = MotorFisico(
+        metodo_gravidade=args.gravidade,
+        theta=args.theta,
+        integrador=args.integrador,
+        propagacao=args.propagacao,
+        trabalhadores=args.trabalhadores,
+    )
+
+    inicio = time.perf_counter()
+    resultados = executar_sem_interface(
+        resolver_caminho_cena(args.cena),
+        duracao=args.duracao,
+        delta_t=args.delta_t,
+        intervalo_saida=args.intervalo_saida,
+        motor_fisico=motor,
+    )
+    decorrido = time.perf_counter() - inicio
+    salvar_resultados(resultados, args.saida)
+
+    print(
+        f"{args.duracao:.0f} s simulados em {decorrido:.2f} s de CPU "
+        f"({len(resultados['tempos'])} amostras, {len(resultados['nomes'])} corpos) -> {args.saida}"
+    )
+
+if __name__ == "__main__":
+    main()
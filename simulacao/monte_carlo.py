@@ -0,0 +1,475 @@
+# simulacao/monte_carlo.py
+#
+# Lançamentos de Monte Carlo em lote: milhares de cópias do foguete de uma cena, com empuxo,
+# combustível e instante de lançamento perturbados, propagadas como partículas de teste em um
+# único array vetorizado. Como headless.py, não importa pygame nem OpenGL.
+
+import argparse
+import os
+import time
+from multiprocessing import get_context
+from typing import Dict, List, Optional
+import numpy as np
+from simulacao.fisica.gravidade import G, aceleracoes_diretas
+from simulacao.fisica.lambert import planejar_transferencia
+from simulacao.fisica.tabela_efemerides import TabelaEfemerides
+from simulacao.headless import resolver_caminho_cena
+from simulacao.objetos.corpo_celeste import CorpoCeleste
+from simulacao.objetos.foguete import Foguete
+from simulacao.util.gerenciador_dados import carregar_cena
+
+DIA = 86400.0
+
+# Desvios-padrão das perturbações normais: empuxo e combustível são relativos (fração do valor
+# da cena), o instante de lançamento é absoluto (s) e o erro de apontamento está em graus
+DISTRIBUICAO_PADRAO: Dict[str, float] = {
+    "empuxo": 0.02,
+    "combustivel": 0.02,
+    "tempo_lancamento": 6 * 3600.0,
+    "apontamento": 0.5,
+}
+
+# Métricas por lançamento devolvidas por executar_monte_carlo
+METRICAS = ("aproximacao_minima", "tempo_aproximacao", "combustivel_restante", "delta_v_usado")
+
+
+class Missao:
+    """
+    Dados comuns a todos os lançamentos de um lote: a efeméride dos corpos da cena (calculada uma
+    única vez e compartilhada pelos processos), o foguete nominal e a queima nominal de partida,
+    a de menor Δv de uma grade porkchop de Lambert da origem ao destino.
+    """
+
+    def __init__(
+        self,
+        tabela: TabelaEfemerides,
+        indice_origem: int,
+        indice_destino: int,
+        indices_fontes: np.ndarray,
+        massas_fonte: np.ndarray,
+        deslocamento_inicial: np.ndarray,
+        massa: float,
+        empuxo: float,
+        consumo: float,
+        combustivel: float,
+        tempo_partida: float,
+        delta_v: np.ndarray,
+        tempo_voo: float,
+    ):
+        """
+        :param tabela: Efemérides dos corpos da cena (sem o foguete).
+        :param indice_origem: Corpo de onde o foguete parte, na tabela.
+        :param indice_destino: Corpo de destino, na tabela.
+        :param indices_fontes: Corpos que geram gravidade, na tabela.
+        :param massas_fonte: Massas desses corpos (kg).
+        :param deslocamento_inicial: Posição do foguete relativa à origem até o lançamento (m).
+        :param massa: Massa inicial do foguete, com combustível (kg).
+        :param empuxo: Empuxo máximo nominal (N).
+        :param consumo: Consumo de combustível a empuxo máximo (kg/s).
+        :param combustivel: Combustível inicial nominal (kg).
+        :param tempo_partida: Instante nominal de lançamento (s).
+        :param delta_v: Vetor Δv nominal da queima de partida (m/s).
+        :param tempo_voo: Tempo de voo nominal (s).
+        """
+        self.tabela = tabela
+        self.indice_origem = indice_origem
+        self.indice_destino = indice_destino
+        self.indices_fontes = indices_fontes
+        self.massas_fonte = massas_fonte
+        self.deslocamento_inicial = deslocamento_inicial
+        self.massa = massa
+        self.empuxo = empuxo
+        self.consumo = consumo
+        self.combustivel = combustivel
+        self.tempo_partida = tempo_partida
+        self.delta_v = delta_v
+        self.tempo_voo = tempo_voo
+
+
+def preparar_missao(
+    caminho_cena: str,
+    janela_partida: float = 800 * DIA,
+    tempos_voo: Optional[np.ndarray] = None,
+    passo_efemerides: float = DIA,
+    subpassos_efemerides: int = 6,
+) -> Missao:
+    """
+    Carrega a cena, integra a efeméride dos corpos e escolhe a queima nominal de partida.
+
+    A transferência nominal é a de menor Δv (encontro) entre a origem do foguete (o corpo de onde
+    a cena o lança) e seu destino, com o corpo mais massivo como corpo central.
+
+    :param caminho_cena: Caminho para o arquivo JSON da cena.
+    :param janela_partida: Partidas nominais candidatas entre 0 e este instante (s).
+    :param tempos_voo: Tempos de voo candidatos (s). Padrão: de 30 a 600 dias.
+    :param passo_efemerides: Intervalo entre amostras da efeméride (s).
+    :param subpassos_efemerides: Passos de integração por amostra da efeméride.
+    :return: Missão pronta para propagar_lote.
+    """
+    corpos, foguete = carregar_cena(caminho_cena)
+    if not isinstance(foguete.destino, CorpoCeleste):
+        raise ValueError("O foguete da cena precisa ter um corpo celeste como destino.")
+    tempos_voo = np.linspace(30.0, 600.0, 240) * DIA if tempos_voo is None else np.asarray(tempos_voo, dtype=float)
+
+    planetas = [corpo for corpo in corpos if not isinstance(corpo, Foguete)]
+    massas = np.array([corpo.massa for corpo in planetas], dtype=float)
+    fontes = np.flatnonzero([corpo.massa > 0 and not corpo.particula_teste for corpo in planetas])
+    posicoes = np.array([corpo.posicao for corpo in planetas], dtype=float)
+    velocidades = np.array([corpo.velocidade for corpo in planetas], dtype=float)
+    indice_destino = planetas.index(foguete.destino)
+    indice_origem = int(np.argmin(np.linalg.norm(posicoes - foguete.posicao, axis=1)))
+    indice_central = int(np.argmax(massas))
+
+    # A efeméride cobre a janela de partida e o voo mais longo, com folga para os atrasos de lançamento
+    duracao = janela_partida + float(np.max(tempos_voo)) + 30 * DIA
+    tabela = TabelaEfemerides.integrar(
+        posicoes, velocidades, massas, fontes, passo_efemerides, duracao, subpassos=subpassos_efemerides
+    )
+
+    def relativos(indice: int):
+        def estados(tempos: np.ndarray):
+            p, v = tabela.estados_em(tempos, indice)
+            pc, vc = tabela.estados_em(tempos, indice_central)
+            return p - pc, v - vc
+        return estados
+
+    plano = planejar_transferencia(
+        relativos(indice_origem), relativos(indice_destino),
+        np.arange(0.0, janela_partida, passo_efemerides), tempos_voo, G * massas[indice_central],
+    )
+    if plano is None:
+        raise RuntimeError("Nenhuma transferência de Lambert encontrada para a missão nominal.")
+
+    # Cônicas ligadas: o Δv de Lambert é o excesso de velocidade hiperbólico; partindo em repouso
+    # em relação à origem, a queima também precisa vencer a gravidade dela
+    deslocamento = np.asarray(foguete.posicao, dtype=float) - posicoes[indice_origem]
+    v_infinito = float(np.linalg.norm(plano.delta_v_partida))
+    v_escape2 = 2.0 * G * massas[indice_origem] / np.linalg.norm(deslocamento)
+    delta_v = plano.delta_v_partida / v_infinito * np.sqrt(v_infinito**2 + v_escape2)
+
+    return Missao(
+        tabela=tabela,
+        indice_origem=indice_origem,
+        indice_destino=indice_destino,
+        indices_fontes=fontes,
+        massas_fonte=massas[fontes],
+        deslocamento_inicial=deslocamento,
+        massa=foguete.massa,
+        empuxo=foguete.empuxo_maximo,
+        consumo=foguete.consumo_combustivel,
+        combustivel=foguete.combustivel_restante,
+        tempo_partida=plano.tempo_partida,
+        delta_v=delta_v,
+        tempo_voo=plano.tempo_voo,
+    )
+
+
+def amostrar_lancamentos(
+    missao: Missao,
+    num_lancamentos: int,
+    distribuicao: Optional[Dict[str, float]] = None,
+    semente: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Sorteia os parâmetros perturbados de cada lançamento.
+
+    :param missao: Missão nominal.
+    :param num_lancamentos: Número de lançamentos K.
+    :param distribuicao: Desvios-padrão (ver DISTRIBUICAO_PADRAO); chaves ausentes usam o padrão.
+    :param semente: Semente do gerador aleatório.
+    :return: Dicionário com "empuxo" (K,), "combustivel" (K,), "tempo_lancamento" (K,) e
+        "direcao" (K, 3), a direção unitária da queima de partida.
+    """
+    desvios = dict(DISTRIBUICAO_PADRAO)
+    if distribuicao:
+        desconhecidas = set(distribuicao) - set(DISTRIBUICAO_PADRAO)
+        if desconhecidas:
+            raise ValueError(
+                f"Parâmetros desconhecidos: {', '.join(sorted(desconhecidas))}. Opções: {', '.join(DISTRIBUICAO_PADRAO)}."
+            )
+        desvios.update(distribuicao)
+
+    gerador = np.random.default_rng(semente)
+    k = num_lancamentos
+    empuxo = missao.empuxo * np.maximum(1.0 + desvios["empuxo"] * gerador.standard_normal(k), 0.0)
+    combustivel = missao.combustivel * np.maximum(1.0 + desvios["combustivel"] * gerador.standard_normal(k), 0.0)
+    tempo_lancamento = np.maximum(missao.tempo_partida + desvios["tempo_lancamento"] * gerador.standard_normal(k), 0.0)
+
+    # Erro de apontamento: perturbação gaussiana da direção nominal, renormalizada
+    nominal = missao.delta_v / np.linalg.norm(missao.delta_v)
+    direcao = nominal + np.radians(desvios["apontamento"]) * gerador.standard_normal((k, 3))
+    direcao /= np.linalg.norm(direcao, axis=1, keepdims=True)
+    return {"empuxo": empuxo, "combustivel": combustivel, "tempo_lancamento": tempo_lancamento, "direcao": direcao}
+
+
+def propagar_lote(
+    missao: Missao,
+    parametros: Dict[str, np.ndarray],
+    delta_t: float = 3600.0,
+    duracao_voo: Optional[float] = None,
+    tempo_registro: Optional[float] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Propaga K lançamentos juntos, como partículas de teste, com leapfrog (KDK) de passo fixo.
+
+    Até o próprio lançamento, cada cópia acompanha o corpo de origem (posição inicial da cena
+    relativa a ele). Depois, empuxa na sua direção até acumular o Δv nominal (ou o "delta_v" dos
+    parâmetros) ou esgotar o combustível; o último passo da queima é dosado para não passar
+    dele. A gravidade
+    vem das posições dos corpos interpoladas na efeméride da missão, uma vez por passo para
+    todas as cópias.
+
+    :param missao: Missão nominal (ver preparar_missao).
+    :param parametros: Parâmetros dos lançamentos (ver amostrar_lancamentos).
+    :param delta_t: Passo de integração (s).
+    :param duracao_voo: Tempo acompanhado após o último lançamento (s). Padrão: 1,5 × o tempo de voo nominal.
+    :param tempo_registro: Se informado, o resultado inclui "desvio_destino" (K, 3), a posição
+        de cada cópia relativa ao destino no primeiro passo a partir deste instante (s).
+    :return: Dicionário com as métricas de METRICAS, cada uma com shape (K,).
+    """
+    tabela = missao.tabela
+    fontes = missao.indices_fontes
+    empuxo = np.asarray(parametros["empuxo"], dtype=float)
+    combustivel = np.asarray(parametros["combustivel"], dtype=float).copy()
+    tempo_lancamento = np.asarray(parametros["tempo_lancamento"], dtype=float)
+    direcao = np.asarray(parametros["direcao"], dtype=float)
+    k = len(empuxo)
+    duracao_voo = 1.5 * missao.tempo_voo if duracao_voo is None else duracao_voo
+
+    massa = missao.massa - missao.combustivel + combustivel
+    delta_v_alvo = np.asarray(parametros.get("delta_v", np.linalg.norm(missao.delta_v)), dtype=float)
+    delta_v_alvo = np.broadcast_to(delta_v_alvo, (k,))
+    delta_v_usado = np.zeros(k)
+    aproximacao = np.full(k, np.inf)
+    tempo_aproximacao = np.zeros(k)
+    desvio_destino: Optional[np.ndarray] = None
+
+    # Todas as cópias estão presas à origem antes do primeiro lançamento
+    t = float(np.min(tempo_lancamento))
+    fim = float(np.max(tempo_lancamento)) + duracao_voo
+    p_origem, v_origem = tabela.estados_em(np.array([t]), missao.indice_origem)
+    posicoes = np.repeat(p_origem + missao.deslocamento_inicial, k, axis=0)
+    velocidades = np.repeat(v_origem, k, axis=0)
+
+    def gravidade(t: float) -> np.ndarray:
+        return aceleracoes_diretas(posicoes, tabela.posicoes_em(t, fontes), missao.massas_fonte)
+
+    def empuxar(t: float, delta_t: float) -> None:
+        """
+        Aplica o Δv do empuxo das cópias em queima ao longo do passo e consome o combustível.
+        """
+        queimando = (t >= tempo_lancamento) & (delta_v_usado < delta_v_alvo) & (combustivel > 0) & (empuxo > 0)
+        if not np.any(queimando):
+            return
+        aceleracao_maxima = empuxo[queimando] / massa[queimando]
+        intensidade = np.minimum(1.0, (delta_v_alvo[queimando] - delta_v_usado[queimando]) / (aceleracao_maxima * delta_t))
+        if missao.consumo > 0:
+            intensidade = np.minimum(intensidade, combustivel[queimando] / (missao.consumo * delta_t))
+            consumido = missao.consumo * intensidade * delta_t
+            combustivel[queimando] -= consumido
+            massa[queimando] -= consumido
+        delta_v = aceleracao_maxima * intensidade * delta_t
+        delta_v_usado[queimando] += delta_v
+        velocidades[queimando] += delta_v[:, np.newaxis] * direcao[queimando]
+
+    def prender_nao_lancados(t: float) -> None:
+        presos = t < tempo_lancamento
+        if np.any(presos):
+            p, v = tabela.estados_em(np.array([t]), missao.indice_origem)
+            posicoes[presos] = p + missao.deslocamento_inicial
+            velocidades[presos] = v
+
+    # O Δv do empuxo de cada passo entra junto com o primeiro meio-impulso da gravidade
+    a = gravidade(t)
+    while t < fim:
+        velocidades += 0.5 * delta_t * a
+        empuxar(t, delta_t)
+        posicoes += delta_t * velocidades
+        t += delta_t
+        prender_nao_lancados(t)
+        a = gravidade(t)
+        velocidades += 0.5 * delta_t * a
+
+        desvios = posicoes - tabela.posicoes_em(t, np.array([missao.indice_destino]))[0]
+        if tempo_registro is not None and desvio_destino is None and t >= tempo_registro:
+            desvio_destino = desvios.copy()
+        distancias = np.linalg.norm(desvios, axis=1)
+        mais_perto = (distancias < aproximacao) & (t >= tempo_lancamento)
+        aproximacao[mais_perto] = distancias[mais_perto]
+        tempo_aproximacao[mais_perto] = t - tempo_lancamento[mais_perto]
+
+    resultados = {
+        "aproximacao_minima": aproximacao,
+        "tempo_aproximacao": tempo_aproximacao,
+        "combustivel_restante": combustivel,
+        "delta_v_usado": delta_v_usado,
+    }
+    if tempo_registro is not None:
+        resultados["desvio_destino"] = desvios if desvio_destino is None else desvio_destino
+    return resultados
+
+
+def corrigir_queima(missao: Missao, delta_t: float = 3600.0, iteracoes: int = 6, tolerancia: float = 1e8, passo: float = 1.0) -> float:
+    """
+    Refina a queima nominal por tiro (Newton com diferenças finitas) para que o foguete, com a
+    propulsão finita e a gravidade de todos os corpos, chegue ao destino no instante nominal.
+
+    A queima de Lambert vale para cônicas ligadas e impulso instantâneo; a da missão parte em
+    repouso perto da origem e dura horas. Cada iteração propaga, em um único lote, a queima atual
+    e três perturbações de `passo` m/s, uma por eixo. A melhor queima encontrada substitui
+    missao.delta_v. Perto do destino a gravidade dele torna o erro muito não linear, por isso a
+    tolerância padrão é bem menor que a esfera de influência de um planeta, mas não muito menor.
+
+    :param missao: Missão nominal (alterada no lugar).
+    :param delta_t: Passo de integração (s); use o mesmo do lote.
+    :param iteracoes: Número máximo de iterações.
+    :param tolerancia: Erro de chegada (m) em que o refinamento para.
+    :param passo: Perturbação das diferenças finitas (m/s).
+    :return: Erro de chegada (m) da queima escolhida.
+    """
+    delta_v = np.asarray(missao.delta_v, dtype=float)
+    chegada = missao.tempo_partida + missao.tempo_voo
+    melhor_erro, melhor_delta_v = np.inf, delta_v
+    for _ in range(iteracoes):
+        candidatos = delta_v + np.vstack((np.zeros(3), passo * np.eye(3)))
+        modulos = np.linalg.norm(candidatos, axis=1)
+        parametros = {
+            "empuxo": np.full(4, missao.empuxo),
+            "combustivel": np.full(4, missao.combustivel),
+            "tempo_lancamento": np.full(4, missao.tempo_partida),
+            "direcao": candidatos / modulos[:, np.newaxis],
+            "delta_v": modulos,
+        }
+        desvios = propagar_lote(missao, parametros, delta_t, missao.tempo_voo, tempo_registro=chegada)["desvio_destino"]
+        erro = float(np.linalg.norm(desvios[0]))
+        if erro < melhor_erro:
+            melhor_erro, melhor_delta_v = erro, delta_v
+        if erro < tolerancia:
+            break
+        jacobiana = (desvios[1:] - desvios[0]).T / passo
+        delta_v = delta_v - np.linalg.solve(jacobiana, desvios[0])
+    missao.delta_v = melhor_delta_v
+    return melhor_erro
+
+
+def _propagar_fatia(tarefa) -> Dict[str, np.ndarray]:
+    """
+    Executada nos processos trabalhadores: propaga uma fatia dos lançamentos.
+    """
+    missao, parametros, delta_t, duracao_voo = tarefa
+    return propagar_lote(missao, parametros, delta_t, duracao_voo)
+
+
+def executar_monte_carlo(
+    missao: Missao,
+    parametros: Dict[str, np.ndarray],
+    delta_t: float = 3600.0,
+    duracao_voo: Optional[float] = None,
+    processos: Optional[int] = None,
+    lancamentos_por_tarefa: int = 256,
+) -> Dict[str, np.ndarray]:
+    """
+    Propaga todos os lançamentos, divididos em fatias entre um pool de processos.
+
+    Cada fatia é um lote vetorizado (propagar_lote); a efeméride vai para cada tarefa junto com
+    a missão, sem nova integração dos corpos.
+
+    :param missao: Missão nominal (ver preparar_missao).
+    :param parametros: Parâmetros dos lançamentos (ver amostrar_lancamentos).
+    :param delta_t: Passo de integração (s).
+    :param duracao_voo: Ver propagar_lote.
+    :param processos: Número de processos (None = número de CPUs; 1 = no próprio processo).
+    :param lancamentos_por_tarefa: Tamanho máximo de cada fatia.
+    :return: Métricas por lançamento (ver METRICAS), na ordem dos parâmetros.
+    """
+    k = len(parametros["empuxo"])
+    processos = processos or os.cpu_count() or 1
+    # Fatias suficientes para ocupar todos os processos, sem passar do tamanho máximo
+    num_fatias = max(1, min(k, max(processos, -(-k // lancamentos_por_tarefa))))
+    fatias = np.array_split(np.arange(k), num_fatias)
+    tarefas = [
+        (missao, {nome: valores[fatia] for nome, valores in parametros.items()}, delta_t, duracao_voo)
+        for fatia in fatias
+    ]
+
+    if processos == 1 or num_fatias == 1:
+        resultados = [_propagar_fatia(tarefa) for tarefa in tarefas]
+    else:
+        with get_context("spawn").Pool(min(processos, num_fatias)) as pool:
+            resultados = pool.map(_propagar_fatia, tarefas)
+
+    return {metrica: np.concatenate([resultado[metrica] for resultado in resultados]) for metrica in METRICAS}
+
+
+def resumir(resultados: Dict[str, np.ndarray], raio_sucesso: float) -> Dict[str, Dict[str, float]]:
+    """
+    Estatísticas resumidas das métricas de um lote.
+
+    :param resultados: Métricas por lançamento (ver executar_monte_carlo).
+    :param raio_sucesso: Aproximação mínima (m) abaixo da qual um lançamento conta como sucesso.
+    :return: Para cada métrica, média, desvio-padrão, mínimo, percentis 5/50/95 e máximo; em
+        "sucesso", a fração de lançamentos bem-sucedidos.
+    """
+    resumo: Dict[str, Dict[str, float]] = {}
+    for metrica in METRICAS:
+        valores = resultados[metrica]
+        p5, p50, p95 = np.percentile(valores, [5, 50, 95])
+        resumo[metrica] = {
+            "media": float(np.mean(valores)),
+            "desvio": float(np.std(valores)),
+            "minimo": float(np.min(valores)),
+            "p5": float(p5),
+            "p50": float(p50),
+            "p95": float(p95),
+            "maximo": float(np.max(valores)),
+        }
+    resumo["sucesso"] = {"fracao": float(np.mean(resultados["aproximacao_minima"] < raio_sucesso))}
+    return resumo
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Lançamentos de Monte Carlo do foguete de uma cena, sem interface gráfica.")
+    parser.add_argument("cena", help="Arquivo JSON da cena ou nome de uma cena embutida (ex.: solar).")
+    parser.add_argument("--lancamentos", type=int, default=1000, help="Número de lançamentos.")
+    parser.add_argument("--delta-t", type=float, default=3600.0, help="Passo de integração, em segundos.")
+    parser.add_argument("--desvio-empuxo", type=float, default=DISTRIBUICAO_PADRAO["empuxo"], help="Desvio-padrão relativo do empuxo.")
+    parser.add_argument("--desvio-combustivel", type=float, default=DISTRIBUICAO_PADRAO["combustivel"], help="Desvio-padrão relativo do combustível.")
+    parser.add_argument("--desvio-lancamento", type=float, default=DISTRIBUICAO_PADRAO["tempo_lancamento"], help="Desvio-padrão do instante de lançamento, em segundos.")
+    parser.add_argument("--desvio-apontamento", type=float, default=DISTRIBUICAO_PADRAO["apontamento"], help="Desvio-padrão do apontamento, em graus.")
+    parser.add_argument("--raio-sucesso", type=float, default=5.8e8, help="Aproximação mínima de sucesso, em metros.")
+    parser.add_argument("--processos", type=int, default=None, help="Processos (padrão: nº de CPUs).")
+    parser.add_argument("--semente", type=int, default=None)
+    parser.add_argument("--saida", default=None, help="Arquivo .npz com as métricas de cada lançamento.")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    missao = preparar_missao(resolver_caminho_cena(args.cena))
+    erro_nominal = corrigir_queima(missao, delta_t=args.delta_t)
+    parametros = amostrar_lancamentos(
+        missao,
+        args.lancamentos,
+        {
+            "empuxo": args.desvio_empuxo,
+            "combustivel": args.desvio_combustivel,
+            "tempo_lancamento": args.desvio_lancamento,
+            "apontamento": args.desvio_apontamento,
+        },
+        args.semente,
+    )
+    preparo = time.perf_counter() - inicio
+    resultados = executar_monte_carlo(missao, parametros, delta_t=args.delta_t, processos=args.processos)
+    decorrido = time.perf_counter() - inicio
+    if args.saida:
+        np.savez_compressed(args.saida, **parametros, **resultados)
+
+    print(
+        f"Missão nominal: partida em {missao.tempo_partida / DIA:.1f} d, voo de {missao.tempo_voo / DIA:.1f} d, "
+        f"Δv de partida {np.linalg.norm(missao.delta_v):.0f} m/s, erro de chegada {erro_nominal / 1e3:.0f} km "
+        f"(preparo em {preparo:.2f} s)"
+    )
+    for metrica, estatisticas in resumir(resultados, args.raio_sucesso).items():
+        print(f"{metrica}: " + ", ".join(f"{nome}={valor:.4g}" for nome, valor in estatisticas.items()))
+    print(f"{args.lancamentos} lançamentos em {decorrido:.2f} s ({args.lancamentos / max(decorrido, 1e-9):.0f} lançamentos/s)")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from __future__ import annotations
-from typing import Deque, Tuple, Optional
-from collections import deque
+from typing import Tuple, Optional
 import numpy as np
+from simulacao.objetos.rastro import Rastro
 
 class CorpoCeleste:
     """
@@ -23,6 +23,10 @@ class CorpoCeleste:
         massa_central: Optional[float] = None,
         max_rastro: int = 1000,
         brilho: float = 1.0,
+        particula_teste: bool = False,
+        efemeride: bool = False,
+        rastro_tolerancia_angular: Optional[float] = 1.0,
+        rastro_tolerancia_distancia: Optional[float] = None,
     ):
         """
         Inicializa um novo corpo celeste.
@@ -40,26 +44,89 @@ class CorpoCeleste:
         :param massa_central: Massa do corpo central em kg. Necessário se parâmetros orbitais forem fornecidos.
         :param max_rastro: Número máximo de pontos no rastro.
         :param brilho: Brilho do corpo celeste para efeitos de iluminação.
+        :param particula_teste: Se True, o corpo sofre a gravidade dos demais, mas não a exerce.
+        :param efemeride: Se True, o corpo segue "sobre trilhos" a órbita kepleriana dada pelos
+            parâmetros orbitais quando o motor físico usa a propagação por efemérides.
+        :param rastro_tolerancia_angular: Desvio angular (graus) a partir do qual um novo ponto é
+            fixado no rastro. None ou 0 desativa o critério.
+        :param rastro_tolerancia_distancia: Desvio estimado (m) entre a trajetória e o rastro a partir
+            do qual um novo ponto é fixado. None ou 0 desativa o critério. Sem nenhum critério,
+            todo passo da física gera um ponto.
         """
         self.nome: str = nome
-        self.massa: float = massa
+        self._massa: np.ndarray = np.array([massa], dtype=float)
         self.raio: float = raio
         self.cor: Tuple[int, int, int] = cor
         self.fator_escala: float = fator_escala
         self.brilho: float = brilho
-        self.rastro: Deque[np.ndarray] = deque(maxlen=max_rastro)
+        self.particula_teste: bool = particula_teste
+        self.rastro: Rastro = Rastro(max_rastro, rastro_tolerancia_angular, rastro_tolerancia_distancia)
+
+        self.efemeride: bool = efemeride
+        self.elementos_orbitais: Optional[Tuple[float, float, float, float]] = None
 
         if posicao is not None and velocidade is not None:
-            self.posicao = posicao.astype(float)
-            self.velocidade = velocidade.astype(float)
+            self._posicao: np.ndarray = posicao.astype(float)
+            self._velocidade: np.ndarray = velocidade.astype(float)
         elif all(param is not None for param in [a, e, i_deg, massa_central]):
             # Calcular posição e velocidade a partir dos parâmetros orbitais
-            self.posicao, self.velocidade = self.calcular_posicao_velocidade(a, e, i_deg, massa_central)
+            self._posicao, self._velocidade = self.calcular_posicao_velocidade(a, e, i_deg, massa_central)
+            self.elementos_orbitais = (a, e, i_deg, massa_central)
         else:
             raise ValueError(
                 "Deve fornecer posição e velocidade ou parâmetros orbitais (a, e, i_deg, massa_central)."
             )
-        
+
+        if efemeride and self.elementos_orbitais is None:
+            raise ValueError("Corpos com efeméride precisam ser criados a partir de parâmetros orbitais.")
+
+    @property
+    def posicao(self) -> np.ndarray:
+        """
+        Vetor posição do corpo (m). Quando vinculado a um EstadoFisico, é uma visão do array do estado.
+        """
+        return self._posicao
+
+    @posicao.setter
+    def posicao(self, valor: np.ndarray) -> None:
+        self._posicao[...] = valor
+
+    @property
+    def velocidade(self) -> np.ndarray:
+        """
+        Vetor velocidade do corpo (m/s). Quando vinculado a um EstadoFisico, é uma visão do array do estado.
+        """
+        return self._velocidade
+
+    @velocidade.setter
+    def velocidade(self, valor: np.ndarray) -> None:
+        self._velocidade[...] = valor
+
+    @property
+    def massa(self) -> float:
+        """
+        Massa do corpo (kg). Quando vinculado a um EstadoFisico, é lida do array de massas do estado.
+        """
+        return self._massa[0]
+
+    @massa.setter
+    def massa(self, valor: float) -> None:
+        self._massa[0] = valor
+
+    def vincular_estado(self, estado, indice: int) -> None:
+        """
+        Passa a armazenar posição, velocidade e massa na linha `indice` do estado físico.
+
+        :param estado: EstadoFisico que contém os arrays contíguos da simulação.
+        :param indice: Índice do corpo nos arrays do estado.
+        """
+        estado.posicoes[indice] = self._posicao
+        estado.velocidades[indice] = self._velocidade
+        estado.massas[indice] = self._massa[0]
+        self._posicao = estado.posicoes[indice]
+        self._velocidade = estado.velocidades[indice]
+        self._massa = estado.massas[indice:indice + 1]
+
     def atualizar_posicao(self, delta_t: float) -> None:
         """
         Atualiza a posição do corpo celeste com base em sua velocidade atual.
@@ -69,7 +136,7 @@ class CorpoCeleste:
         # Atualiza a posição com base na velocidade atual
         self.posicao += self.velocidade * delta_t
         # Adiciona a nova posição ao rastro
-        self.adicionar_ponto_rastro(self.posicao.copy())
+        self.adicionar_ponto_rastro(self.posicao)
 
     def calcular_forca_gravitacional(self, outro_corpo: CorpoCeleste) -> np.ndarray:
         """
@@ -91,9 +158,9 @@ class CorpoCeleste:
         """
         Adiciona um ponto ao rastro do corpo celeste.
 
-        :param posicao: Posição a ser adicionada ao rastro.
+        :param posicao: Posição a ser adicionada ao rastro (é copiada para o buffer do rastro).
         """
-        self.rastro.append(posicao)
+        self.rastro.adicionar(posicao)
 
     @staticmethod
     def calcular_posicao_velocidade(
@@ -1,6 +1,7 @@
 from typing import Tuple, Optional, Union
 import numpy as np
 from simulacao.objetos.corpo_celeste import CorpoCeleste
+from simulacao.fisica.frota import Frota
 
 class Foguete(CorpoCeleste):
     """
@@ -22,6 +23,9 @@ class Foguete(CorpoCeleste):
         combustivel_inicial: float = 0.0,
         max_rastro: int = 1000,
         destino: Optional[Union[np.ndarray, CorpoCeleste]] = None,
+        particula_teste: bool = False,
+        rastro_tolerancia_angular: Optional[float] = 1.0,
+        rastro_tolerancia_distancia: Optional[float] = None,
     ):
         """
         Inicializa um novo foguete.
@@ -39,6 +43,9 @@ class Foguete(CorpoCeleste):
         :param combustivel_inicial: Quantidade inicial de combustível em kg.
         :param max_rastro: Número máximo de pontos no rastro.
         :param destino: Posição (np.ndarray) ou CorpoCeleste destino do foguete.
+        :param particula_teste: Se True, o foguete não exerce gravidade sobre os demais corpos.
+        :param rastro_tolerancia_angular: Tolerância angular (graus) da decimação do rastro.
+        :param rastro_tolerancia_distancia: Tolerância de distância (m) da decimação do rastro.
         """
         # Se a velocidade não for fornecida e o destino for um planeta, usa a velocidade do planeta
         if velocidade is None and isinstance(destino, CorpoCeleste):
@@ -53,114 +60,159 @@ class Foguete(CorpoCeleste):
             posicao=posicao,
             velocidade=velocidade,
             max_rastro=max_rastro,
+            particula_teste=particula_teste,
+            rastro_tolerancia_angular=rastro_tolerancia_angular,
+            rastro_tolerancia_distancia=rastro_tolerancia_distancia,
         )
 
+        # Estado de propulsão em uma frota própria de uma linha, até ser reunido na frota do EstadoFisico
+        self.frota: Frota = Frota(1, self._massa, np.zeros(1, dtype=np.int64))
+        self.linha_frota: int = 0
+        self._frota_propria: bool = True
         self.orientacao = orientacao if orientacao is not None else np.array([0.0, 0.0, 0.0])
         self.empuxo_maximo = empuxo_maximo
         self.consumo_combustivel = consumo_combustivel
         self.combustivel_restante = combustivel_inicial
-        self.aceleracao_propulsao = np.zeros(3)
-        self.propulsao_ativa = False
         self.destino = destino
 
-    def ativar_propulsao(self, intensidade: float) -> None:
+    def vincular_estado(self, estado, indice: int) -> None:
         """
-        Ativa a propulsão do foguete.
+        Passa a armazenar posição, velocidade e massa na linha `indice` do estado físico.
 
-        :param intensidade: Intensidade do empuxo (entre 0 e 1).
+        :param estado: EstadoFisico que passará a conter os dados do corpo.
+        :param indice: Linha do corpo nos arrays do estado.
         """
-        if self.combustivel_restante > 0:
-            empuxo = self.empuxo_maximo * intensidade
-            vetor_direcao = self.calcular_vetor_direcao()
-            self.aceleracao_propulsao = (empuxo / self.massa) * vetor_direcao
-            self.propulsao_ativa = True
-        else:
-            self.aceleracao_propulsao = np.zeros(3)
-            self.propulsao_ativa = False
+        super().vincular_estado(estado, indice)
+        if self._frota_propria:
+            self.frota.massas = self._massa
 
+    def vincular_frota(self, frota: Frota, linha: int) -> None:
+        """
+        Passa a armazenar orientação, empuxo e combustível na linha `linha` de uma frota.
 
-    def desativar_propulsao(self) -> None:
+        :param frota: Frota que passará a conter os dados do foguete.
+        :param linha: Linha do foguete nos arrays da frota.
         """
-        Desativa a propulsão do foguete.
+        self.frota = frota
+        self.linha_frota = linha
+        self._frota_propria = False
+
+    @property
+    def _linhas(self) -> np.ndarray:
+        return np.array([self.linha_frota])
+
+    @property
+    def quaternion(self) -> np.ndarray:
+        """
+        Orientação do foguete como quaternion unitário (w, x, y, z); visão da linha da frota.
         """
-        self.aceleracao_propulsao = np.zeros(3)
-        self.propulsao_ativa = False
+        return self.frota.quaternioes[self.linha_frota]
 
-    def calcular_vetor_direcao(self) -> np.ndarray:
+    @property
+    def orientacao(self) -> np.ndarray:
         """
-        Calcula o vetor de direção do foguete com base em seus ângulos de orientação.
-        
-        :return: Vetor de direção (np.ndarray).
+        Orientação do foguete em ângulos de Euler (pitch, yaw, roll), em graus.
         """
-        pitch_rad = np.radians(self.orientacao[0])
-        yaw_rad = np.radians(self.orientacao[1])
-        roll_rad = np.radians(self.orientacao[2])
+        return self.frota.angulos_euler(self._linhas)[0]
 
-        # Cálculo do vetor de direção usando os ângulos de Euler
-        # Aqui, consideramos que o foguete aponta inicialmente no eixo Z positivo
-        # e aplicamos as rotações na ordem: roll, pitch, yaw
-        # Você pode ajustar conforme o sistema de coordenadas do seu OpenGL
+    @orientacao.setter
+    def orientacao(self, valor: np.ndarray) -> None:
+        self.frota.definir_angulos(np.asarray(valor, dtype=float)[np.newaxis], self._linhas)
 
-        # Matriz de rotação para pitch (X)
-        rot_x = np.array([
-            [1, 0, 0],
-            [0, np.cos(pitch_rad), -np.sin(pitch_rad)],
-            [0, np.sin(pitch_rad), np.cos(pitch_rad)]
-        ])
+    @property
+    def empuxo_maximo(self) -> float:
+        """
+        Empuxo máximo do motor (N).
+        """
+        return float(self.frota.empuxo_maximo[self.linha_frota])
 
-        # Matriz de rotação para yaw (Y)
-        rot_y = np.array([
-            [np.cos(yaw_rad), 0, np.sin(yaw_rad)],
-            [0, 1, 0],
-            [-np.sin(yaw_rad), 0, np.cos(yaw_rad)]
-        ])
+    @empuxo_maximo.setter
+    def empuxo_maximo(self, valor: float) -> None:
+        self.frota.empuxo_maximo[self.linha_frota] = valor
 
-        # Matriz de rotação para roll (Z)
-        rot_z = np.array([
-            [np.cos(roll_rad), -np.sin(roll_rad), 0],
-            [np.sin(roll_rad), np.cos(roll_rad), 0],
-            [0, 0, 1]
-        ])
+    @property
+    def consumo_combustivel(self) -> float:
+        """
+        Consumo de combustível a empuxo máximo (kg/s).
+        """
+        return float(self.frota.consumo[self.linha_frota])
 
-        # Matriz de rotação total
-        rotacao_total = rot_z @ rot_y @ rot_x
+    @consumo_combustivel.setter
+    def consumo_combustivel(self, valor: float) -> None:
+        self.frota.consumo[self.linha_frota] = valor
+
+    @property
+    def combustivel_restante(self) -> float:
+        """
+        Combustível restante (kg).
+        """
+        return float(self.frota.combustivel[self.linha_frota])
 
-        # Vetor de direção inicial (eixo Z positivo)
-        direcao_inicial = np.array([0.0, 0.0, 1.0])
+    @combustivel_restante.setter
+    def combustivel_restante(self, valor: float) -> None:
+        self.frota.combustivel[self.linha_frota] = valor
 
-        # Aplica a rotação ao vetor de direção
-        vetor_direcao = rotacao_total @ direcao_inicial
+    @property
+    def propulsao_ativa(self) -> bool:
+        """
+        Indica se o motor está ligado.
+        """
+        return bool(self.frota.propulsao_ativa[self.linha_frota])
 
-        return vetor_direcao
+    @property
+    def aceleracao_propulsao(self) -> np.ndarray:
+        """
+        Aceleração de propulsão atual (m/s²), com a massa e a orientação atuais.
+        """
+        return self.frota.aceleracoes(self._linhas)[0]
+
+    def ativar_propulsao(self, intensidade: float) -> None:
+        """
+        Ativa a propulsão do foguete (se ainda houver combustível).
+
+        :param intensidade: Intensidade do empuxo (entre 0 e 1).
+        """
+        self.frota.ativar_propulsao(intensidade, self._linhas)
+
+    def desativar_propulsao(self) -> None:
+        """
+        Desativa a propulsão do foguete.
+        """
+        self.frota.desativar_propulsao(self._linhas)
+
+    def calcular_vetor_direcao(self) -> np.ndarray:
+        """
+        Calcula o vetor de direção do foguete (seu eixo Z positivo) a partir do quaternion de orientação.
+
+        :return: Vetor de direção (np.ndarray).
+        """
+        return self.frota.direcoes(self._linhas)[0]
 
     def atualizar_orientacao(self, delta_orientacao: np.ndarray) -> None:
         """
-        Atualiza a orientação do foguete.
+        Gira o foguete em torno dos seus próprios eixos.
 
-        :param delta_orientacao: Vetor de rotação a ser aplicado à orientação atual (em graus).
+        :param delta_orientacao: Ângulos de Euler (pitch, yaw, roll) da rotação, em graus.
         """
-        self.orientacao += delta_orientacao
-        # Opcionalmente, podemos limitar os ângulos entre 0 e 360 graus
-        self.orientacao = np.mod(self.orientacao, 360)
+        self.frota.girar_proprio(np.asarray(delta_orientacao, dtype=float)[np.newaxis], self._linhas)
 
+    def girar(self, eixo: np.ndarray, angulo: float) -> None:
+        """
+        Gira o foguete em torno de um eixo do referencial do mundo.
+
+        :param eixo: Eixo de rotação (np.ndarray).
+        :param angulo: Ângulo de rotação em radianos.
+        """
+        self.frota.girar(np.asarray(eixo, dtype=float)[np.newaxis], np.array([angulo]), self._linhas)
 
-    def atualizar_estado(self, delta_t: float) -> None:
+    def atualizar_estado(self, delta_t: float) -> np.ndarray:
         """
         Atualiza o estado do foguete, incluindo consumo de combustível.
 
         :param delta_t: Intervalo de tempo em segundos.
+        :return: Aceleração média de propulsão no passo (np.ndarray).
         """
-        if self.propulsao_ativa and self.combustivel_restante > 0:
-            consumo = self.consumo_combustivel * delta_t
-            if consumo > self.combustivel_restante:
-                consumo = self.combustivel_restante
-                self.desativar_propulsao()
-            self.combustivel_restante -= consumo
-            # Atualiza a massa do foguete (massa total diminui)
-            self.massa -= consumo
-        else:
-            self.aceleracao_propulsao = np.zeros(3)
-            self.propulsao_ativa = False
+        return self.frota.atualizar(delta_t, self._linhas)[0]
 
     def calcular_forca_propulsao(self) -> np.ndarray:
         """
@@ -0,0 +1,194 @@
+from typing import Iterator, Optional
+import numpy as np
+
+# Distância (m) do ponto mais recente à âncora a partir da qual o rastro é reancorado. O erro
+# de arredondamento float32 de um ponto é ~6e-8 vezes sua distância à âncora (~600 m aqui).
+DISTANCIA_REANCORAGEM = 1e10
+
+
+class Rastro:
+    """
+    Rastro de um corpo: buffer circular pré-alocado de pontos float32.
+
+    Os pontos são gravados em relação a uma âncora float64 (`ancora`), e não em coordenadas do
+    mundo: em float32, uma posição a 1 UA do Sol já tem erro da ordem de 10 km. Quando o ponto
+    mais recente se afasta mais que `distancia_reancoragem` da âncora, ela passa a ser esse
+    ponto, todos os pontos são regravados em relação a ela e `geracao` é incrementada (quem
+    copiou os pontos, como RastroGPU, precisa copiá-los de novo).
+
+    Cada ponto é gravado duas vezes, nas posições k e k + capacidade, de modo que os últimos
+    pontos, em ordem cronológica, formam sempre uma fatia contígua do array. Assim o rastro
+    inteiro pode ser enviado à GPU e desenhado com uma única chamada, sem reordenação.
+
+    Com tolerâncias definidas, o rastro é decimado: o último ponto é provisório e acompanha o
+    corpo, e só é fixado quando o caminho desde o último ponto fixo deixa de ser bem
+    aproximado por uma reta. A densidade de pontos passa a depender da curvatura da
+    trajetória, e não do passo da física.
+    """
+
+    def __init__(
+        self,
+        capacidade: int,
+        tolerancia_angular: Optional[float] = None,
+        tolerancia_distancia: Optional[float] = None,
+        distancia_reancoragem: float = DISTANCIA_REANCORAGEM,
+    ):
+        """
+        Aloca o buffer.
+
+        :param capacidade: Número máximo de pontos mantidos.
+        :param tolerancia_angular: Desvio angular máximo (graus) entre a direção de saída do
+            último ponto fixo e a corda até a posição atual. None ou 0 desativa o critério.
+        :param tolerancia_distancia: Distância máxima estimada (m) entre o caminho percorrido e
+            a corda até a posição atual. None ou 0 desativa o critério.
+        :param distancia_reancoragem: Distância (m) entre o ponto mais recente e a âncora a
+            partir da qual o rastro é reancorado.
+        """
+        self.capacidade: int = max(int(capacidade), 0)
+        self.pontos: np.ndarray = np.zeros((2 * self.capacidade, 3), dtype=np.float32)
+        # Total de pontos já adicionados (cresce indefinidamente; identifica os pontos novos).
+        # Com decimação, o ponto total - 1 é provisório e pode ser reescrito.
+        self.total: int = 0
+        # Origem (float64) dos pontos gravados e contador de reancoragens
+        self.ancora: np.ndarray = np.zeros(3)
+        self.geracao: int = 0
+        self.distancia_reancoragem: float = distancia_reancoragem
+
+        self.cos_tolerancia: Optional[float] = np.cos(np.radians(tolerancia_angular)) if tolerancia_angular else None
+        self.tolerancia_distancia: Optional[float] = tolerancia_distancia or None
+        self.decimado: bool = self.cos_tolerancia is not None or self.tolerancia_distancia is not None
+        # Comprimento médio (média móvel) dos segmentos fixados, usado para o nível de detalhe
+        self.comprimento_segmento: float = 0.0
+
+        # Estado da decimação, em float64: último ponto fixo, ponto provisório e direção de saída
+        self._fixo: np.ndarray = np.zeros(3)
+        self._provisorio: np.ndarray = np.zeros(3)
+        self._direcao: Optional[np.ndarray] = None
+
+    @property
+    def maxlen(self) -> int:
+        """
+        Capacidade do rastro (mesmo nome de collections.deque).
+        """
+        return self.capacidade
+
+    def _gravar(self, k: int, ponto: np.ndarray) -> None:
+        relativo = ponto - self.ancora
+        if relativo @ relativo > self.distancia_reancoragem ** 2:
+            self._reancorar(ponto)
+            relativo = np.zeros(3)
+        self.pontos[k] = relativo
+        self.pontos[k + self.capacidade] = relativo
+
+    def _reancorar(self, ancora: np.ndarray) -> None:
+        """
+        Move a âncora para `ancora` e regrava os pontos em relação a ela (o deslocamento entre
+        as âncoras é calculado em float64).
+        """
+        # A geração muda antes da regravação, para que um leitor em outra thread que a compare
+        # antes e depois de copiar os pontos perceba uma cópia misturada
+        self.geracao += 1
+        self.pontos += (self.ancora - ancora).astype(np.float32)
+        self.ancora[...] = ancora
+
+    def adicionar(self, ponto: np.ndarray) -> None:
+        """
+        Adiciona um ponto, descartando o mais antigo se o buffer estiver cheio.
+
+        Com decimação, o ponto pode apenas substituir o ponto provisório.
+
+        :param ponto: Posição a ser adicionada, shape (3,).
+        """
+        if self.capacidade == 0:
+            return
+        if self.total == 0:
+            # O primeiro ponto vira a âncora (os pontos antigos, se houver, foram descartados)
+            self.ancora[...] = ponto
+            self.geracao += 1
+        if not self.decimado or self.total == 0:
+            if self.total:
+                segmento = ponto - self._fixo
+                self._registrar_segmento(np.sqrt(segmento @ segmento))
+            self._gravar(self.total % self.capacidade, ponto)
+            self.total += 1
+            self._fixo[...] = ponto
+            return
+
+        corda = ponto - self._fixo
+        comprimento = np.sqrt(corda @ corda)
+        if self._direcao is None:
+            # Primeiro ponto após a âncora: define a direção de saída e vira o provisório
+            if comprimento == 0.0:
+                return
+            self._direcao = corda / comprimento
+            self._novo_provisorio(ponto)
+            return
+
+        # Ângulo entre a direção de saída e a corda, e flecha estimada do arco (≈ L·sen θ / 2)
+        cos_theta = (self._direcao @ corda) / comprimento if comprimento > 0.0 else 1.0
+        sen_theta = np.sqrt(max(0.0, 1.0 - cos_theta * cos_theta))
+        excede = (self.cos_tolerancia is not None and cos_theta < self.cos_tolerancia) or (
+            self.tolerancia_distancia is not None and 0.5 * comprimento * sen_theta > self.tolerancia_distancia
+        )
+        if excede:
+            # Fixa o provisório (último ponto dentro da tolerância) e recomeça a partir dele
+            segmento = self._provisorio - self._fixo
+            self._registrar_segmento(np.sqrt(segmento @ segmento))
+            self._fixo[...] = self._provisorio
+            saida = ponto - self._fixo
+            norma = np.sqrt(saida @ saida)
+            self._direcao = saida / norma if norma > 0.0 else self._direcao
+            self._novo_provisorio(ponto)
+        else:
+            self._provisorio[...] = ponto
+            self._gravar((self.total - 1) % self.capacidade, ponto)
+
+    def _registrar_segmento(self, comprimento: float) -> None:
+        if self.comprimento_segmento == 0.0:
+            self.comprimento_segmento = comprimento
+        else:
+            self.comprimento_segmento = 0.9 * self.comprimento_segmento + 0.1 * comprimento
+
+    def _novo_provisorio(self, ponto: np.ndarray) -> None:
+        self._provisorio[...] = ponto
+        self._gravar(self.total % self.capacidade, ponto)
+        self.total += 1
+
+    def inicio(self, total: Optional[int] = None) -> int:
+        """
+        Índice, em `pontos`, do ponto mais antigo da janela que termina no ponto `total`.
+
+        :param total: Número de pontos considerados (padrão: todos os adicionados até agora).
+        """
+        total = self.total if total is None else total
+        return total % self.capacidade if total > self.capacidade else 0
+
+    def tamanho(self, total: Optional[int] = None) -> int:
+        """
+        Número de pontos visíveis na janela que termina no ponto `total`.
+        """
+        total = self.total if total is None else total
+        return min(total, self.capacidade)
+
+    def visao(self, total: Optional[int] = None) -> np.ndarray:
+        """
+        Pontos em ordem cronológica, relativos a `ancora`, como visão (sem cópia) do buffer, shape (K, 3).
+
+        :param total: Número de pontos considerados (padrão: todos os adicionados até agora).
+        """
+        inicio = self.inicio(total)
+        return self.pontos[inicio:inicio + self.tamanho(total)]
+
+    def limpar(self) -> None:
+        """
+        Descarta todos os pontos.
+        """
+        self.total = 0
+        self._direcao = None
+
+    def __len__(self) -> int:
+        return self.tamanho()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        # Pontos em coordenadas do mundo (float64)
+        return iter(self.visao() + self.ancora)
@@ -3,26 +3,40 @@ import numpy as np
 from simulacao.grafico.motor_grafico import MotorGrafico
 from simulacao.grafico.camera import Camera
 from simulacao.fisica.motor_fisico import MotorFisico
+from simulacao.fisica.trabalhador_fisico import TrabalhadorFisico
 from simulacao.controle.manipulador_entrada import ManipuladorEntrada
 from simulacao.objetos.corpo_celeste import CorpoCeleste
 from simulacao.objetos.foguete import Foguete
-from simulacao.util.gerenciador_dados import carregar_dados_json, criar_corpos_celestes, criar_foguete
+from simulacao.util.gerenciador_dados import carregar_cena
 
 class Simulacao:
     """
     Classe principal que gerencia a execução da simulação.
     """
-    def __init__(self):
+    def __init__(self, integrador: str = "leapfrog", propagacao: str = "numerica", fisica_em_thread: bool = True):
         """
         Inicializa a simulação, carregando os componentes necessários.
+
+        :param integrador: Integrador usado pelo motor físico ("euler", "leapfrog", "verlet", "yoshida4", "rk45" ou "blocos").
+        :param propagacao: "numerica" integra todos os corpos; "efemeride" move analiticamente
+            os corpos marcados com "efemeride" na cena e integra apenas o foguete e os demais.
+        :param fisica_em_thread: Se True, a física roda em uma thread própria e o desenho lê
+            instantâneos publicados por ela; se False, a física avança no próprio laço de desenho.
         """
         # Inicializa o Pygame
         pygame.init()
         self.clock = pygame.time.Clock()
         self.fps = 60  # Frames por segundo
 
-        # Tempo de simulação (pode ser escalado para acelerar ou desacelerar o tempo na simulação)
-        self.delta_t = 3600.0 * self.fps  # Em segundos (1 hora por frame)
+        # Passo físico fixo e escala de tempo (segundos simulados por segundo real).
+        # A física avança sempre com delta_t_fisica; acelerar o tempo aumenta o número de passos por quadro.
+        self.delta_t_fisica = 3600.0  # Em segundos (1 hora por passo)
+        self.escala_tempo = 3600.0 * self.fps  # 1 hora simulada por quadro a 60 FPS
+        self.max_passos_por_quadro = 512  # Evita a "espiral da morte" quando a física não acompanha
+        self.max_delta_t_quadro = 0.25  # Limita o salto após travamentos da janela (s reais)
+        self.fisica_em_thread = fisica_em_thread
+        self.integrador = integrador
+        self.propagacao = propagacao
 
         # Inicializa os componentes principais
         self.motor_grafico = MotorGrafico(largura=1200, altura=920)
@@ -31,7 +45,7 @@ class Simulacao:
             alvo=np.array([0.0, 0.0, 0.0]),
             rotacao=np.array([0.0, 0.0, -90.0])
         )
-        self.motor_fisico = MotorFisico()
+        self.motor_fisico = MotorFisico(integrador=self.integrador, propagacao=self.propagacao)
         self.manipulador_entrada = ManipuladorEntrada()
 
         # Carrega os dados da cena
@@ -39,6 +53,16 @@ class Simulacao:
         self.foguete = None
         self.carregar_cena("simulacao/cenas/solar.json")
 
+        # Avanço da física em passos fixos, com publicação de instantâneos para o desenho
+        self.trabalhador_fisico = TrabalhadorFisico(
+            self.motor_fisico,
+            self.corpos,
+            delta_t_fisica=self.delta_t_fisica,
+            escala_tempo=self.escala_tempo,
+            max_passos_por_quadro=self.max_passos_por_quadro,
+            max_delta_t_real=self.max_delta_t_quadro,
+        )
+
         # Estado da simulação
         self.executando = True
 
@@ -48,53 +72,67 @@ class Simulacao:
 
         :param caminho_arquivo: Caminho para o arquivo JSON da cena.
         """
-        dados = carregar_dados_json(caminho_arquivo)
-
-        # Cria os corpos celestes
-        self.corpos = criar_corpos_celestes(dados["corpos"])
-
-        # Cria o foguete e o adiciona aos corpos
-        terra = next(corpo for corpo in self.corpos if corpo.nome == "Terra")
-        marte = next(corpo for corpo in self.corpos if corpo.nome == "Marte")
-        self.foguete = criar_foguete(dados["foguete"], terra, marte)
-        self.corpos.append(self.foguete)
+        self.corpos, self.foguete = carregar_cena(caminho_arquivo)
 
     def executar(self):
         """
         Método principal que executa o loop da simulação.
+
+        A física roda em passos fixos (resultado determinístico, independente da taxa de quadros),
+        em uma thread própria ou no próprio laço. O desenho lê o último instantâneo publicado
+        e interpola entre os dois últimos estados físicos.
         """
+        trabalhador = self.trabalhador_fisico
+        instantaneo = trabalhador.ler_instantaneo(trabalhador.criar_instantaneo())
+        if self.fisica_em_thread:
+            trabalhador.iniciar()
+
+        delta_t_frame = 0.0
         while self.executando:
             # Processa eventos
             self.executando = self.manipulador_entrada.processar_eventos()
 
-            # Calcula o delta_t real entre frames (em segundos)
-            delta_t_frame = self.clock.get_time() / 1000.0  # Converte de milissegundos para segundos
-            delta_t_simulacao = delta_t_frame * self.delta_t  # Escala o tempo de simulação
-
-            # Atualiza os controles
+            # Atualiza os controles a partir do último instantâneo; os comandos do foguete vão
+            # para a fila do trabalhador e são aplicados entre passos físicos
             self.manipulador_entrada.atualizar_controles(
-                self.foguete, self.camera, delta_t_frame
+                self.foguete, self.camera, delta_t_frame, instantaneo, trabalhador
             )
+            trabalhador.pausado = self.manipulador_entrada.esta_pausado()
+            trabalhador.fator_tempo = self.manipulador_entrada.fator_tempo
+
+            # Sem thread, a física avança aqui mesmo
+            if not self.fisica_em_thread:
+                trabalhador.avancar(delta_t_frame)
 
-            # Verifica se a simulação está pausada
-            if not self.manipulador_entrada.esta_pausado():
-                # Atualiza a física dos corpos
-                self.motor_fisico.atualizar_corpos(self.corpos, delta_t_simulacao)
+            # Lê o último estado completo publicado pela física
+            trabalhador.ler_instantaneo(instantaneo)
+            alfa = trabalhador.alfa(instantaneo)
+            posicoes = instantaneo.posicoes_anteriores + alfa * (instantaneo.posicoes - instantaneo.posicoes_anteriores)
 
             # Limpa a tela
             self.motor_grafico.limpar_tela()
 
             # Atualiza a câmera
-            self.camera.atualizar()
-
-            # Desenha os corpos celestes
-            self.motor_grafico.desenhar_corpos(self.corpos)
+            self.motor_grafico.aplicar_camera(self.camera)
+
+            # Desenha os corpos celestes nas posições interpoladas
+            self.motor_grafico.desenhar_corpos(
+                self.corpos,
+                posicoes,
+                instantaneo.orientacoes,
+                instantaneo.totais_rastro,
+                instantaneo.ultimos_rastro,
+                instantaneo.ancoras_rastro,
+                instantaneo.geracoes_rastro,
+            )
 
             # Atualiza a tela
             self.motor_grafico.atualizar_tela()
 
-            # Atualiza o relógio
-            self.clock.tick(self.fps)  # Mantém a taxa de quadros desejada
+            # Único tick do relógio por quadro: mantém a taxa de quadros e mede o tempo real decorrido
+            delta_t_frame = self.clock.tick(self.fps) / 1000.0  # Converte de milissegundos para segundos
+
+        trabalhador.parar()
 
         # Encerra o Pygame ao sair do loop
         pygame.quit()
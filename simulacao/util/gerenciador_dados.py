@@ -1,7 +1,14 @@
+import argparse
 import json
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 from simulacao.objetos.corpo_celeste import CorpoCeleste
 from simulacao.objetos.foguete import Foguete
+from simulacao.fisica.estado_fisico import EstadoFisico
+from simulacao.fisica.kepler import Efemerides
+
+G = 6.67430e-11  # Constante gravitacional universal (m^3 kg^-1 s^-2)
+VERSAO_CENA_BINARIA = 1
 
 def carregar_dados_json(caminho_arquivo):
     """
@@ -13,9 +20,21 @@ def carregar_dados_json(caminho_arquivo):
 def criar_corpos_celestes(dados_corpos):
     """
     Cria os objetos de CorpoCeleste a partir dos dados carregados.
+
+    Entradas com "particula_teste": true (asteroides, detritos, sondas) sofrem a gravidade
+    dos corpos massivos, mas não são usadas como fontes do campo gravitacional.
+    Entradas com parâmetros orbitais e "efemeride": true seguem a órbita kepleriana
+    analiticamente quando o motor físico usa a propagação por efemérides.
+    O rastro de cada corpo pode ser ajustado com "max_rastro", "rastro_tolerancia_angular"
+    (graus) e "rastro_tolerancia_distancia" (m); tolerâncias nulas gravam todo passo.
     """
     corpos = []
     for corpo in dados_corpos:
+        opcoes_rastro = {
+            "max_rastro": corpo.get("max_rastro", 1000),
+            "rastro_tolerancia_angular": corpo.get("rastro_tolerancia_angular", 1.0),
+            "rastro_tolerancia_distancia": corpo.get("rastro_tolerancia_distancia"),
+        }
         if "velocidade" in corpo and "posicao" in corpo:
             corpos.append(CorpoCeleste(
                 nome=corpo["nome"],
@@ -26,6 +45,8 @@ def criar_corpos_celestes(dados_corpos):
                 posicao=np.array(corpo["posicao"]),
                 velocidade=np.array(corpo["velocidade"]),
                 brilho=corpo.get("brilho", 1.0),
+                particula_teste=corpo.get("particula_teste", False),
+                **opcoes_rastro,
             ))
         else:
             corpos.append(CorpoCeleste(
@@ -39,6 +60,9 @@ def criar_corpos_celestes(dados_corpos):
                 i_deg=corpo.get("i_deg"),
                 massa_central=corpo.get("massa_central"),
                 brilho=corpo.get("brilho", 1.0),
+                particula_teste=corpo.get("particula_teste", False),
+                efemeride=corpo.get("efemeride", False),
+                **opcoes_rastro,
             ))
     return corpos
 
@@ -72,4 +96,221 @@ def criar_foguete(dados_foguete, planeta_origem, destino=None):
         consumo_combustivel=dados_foguete["consumo_combustivel"],
         combustivel_inicial=dados_foguete["combustivel_inicial"],
         destino=destino,
+        particula_teste=dados_foguete.get("particula_teste", False),
+    )
+
+def carregar_cena(caminho_arquivo: str) -> Tuple[List[CorpoCeleste], Foguete]:
+    """
+    Carrega uma cena completa: os corpos celestes e o foguete (ver _lancar_foguete).
+
+    :param caminho_arquivo: Caminho para o arquivo da cena (JSON ou binária .npz).
+    :return: Tupla com a lista de corpos (o foguete incluído por último) e o foguete.
+    """
+    if caminho_arquivo.endswith(".npz"):
+        colunas, dados_foguete = carregar_colunas_cena(caminho_arquivo)
+        corpos = [criar_corpo_de_colunas(colunas, idx) for idx in range(len(colunas["nomes"]))]
+    else:
+        dados = carregar_dados_json(caminho_arquivo)
+        corpos = criar_corpos_celestes(dados["corpos"])
+        dados_foguete = dados["foguete"]
+
+    # Cria o foguete e o adiciona aos corpos
+    foguete = _lancar_foguete(dados_foguete, corpos)
+    corpos.append(foguete)
+
+    return corpos, foguete
+
+def _lancar_foguete(dados_foguete, corpos: List[CorpoCeleste]) -> Foguete:
+    """
+    Cria o foguete da cena, lançado do corpo "origem" com destino ao corpo "destino" dos dados
+    do foguete (por padrão, da Terra a Marte). Sem o campo "destino" e sem Marte na cena, o
+    foguete fica sem destino.
+
+    :param dados_foguete: Dicionário com os dados do foguete.
+    :param corpos: Corpos celestes da cena.
+    :return: Instância de Foguete.
+    """
+    por_nome = {corpo.nome: corpo for corpo in corpos}
+
+    def buscar(nome: str) -> CorpoCeleste:
+        if nome not in por_nome:
+            raise ValueError(f"Corpo '{nome}' do foguete não existe na cena. Opções: {list(por_nome)}")
+        return por_nome[nome]
+
+    origem = buscar(dados_foguete.get("origem", "Terra"))
+    if "destino" in dados_foguete:
+        destino = buscar(dados_foguete["destino"])
+    else:
+        destino = por_nome.get("Marte")
+    return criar_foguete(dados_foguete, origem, destino)
+
+def colunas_de_corpos(dados_corpos) -> Dict[str, np.ndarray]:
+    """
+    Converte a lista de corpos de uma cena JSON em colunas (um array por campo).
+
+    Campos opcionais ausentes recebem os mesmos padrões de criar_corpos_celestes; posições e
+    velocidades de corpos dados por parâmetros orbitais, elementos de corpos dados por
+    posição e velocidade e tolerâncias de rastro nulas ficam como NaN.
+
+    :param dados_corpos: Lista de dicionários dos corpos, como em cenas/*.json.
+    :return: Dicionário de colunas com N linhas.
+    """
+    def vetor(corpo, campo):
+        return corpo[campo] if "velocidade" in corpo and "posicao" in corpo else [np.nan] * 3
+
+    def opcional(valor):
+        return np.nan if valor is None else valor
+
+    return {
+        "nomes": np.array([corpo["nome"] for corpo in dados_corpos], dtype=str),
+        "massas": np.array([corpo["massa"] for corpo in dados_corpos], dtype=float),
+        "raios": np.array([corpo["raio"] for corpo in dados_corpos], dtype=float),
+        "cores": np.array([corpo["cor"] for corpo in dados_corpos], dtype=np.uint8).reshape(-1, 3),
+        "fatores_escala": np.array([corpo.get("fator_escala", 1.0) for corpo in dados_corpos], dtype=float),
+        "brilhos": np.array([corpo.get("brilho", 1.0) for corpo in dados_corpos], dtype=float),
+        "particula_teste": np.array([corpo.get("particula_teste", False) for corpo in dados_corpos], dtype=bool),
+        "efemeride": np.array([corpo.get("efemeride", False) for corpo in dados_corpos], dtype=bool),
+        "posicoes": np.array([vetor(corpo, "posicao") for corpo in dados_corpos], dtype=float).reshape(-1, 3),
+        "velocidades": np.array([vetor(corpo, "velocidade") for corpo in dados_corpos], dtype=float).reshape(-1, 3),
+        "elementos": np.array(
+            [[opcional(corpo.get(campo)) for campo in ("a", "e", "i_deg", "massa_central")] for corpo in dados_corpos],
+            dtype=float,
+        ).reshape(-1, 4),
+        "max_rastro": np.array([corpo.get("max_rastro", 1000) for corpo in dados_corpos], dtype=np.int64),
+        "rastro_tolerancia_angular": np.array(
+            [opcional(corpo.get("rastro_tolerancia_angular", 1.0)) for corpo in dados_corpos], dtype=float
+        ),
+        "rastro_tolerancia_distancia": np.array(
+            [opcional(corpo.get("rastro_tolerancia_distancia")) for corpo in dados_corpos], dtype=float
+        ),
+    }
+
+def salvar_cena_binaria(caminho_arquivo: str, colunas: Dict[str, np.ndarray], dados_foguete) -> None:
+    """
+    Grava uma cena no formato binário colunar: um .npz sem compressão, com um array por campo
+    dos corpos (ver colunas_de_corpos) e os dados do foguete em JSON.
+
+    :param caminho_arquivo: Caminho do arquivo .npz.
+    :param colunas: Colunas dos corpos.
+    :param dados_foguete: Dicionário com os dados do foguete, como em cenas/*.json.
+    """
+    np.savez(
+        caminho_arquivo,
+        versao=np.array(VERSAO_CENA_BINARIA),
+        foguete=np.array(json.dumps(dados_foguete)),
+        **colunas,
+    )
+
+def converter_cena(caminho_json: str, caminho_saida: str) -> None:
+    """
+    Converte uma cena JSON para o formato binário colunar.
+
+    :param caminho_json: Caminho da cena JSON.
+    :param caminho_saida: Caminho do arquivo .npz gerado.
+    """
+    dados = carregar_dados_json(caminho_json)
+    salvar_cena_binaria(caminho_saida, colunas_de_corpos(dados["corpos"]), dados["foguete"])
+
+def carregar_colunas_cena(caminho_arquivo: str) -> Tuple[Dict[str, np.ndarray], dict]:
+    """
+    Lê uma cena binária, completando as posições e velocidades dos corpos dados por parâmetros orbitais.
+
+    :param caminho_arquivo: Caminho do arquivo .npz.
+    :return: Tupla (colunas dos corpos, dados do foguete).
+    """
+    with np.load(caminho_arquivo) as arquivo:
+        versao = int(arquivo["versao"])
+        if versao != VERSAO_CENA_BINARIA:
+            raise ValueError(f"Versão de cena binária não suportada: {versao}. Opções: {VERSAO_CENA_BINARIA}")
+        colunas = {campo: arquivo[campo] for campo in arquivo.files if campo not in ("versao", "foguete")}
+        dados_foguete = json.loads(str(arquivo["foguete"]))
+
+    # Estado no periélio, com a mesma convenção de CorpoCeleste.calcular_posicao_velocidade
+    orbitais = np.flatnonzero(np.isnan(colunas["posicoes"][:, 0]))
+    if len(orbitais):
+        a, e, i_deg, massa_central = colunas["elementos"][orbitais].T
+        i = np.radians(i_deg)
+        r = a * (1 - e)
+        v = np.sqrt(G * massa_central * (1 + e) / r)
+        colunas["posicoes"][orbitais] = np.stack((r, np.zeros_like(r), np.zeros_like(r)), axis=-1)
+        colunas["velocidades"][orbitais] = np.stack((np.zeros_like(v), v * np.cos(i), v * np.sin(i)), axis=-1)
+    return colunas, dados_foguete
+
+def criar_corpo_de_colunas(colunas: Dict[str, np.ndarray], idx: int) -> CorpoCeleste:
+    """
+    Cria o CorpoCeleste da linha `idx` das colunas de uma cena binária.
+    """
+    def opcional(valor):
+        return None if np.isnan(valor) else float(valor)
+
+    opcoes = {
+        "nome": str(colunas["nomes"][idx]),
+        "massa": float(colunas["massas"][idx]),
+        "raio": float(colunas["raios"][idx]),
+        "cor": tuple(int(canal) for canal in colunas["cores"][idx]),
+        "fator_escala": float(colunas["fatores_escala"][idx]),
+        "brilho": float(colunas["brilhos"][idx]),
+        "particula_teste": bool(colunas["particula_teste"][idx]),
+        "max_rastro": int(colunas["max_rastro"][idx]),
+        "rastro_tolerancia_angular": opcional(colunas["rastro_tolerancia_angular"][idx]),
+        "rastro_tolerancia_distancia": opcional(colunas["rastro_tolerancia_distancia"][idx]),
+    }
+    if bool(colunas["efemeride"][idx]):
+        a, e, i_deg, massa_central = (float(valor) for valor in colunas["elementos"][idx])
+        return CorpoCeleste(a=a, e=e, i_deg=i_deg, massa_central=massa_central, efemeride=True, **opcoes)
+    corpo = CorpoCeleste(
+        posicao=colunas["posicoes"][idx].copy(), velocidade=colunas["velocidades"][idx].copy(), **opcoes
+    )
+    if not np.isnan(colunas["elementos"][idx, 0]):
+        corpo.elementos_orbitais = tuple(float(valor) for valor in colunas["elementos"][idx])
+    return corpo
+
+def carregar_estado_binario(caminho_arquivo: str) -> Tuple[EstadoFisico, Foguete]:
+    """
+    Carrega uma cena binária diretamente em um EstadoFisico, sem criar objetos para as partículas de teste.
+
+    Os corpos que geram gravidade e o foguete viram objetos (nas primeiras linhas do estado);
+    as partículas de teste (asteroides, detritos) existem só nos arrays do estado, montados
+    de uma vez a partir das colunas, e por isso não têm rastro. Use MotorFisico.adotar_estado
+    e passe estado.corpos ao motor.
+
+    :param caminho_arquivo: Caminho do arquivo .npz.
+    :return: Tupla (estado físico, foguete).
+    """
+    colunas, dados_foguete = carregar_colunas_cena(caminho_arquivo)
+    particulas = colunas["particula_teste"]
+    linhas_objetos = np.flatnonzero(~particulas)
+    corpos = [criar_corpo_de_colunas(colunas, idx) for idx in linhas_objetos]
+    foguete = _lancar_foguete(dados_foguete, corpos)
+    corpos.append(foguete)
+
+    # Objetos e foguete primeiro; depois as partículas, na ordem do arquivo
+    linhas_particulas = np.flatnonzero(particulas)
+
+    def montar(coluna: np.ndarray, valor_foguete) -> np.ndarray:
+        return np.concatenate((coluna[linhas_objetos], [valor_foguete], coluna[linhas_particulas]))
+
+    estado = EstadoFisico(
+        posicoes=montar(colunas["posicoes"], foguete.posicao),
+        velocidades=montar(colunas["velocidades"], foguete.velocidade),
+        massas=montar(colunas["massas"], foguete.massa),
     )
+    estado.nomes = montar(colunas["nomes"], foguete.nome)
+    estado.indices_fontes = np.flatnonzero(~montar(particulas, foguete.particula_teste) & (estado.massas > 0))
+    efemeride = montar(colunas["efemeride"], False)
+    estado.indices_efemeride = np.flatnonzero(efemeride)
+    if len(estado.indices_efemeride):
+        estado.efemerides = Efemerides(*montar(colunas["elementos"], np.full(4, np.nan))[efemeride].T)
+
+    estado.vincular_corpos(corpos)
+    return estado, foguete
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Converte uma cena JSON para o formato binário colunar (.npz).")
+    parser.add_argument("cena", help="Arquivo JSON da cena.")
+    parser.add_argument("saida", help="Arquivo .npz gerado.")
+    args = parser.parse_args(argv)
+    converter_cena(args.cena, args.saida)
+
+if __name__ == "__main__":
+    main()